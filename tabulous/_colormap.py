@@ -1,9 +1,15 @@
 from __future__ import annotations
-from typing import Iterable, TYPE_CHECKING, Union
+from typing import Any, Callable, Iterable, TYPE_CHECKING, Union
 import numpy as np
-from tabulous.color import ColorTuple, normalize_color
-from tabulous.types import ColorType
-from tabulous._dtype import isna, get_converter
+from tabulous.color import ColorTuple, normalize_color, map_rgba_array
+from tabulous.types import ColorType, ColorMapping
+from tabulous._dtype import (
+    isna,
+    isna_array,
+    get_converter,
+    get_dtype,
+    parse_string_column,
+)
 
 if TYPE_CHECKING:
     from pandas.core.dtypes.dtypes import CategoricalDtype
@@ -89,59 +95,170 @@ def _where(x, border: Iterable[float]) -> int:
     return len(border) - 1
 
 
-def segment_by_float(maps: list[tuple[float, ColorType]]):
-    converter = get_converter(np.dtype("f"))
-    borders: list[float] = []
-    colors: list[ColorTuple] = []
-    for v, c in maps:
-        borders.append(v)
-        colors.append(normalize_color(c))
-    idx_max = len(borders) - 1
+class SegmentedColormap:
+    """
+    Colormap that linearly interpolates colors between the borders.
 
-    # check is sorted
-    if not all(borders[i] <= borders[i + 1] for i in range(len(borders) - 1)):
-        raise ValueError("Borders must be sorted")
+    Parameters
+    ----------
+    maps : list of (value, color)
+        Border values and the colors at the borders.
+    dtype : dtype-like, default is float
+        Data type of the values to be mapped. Must be number, datetime or timedelta.
+    """
 
-    def _colormap(value: float) -> _ColorType:
+    def __init__(self, maps: Iterable[tuple[Any, ColorType]], dtype: Any = "f"):
+        self._dtype = get_dtype(dtype)
+        self._converter = get_converter(self._dtype)
+        borders: list[Any] = []
+        colors: list[ColorTuple] = []
+        for v, c in maps:
+            borders.append(v)
+            colors.append(normalize_color(c))
+
+        # check is sorted
+        if not all(borders[i] <= borders[i + 1] for i in range(len(borders) - 1)):
+            raise ValueError("Borders must be sorted")
+
+        self._borders = borders
+        self._colors = colors
+        self._is_time = self._dtype.kind in "mM"
+        if self._is_time:
+            self._border_values = [b.value for b in borders]
+        else:
+            self._border_values = borders
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{len(self._borders)} borders>"
+
+    def __call__(self, value: Any) -> _ColorType:
         if isna(value):
             return None
-        value = converter(value)
-        idx = _where(value, borders)
-        if idx == -1 or idx == idx_max:
-            return colors[idx]
-        min_color = np.array(colors[idx], dtype=np.float64)
-        max_color = np.array(colors[idx + 1], dtype=np.float64)
-        min = borders[idx]
-        max = borders[idx + 1]
+        value = self._converter(value)
+        if self._is_time:
+            value = value.value
+        idx = _where(value, self._border_values)
+        if idx == -1 or idx == len(self._borders) - 1:
+            return self._colors[idx]
+        min_color = np.array(self._colors[idx], dtype=np.float64)
+        max_color = np.array(self._colors[idx + 1], dtype=np.float64)
+        min = self._border_values[idx]
+        max = self._border_values[idx + 1]
         return (value - min) / (max - min) * (max_color - min_color) + min_color
 
-    return _colormap
+    def map_array(self, values: pd.Series) -> np.ndarray:
+        """Map all the values to a (N, 4) array of RGBA colors."""
+        if self._is_time:
+            x = _as_time_array(values, self._dtype)
+        else:
+            x = _as_float_array(values)
+        borders = np.asarray(self._border_values)
+        colors = np.array(self._colors, dtype=np.float64)
+        # same as `_where`
+        idx = np.searchsorted(borders, x, side="right") - 1
+        out = colors[idx]
+        inner = (idx != -1) & (idx != len(borders) - 1)
+        i0 = idx[inner]
+        ratio = (x[inner] - borders[i0]) / (borders[i0 + 1] - borders[i0])
+        out[inner] = ratio[:, np.newaxis] * (colors[i0 + 1] - colors[i0]) + colors[i0]
+        out[isna_array(values)] = np.nan
+        return out
+
+
+class ScaledColormap:
+    """
+    Colormap that maps values between (vmin, vmax) to a matplotlib colormap.
+
+    Parameters
+    ----------
+    cmap : matplotlib colormap
+        Colormap that maps 8-bit integers to RGBA colors in [0, 1].
+    vmin, vmax : Any
+        Color limits.
+    dtype : dtype-like
+        Data type of the values to be mapped.
+    """
+
+    def __init__(self, cmap: Callable[[Any], Any], vmin: Any, vmax: Any, dtype: Any):
+        self._cmap = cmap
+        self._dtype = get_dtype(dtype)
+        self._converter = get_converter(self._dtype)
+        kind = self._dtype.kind
+        if kind in "mM":
+            vmin, vmax = vmin.value, vmax.value
+        elif kind not in "uifb":
+            raise TypeError(f"Cannot infer colormap for dtype {self._dtype}")
+        self._vmin = vmin
+        self._vmax = vmax
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self._cmap!r}>"
+
+    def _to_rgba(self, ratio):
+        return np.asarray(self._cmap(ratio)) * 255
+
+    def __call__(self, x: Any) -> _ColorType:
+        kind = self._dtype.kind
+        if kind == "b":
+            return self._to_rgba(int(self._converter(x) * 255))
+        if kind in "mM":
+            x = self._converter(x).value
+        else:
+            x = float(x)
+            if isna(x):
+                return None
+        ratio = (x - self._vmin) / (self._vmax - self._vmin)
+        ratio = max(0.0, min(1.0, ratio))
+        return self._to_rgba(int(ratio * 255))
+
+    def map_array(self, values: pd.Series) -> np.ndarray:
+        """Map all the values to a (N, 4) array of RGBA colors."""
+        kind = self._dtype.kind
+        if kind == "b":
+            ratio = _as_float_array(values, bool)
+        else:
+            if kind in "mM":
+                x = _as_time_array(values, self._dtype)
+            else:
+                x = _as_float_array(values)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = (x - self._vmin) / (self._vmax - self._vmin)
+            # NOTE: fmin/fmax returns the non-NaN value, same as builtin min/max
+            ratio = np.fmax(0.0, np.fmin(1.0, ratio))
+        na = isna_array(values)
+        out = self._to_rgba(np.where(na, 0, ratio * 255).astype(np.int64))
+        out[na] = np.nan
+        return out
+
+
+def segment_by_float(maps: list[tuple[float, ColorType]]) -> SegmentedColormap:
+    return SegmentedColormap(maps, np.dtype("f"))
 
 
 def segment_by_time(maps: list[tuple[_TimeLike, ColorType]], dtype):
-    converter = get_converter(dtype)
-    borders: list[_TimeLike] = []
-    colors: list[ColorTuple] = []
-    for v, c in maps:
-        borders.append(v)
-        colors.append(normalize_color(c))
-    idx_max = len(borders) - 1
-
-    # check is sorted
-    if not all(borders[i] <= borders[i + 1] for i in range(len(borders) - 1)):
-        raise ValueError("Borders must be sorted")
-
-    def _colormap(value: _TimeLike) -> _ColorType:
-        if isna(value):
-            return None
-        value = converter(value)
-        idx = _where(value, borders)
-        if idx == -1 or idx == idx_max:
-            return colors[idx]
-        min_color = np.array(colors[idx], dtype=np.float64)
-        max_color = np.array(colors[idx + 1], dtype=np.float64)
-        min = borders[idx].value
-        max = borders[idx + 1].value
-        return (value.value - min) / (max - min) * (max_color - min_color) + min_color
-
-    return _colormap
+    return SegmentedColormap(maps, dtype)
+
+
+def map_colors(cmap: ColorMapping, values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Map values to a (N, 4) uint8 array of RGBA colors and the mask of colored."""
+    rgba = map_rgba_array(cmap, values)
+    valid = ~np.isnan(rgba).any(axis=1)
+    out = np.zeros((len(values), 4), dtype=np.uint8)
+    out[valid] = np.clip(np.trunc(rgba[valid]), 0, 255)
+    return out, valid
+
+
+def _as_float_array(values: pd.Series, dtype: Any = np.float64) -> np.ndarray:
+    """Convert values to a float array, parsing strings as `dtype` if needed."""
+    if values.dtype.kind not in "biuf":
+        values = parse_string_column(values.astype("string"), np.dtype(dtype))
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _as_time_array(values: pd.Series, dtype: np.dtype) -> np.ndarray:
+    """Convert values to an int64 array of nanoseconds."""
+    if values.dtype.kind != dtype.kind:
+        values = parse_string_column(
+            values.astype("string"), np.dtype(f"{dtype.kind}8[ns]")
+        )
+    return values.array.asi8
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Iterable, NamedTuple, Sequence, Tuple
+import numpy as np
+
+_TileIndex = Tuple[int, int]
+
+# approximate size of a str object (ASCII) plus the pointer to it
+_STR_OVERHEAD = 57
+
+
+class DisplayTextCache:
+    """
+    LRU cache of the display texts of a table model.
+
+    Texts are stored in tiles of shape ``tile_shape``. When a cell of a tile that
+    is not cached is requested, all the cells in the tile are formatted at once by
+    the ``formatter`` function, column by column. Least recently used tiles are
+    discarded when the total size exceeds ``max_bytes``.
+
+    Parameters
+    ----------
+    formatter : callable
+        Function that formats cells of ``(rows, columns)`` and returns a list of
+        formatted text sequences, each of which corresponds to a column.
+    tile_shape : (int, int)
+        Number of rows and columns of a tile.
+    max_bytes : int or callable
+        Maximum size of the cache in bytes. If a callable is given, it will be
+        called every time a new tile is added.
+    """
+
+    def __init__(
+        self,
+        formatter: Callable[[slice, slice], list[Sequence[str]]],
+        tile_shape: tuple[int, int] = (256, 32),
+        max_bytes: int | Callable[[], int] = 32 * 2**20,
+    ):
+        self._formatter = formatter
+        self._tile_shape = tile_shape
+        self._max_bytes = max_bytes
+        self._tiles: OrderedDict[_TileIndex, list[Sequence[str]]] = OrderedDict()
+        self._tile_bytes: dict[_TileIndex, int] = {}
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        """Number of cached tiles."""
+        return len(self._tiles)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of cached texts in bytes."""
+        return self._nbytes
+
+    def get(self, r: int, c: int) -> str:
+        """Get the display text at (r, c)."""
+        nr, nc = self._tile_shape
+        key = (r // nr, c // nc)
+        tile = self._tiles.get(key, None)
+        if tile is None:
+            tile = self._add_tile(key)
+        else:
+            self._tiles.move_to_end(key)
+        return tile[c - key[1] * nc][r - key[0] * nr]
+
+    def clear(self) -> None:
+        """Clear all the cached texts."""
+        self._tiles.clear()
+        self._tile_bytes.clear()
+        self._nbytes = 0
+        return None
+
+    def invalidate_columns(self, columns: Iterable[int]) -> None:
+        """Discard the tiles that contain any of the columns."""
+        nc = self._tile_shape[1]
+        tile_columns = {c // nc for c in columns}
+        for key in [key for key in self._tiles if key[1] in tile_columns]:
+            del self._tiles[key]
+            self._nbytes -= self._tile_bytes.pop(key)
+        return None
+
+    def _add_tile(self, key: _TileIndex) -> list[Sequence[str]]:
+        nr, nc = self._tile_shape
+        r0, c0 = key[0] * nr, key[1] * nc
+        tile = self._formatter(slice(r0, r0 + nr), slice(c0, c0 + nc))
+        nbytes = sum(
+            sum(map(len, texts)) + _STR_OVERHEAD * len(texts) for texts in tile
+        )
+        if callable(self._max_bytes):
+            max_bytes = self._max_bytes()
+        else:
+            max_bytes = self._max_bytes
+
+        # discard least recently used tiles
+        while self._tiles and self._nbytes + nbytes > max_bytes:
+            old_key, _ = self._tiles.popitem(last=False)
+            self._nbytes -= self._tile_bytes.pop(old_key)
+
+        self._tiles[key] = tile
+        self._tile_bytes[key] = nbytes
+        self._nbytes += nbytes
+        return tile
+
+
+class _ColumnColors(NamedTuple):
+    rgba: np.ndarray  # (N, 4) uint8 array
+    colored: np.ndarray  # (N,) bool array
+    computed: np.ndarray  # bool array of chunks
+
+
+class ColumnColorCache:
+    """
+    Cache of the cell colors of a table model.
+
+    Colors of a column are stored in a (N, 4) uint8 RGBA array. They are computed
+    by the ``mapper`` function chunk by chunk, when a cell of the chunk is requested
+    for the first time.
+
+    Parameters
+    ----------
+    mapper : callable
+        Function that maps cells of ``(c, rows)`` to a (N, 4) uint8 RGBA array and a
+        boolean array of whether each cell is colored.
+    nrows : callable
+        Function that returns the current number of rows.
+    chunk_size : int
+        Number of rows that are mapped at once.
+    """
+
+    def __init__(
+        self,
+        mapper: Callable[[int, slice], tuple[np.ndarray, np.ndarray]],
+        nrows: Callable[[], int],
+        chunk_size: int = 1024,
+    ):
+        self._mapper = mapper
+        self._nrows = nrows
+        self._chunk_size = chunk_size
+        self._columns: dict[int, _ColumnColors] = {}
+
+    def __len__(self) -> int:
+        """Number of cached columns."""
+        return len(self._columns)
+
+    def get(self, r: int, c: int) -> tuple[int, int, int, int] | None:
+        """Get the color at (r, c) or None if the cell is not colored."""
+        nrows = self._nrows()
+        colors = self._columns.get(c, None)
+        if colors is None or colors.colored.size != nrows:
+            nchunks = -(-nrows // self._chunk_size)
+            colors = self._columns[c] = _ColumnColors(
+                np.zeros((nrows, 4), dtype=np.uint8),
+                np.zeros(nrows, dtype=np.bool_),
+                np.zeros(nchunks, dtype=np.bool_),
+            )
+        ichunk = r // self._chunk_size
+        if not colors.computed[ichunk]:
+            start = ichunk * self._chunk_size
+            rows = slice(start, min(start + self._chunk_size, nrows))
+            colors.rgba[rows], colors.colored[rows] = self._mapper(c, rows)
+            colors.computed[ichunk] = True
+        if colors.colored[r]:
+            return tuple(colors.rgba[r].tolist())
+        return None
+
+    def invalidate_columns(self, columns: Iterable[int]) -> None:
+        """Discard the cached colors of the columns."""
+        for c in columns:
+            self._columns.pop(c, None)
+        return None
+
+    def clear(self) -> None:
+        """Clear all the cached colors."""
+        self._columns.clear()
+        return None
@@ -162,6 +162,111 @@ def get_converter_from_type(tp: type | str) -> Callable[[Any], Any]:
     return _DTYPE_CONVERTER[kind]
 
 
+# dtypes used to convert values as ``int(x)``, ``float(x)`` and ``complex(x)`` do.
+_NUMBER_BASE_DTYPE = {
+    "i": np.dtype(np.int64),
+    "u": np.dtype(np.int64),
+    "f": np.dtype(np.float64),
+    "c": np.dtype(np.complex128),
+}
+
+
+def _to_number_array(values: pd.Series, dtype: np.dtype) -> pd.Series:
+    """Convert values to numbers of ``dtype`` in the same way as the converters."""
+    _kind = dtype.kind
+    arr = values.to_numpy(dtype=object)
+    if _kind in "fc":
+        arr[values.isin(list(_NAN_STRINGS)).to_numpy()] = np.nan
+    if (arr == None).any():  # noqa: E711
+        # numpy converts None into nan but float(None) raises.
+        raise TypeError(f"Cannot convert None to {dtype}.")
+    out = arr.astype(_NUMBER_BASE_DTYPE[_kind])
+    if out.dtype != dtype:
+        # keep the dtype of the column if values are not changed
+        _out = out.astype(dtype)
+        if np.array_equal(_out, out, equal_nan=_kind in "fc"):
+            out = _out
+    return pd.Series(out, index=values.index)
+
+
+def _map_array(converter: Callable[[Any], Any]) -> Callable[[pd.Series], pd.Series]:
+    """Make a column converter from a scalar converter."""
+
+    def _converter(values: pd.Series) -> pd.Series:
+        out = [converter(val) for val in values.tolist()]
+        return pd.Series(out, index=values.index, dtype=object)
+
+    return _converter
+
+
+_DTYPE_ARRAY_CONVERTER: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "b": _map_array(_bool_converter),
+    "U": _map_array(str),
+    "M": pd.to_datetime,
+    "m": pd.to_timedelta,
+}
+
+
+def _IDENTITY_ARRAY_CONVERTER(values: pd.Series) -> pd.Series:
+    return values
+
+
+def get_array_converter(dtype: _DTypeLike | str) -> Callable[[pd.Series], pd.Series]:
+    """
+    Get a column converter function for the given dtype.
+
+    The returned function converts all the values of a series at once. It raises an
+    exception if any of the values cannot be converted.
+    """
+    _dtype = get_dtype(dtype)
+    _kind = _dtype.kind
+    if _kind in _NUMBER_BASE_DTYPE:
+        return partial(_to_number_array, dtype=_dtype)
+    elif _kind != "O":
+        return _DTYPE_ARRAY_CONVERTER[_kind]
+    if isinstance(_dtype, pd.CategoricalDtype):
+        return get_array_converter(_dtype.categories.dtype)
+    converter = get_converter(_dtype)
+    if converter is _IDENTITY_CONVERTER:
+        return _IDENTITY_ARRAY_CONVERTER
+    return _map_array(converter)
+
+
+def convert_array(
+    values: pd.Series,
+    array_converter: Callable[[pd.Series], pd.Series],
+    converter: Callable[[Any], Any],
+) -> tuple[pd.Series, dict[int, Exception]]:
+    """
+    Convert values of a series and collect all the conversion errors.
+
+    ``array_converter`` is tried first. If it failed, ``converter`` is called for
+    each value to find which values are invalid.
+
+    Returns
+    -------
+    (pd.Series, dict[int, Exception])
+        Converted series and the map from positions of invalid values to the
+        raised exceptions. Invalid values are left as is in the returned series.
+    """
+    try:
+        out = array_converter(values)
+    except Exception:
+        pass
+    else:
+        if len(out) == len(values):
+            return out, {}
+    converted: list[Any] = []
+    errors: dict[int, Exception] = {}
+    for i, val in enumerate(values.tolist()):
+        try:
+            converted.append(converter(val))
+        except Exception as e:
+            converted.append(val)
+            errors[i] = e
+    return pd.Series(converted, index=values.index, dtype=object), errors
+
+
 class DefaultValidator:
     """
     The default validator function.
@@ -178,6 +283,12 @@ class DefaultValidator:
         self._converter(value)
         return None
 
+    def validate_array(self, values: pd.Series) -> None:
+        """Validate all the values at once."""
+        if self._dtype.kind in _DTYPE_CONVERTER:
+            get_array_converter(self._dtype)(values)
+        return None
+
     def __repr__(self) -> str:
         return f"DefaultValidator[{self._dtype.name}]"
 
@@ -356,6 +467,21 @@ class DTypeMap(MutableMapping[_K, _V]):
             kwargs.pop("infer_datetime_format", None)
         return kwargs
 
+    def parse_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert a string data frame into a data frame with the optimal dtypes.
+
+        Each column is parsed independently by ``parse_string_column``, without
+        serializing the data into a text buffer.
+        """
+        arrays = {
+            i: parse_string_column(data.iloc[:, i], self.get(key, None))
+            for i, key in enumerate(data.columns)
+        }
+        out = pd.DataFrame(arrays, index=data.index)
+        out.columns = data.columns
+        return out
+
     def try_convert(self, key: _K, value: Any) -> Any:
         """Convert value according to the dtype, if registered."""
         if dtype := self.get(key, None):
@@ -380,3 +506,107 @@ def isna(val: Any) -> bool:
     except Exception:
         # some data types, such as unhashable types, raises error.
         return False
+
+
+def isna_array(values: pd.Series) -> np.ndarray:
+    """Vectorized version of ``isna``."""
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind != "O":
+        # numpy scalars are never considered as NA
+        return np.zeros(len(values), dtype=bool)
+    return np.fromiter(map(isna, values.array), dtype=bool, count=len(values))
+
+
+# NA strings recognized by ``pd.read_csv`` plus the error marker of spreadsheets.
+_PARSE_NA_VALUES = frozenset(
+    {
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+        "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "n/a", "nan",
+        "null", "#ERROR",
+    }
+)  # fmt: skip
+_TRUE_VALUES = frozenset({"True", "TRUE", "true"})
+_FALSE_VALUES = frozenset({"False", "FALSE", "false"})
+
+
+def parse_string_column(sr: pd.Series, dtype: _DTypeLike | None = None) -> pd.Series:
+    """
+    Parse a string series into a series of the optimal dtype.
+
+    The result is equivalent to what ``pd.read_csv`` returns for the same column,
+    but the conversion is done directly on the array.
+
+    Parameters
+    ----------
+    sr : pd.Series
+        Series of "string" dtype. Missing values must be filled with "".
+    dtype : dtype-like, optional
+        If given, the series will be converted to this dtype. Otherwise, dtype
+        will be inferred.
+    """
+    if sr.dtype == object:
+        values = sr.to_numpy(copy=True)
+    else:
+        values = sr.to_numpy(dtype=object, na_value="")
+    na_mask = sr.isin(_PARSE_NA_VALUES).to_numpy()
+    if dtype is None:
+        out = _infer_and_parse(values, na_mask)
+    else:
+        out = _parse_as(values, na_mask, get_dtype(dtype))
+    return pd.Series(out, index=sr.index, name=sr.name)
+
+
+def _infer_and_parse(values: np.ndarray, na_mask: np.ndarray):
+    if values.size == 0:
+        return values
+    values[na_mask] = np.nan
+    if na_mask.all():
+        return np.full(values.size, np.nan)
+    try:
+        return pd.to_numeric(values)
+    except (ValueError, TypeError):
+        pass
+    valid = values[~na_mask]
+    if valid[0] not in _TRUE_VALUES and valid[0] not in _FALSE_VALUES:
+        return values  # not a bool column, no need to check all the values
+    is_true, is_false = _as_bool_masks(valid)
+    if np.all(is_true | is_false):
+        if valid.size == values.size:
+            return is_true
+        values[~na_mask] = is_true
+    return values
+
+
+def _as_bool_masks(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    sr = pd.Series(values, dtype=object)
+    return sr.isin(_TRUE_VALUES).to_numpy(), sr.isin(_FALSE_VALUES).to_numpy()
+
+
+def _parse_as(values: np.ndarray, na_mask: np.ndarray, dtype: _DTypeLike):
+    kind = dtype.kind
+    if kind in "iuf":
+        values[na_mask] = np.nan
+        return pd.to_numeric(values).astype(dtype, copy=False)
+    elif kind == "b":
+        if na_mask.any():
+            raise ValueError("Bool column has NA values.")
+        is_true, is_false = _as_bool_masks(values)
+        if not np.all(is_true | is_false):
+            raise ValueError("Cannot convert values to bool.")
+        return is_true
+    elif kind == "M":
+        values[na_mask] = np.nan
+        try:
+            return pd.to_datetime(values)
+        except (ValueError, TypeError):
+            # same as pd.read_csv, unparsable datetime column is kept as is.
+            return values
+    elif kind == "m":
+        values[na_mask] = np.nan
+        return pd.to_timedelta(values)
+    elif kind == "c" or dtype == "interval" or dtype == "period":
+        values[na_mask] = ""
+        converter = get_converter(dtype)
+        return pd.Series([converter(v) for v in values]).to_numpy()
+    else:
+        values[na_mask] = np.nan
+        return pd.Series(values, dtype=object).astype(dtype, copy=False)
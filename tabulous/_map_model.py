@@ -13,8 +13,9 @@ from typing import (
 from psygnal import Signal
 import logging
 import weakref
-from tabulous._range import TableAnchorBase
+from tabulous._range import TableAnchorBase, RectRange
 from tabulous._psygnal import InCellRangedSlot
+from tabulous._psygnal._slot_index import SlotRangeIndex
 
 if TYPE_CHECKING:
     from tabulous.widgets import TableBase
@@ -121,77 +122,126 @@ class TableMapping(MutableMapping[Index, _V], TableAnchorBase):
 
 
 class SlotRefMapping(MutableMapping[Index, InCellRangedSlot], TableAnchorBase):
+    """
+    Mapping from source positions to in-cell slots connected to the table.
+
+    Slots are cached in a dict keyed by their source positions and in an index of
+    their last destinations. The cache is rebuilt from the connected slots when they
+    are changed outside of this mapping, such as by the table shape changes.
+    """
+
     def __init__(self, table: TableBase) -> None:
         self._table_ref = weakref.ref(table)
         self._locked_pos = None
+        self._slots: dict[Index, InCellRangedSlot] = {}
+        self._orders: dict[int, int] = {}  # id of slot -> order of connection
+        self._dest_index = SlotRangeIndex()
+        self._count = 0
+        self._version = -1  # version of the signal slots that the cache is based on
 
     def table(self) -> TableBase:
         if table := self._table_ref():
             return table
         raise RuntimeError("Table has been deleted")
 
+    def _get_slots(self) -> dict[Index, InCellRangedSlot]:
+        """Get the dict of slots, rebuilt if connected slots are changed."""
+        data = self.table().events.data
+        if self._version != data.slots_version:
+            self._slots.clear()
+            self._orders.clear()
+            self._dest_index.clear()
+            for slot in data.iter_slots():
+                if isinstance(slot, InCellRangedSlot):
+                    self._register(slot)
+            self._version = data.slots_version
+        return self._slots
+
+    def _register(self, slot: InCellRangedSlot) -> None:
+        self._slots.setdefault(Index(*slot.source_pos), slot)
+        self._orders[id(slot)] = self._count
+        self._count += 1
+        self._update_dest_index(slot)
+        return None
+
+    def _unregister(self, slot: InCellRangedSlot) -> None:
+        key = Index(*slot.source_pos)
+        if self._slots.get(key) is slot:
+            del self._slots[key]
+        self._orders.pop(id(slot), None)
+        self._dest_index.discard(slot)
+        return None
+
+    def _update_dest_index(self, slot: InCellRangedSlot) -> None:
+        self._dest_index.discard(slot)
+        if dest := slot.last_destination:
+            order = self._orders[id(slot)]
+            self._dest_index.add(slot, RectRange(*dest), order=order)
+        return None
+
+    def update_destination(self, slot: InCellRangedSlot) -> None:
+        """Update the index after the last destination of the slot changed."""
+        if id(slot) in self._orders:
+            self._update_dest_index(slot)
+        return None
+
     def __getitem__(self, source_key: Index) -> InCellRangedSlot:
-        for slot in self.table().events.data.iter_slots():
-            if not isinstance(slot, InCellRangedSlot):
-                continue
-            if slot.source_pos == source_key:
-                return slot
-        raise KeyError(source_key)
+        return self._get_slots()[source_key]
 
     def get_by_dest(self, source_key: Index, default=None) -> InCellRangedSlot:
-        for slot in self.table().events.data.iter_slots():
-            if not isinstance(slot, InCellRangedSlot):
-                continue
-            if slot.source_pos == source_key:
-                return slot
-            dest = slot.last_destination
-            if dest is not None:
-                rsl, csl = dest
-                r, c = source_key
-                if rsl.start <= r < rsl.stop and csl.start <= c < csl.stop:
-                    return slot
-        return default
+        slots = self._get_slots()
+        r, c = source_key
+        found = [
+            slot
+            for slot in self._dest_index.query(RectRange.new(r, c))
+            if (dest := slot.last_destination) is not None
+            and dest[0].start <= r < dest[0].stop
+            and dest[1].start <= c < dest[1].stop
+        ]
+        if slot := slots.get(source_key):
+            found.append(slot)
+        if not found:
+            return default
+        return min(found, key=lambda slot: self._orders[id(slot)])
 
     def __setitem__(self, key: Index, slot: InCellRangedSlot) -> None:
         if self._locked_pos == key:
             return
         if self.pop(key, None):
             logger.debug(f"Overwriting slot at {key}")
-        self.table().events.data.connect_cell_slot(slot)
+        data = self.table().events.data
+        self._get_slots()
+        data.connect_cell_slot(slot)
+        self._register(slot)
+        self._version = data.slots_version
         logger.debug(f"Connecting slot at {key}")
 
     def __delitem__(self, source_key: Index) -> None:
         if self._locked_pos == source_key:
             return
         slot = self[source_key]
-        self.table().events.data.disconnect(slot)
+        self._remove_multiple([slot])
         logger.debug(f"Deleting slot at {source_key}")
 
     def _remove_multiple(self, slots: Iterable[InCellRangedSlot]):
         data = self.table().events.data
+        self._get_slots()
         for slot in slots:
             data.disconnect(slot)
+            self._unregister(slot)
+        self._version = data.slots_version
 
     def __iter__(self) -> Iterator[Index]:
-        for slot in self.table().events.data.iter_slots():
-            if not isinstance(slot, InCellRangedSlot):
-                continue
-            yield Index(*slot.source_pos)
+        return iter(list(self._get_slots().keys()))
 
     def values(self):
-        for slot in self.table().events.data.iter_slots():
-            if not isinstance(slot, InCellRangedSlot):
-                continue
-            yield slot
+        return iter(list(self._get_slots().values()))
 
     def items(self):
-        for slot in self.table().events.data.iter_slots():
-            if not isinstance(slot, InCellRangedSlot):
-                continue
-            yield Index(*slot.source_pos), slot
+        return iter(list(self._get_slots().items()))
 
     def __len__(self) -> int:
-        return len([i for i in self])
+        return len(self._get_slots())
 
     @contextmanager
     def lock_pos(self, pos: Index):
@@ -204,9 +254,11 @@ class SlotRefMapping(MutableMapping[Index, InCellRangedSlot], TableAnchorBase):
 
     def insert_rows(self, row: int, count: int):
         """Insert rows and update indices."""
+        self._version = -1
 
     def insert_columns(self, col: int, count: int):
         """Insert columns and update indices."""
+        self._version = -1
 
     def remove_rows(self, row: int, count: int):
         """Remove items that are in the given row range."""
@@ -214,9 +266,10 @@ class SlotRefMapping(MutableMapping[Index, InCellRangedSlot], TableAnchorBase):
         stop = row + count
         rem = []
         for idx, slot in self.items():
-            if start <= idx.column < stop:
+            if start <= idx.row < stop:
                 rem.append(slot)
         self._remove_multiple(rem)
+        self._version = -1
         return None
 
     def remove_columns(self, col: int, count: int):
@@ -228,6 +281,7 @@ class SlotRefMapping(MutableMapping[Index, InCellRangedSlot], TableAnchorBase):
             if start <= idx.column < stop:
                 rem.append(slot)
         self._remove_multiple(rem)
+        self._version = -1
         return None
 
 
@@ -253,6 +307,9 @@ class DummySlotRefMapping(MutableMapping[Index, Any], TableAnchorBase):
     def __len__(self) -> int:
         return 0
 
+    def update_destination(self, slot: InCellRangedSlot) -> None:
+        """Update the index after the last destination of the slot changed."""
+
     @contextmanager
     def lock_pos(self, pos: Index):
         yield
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import re
+import threading
+from typing import Any, TYPE_CHECKING
+import weakref
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from tabulous.types import _IntArray
+
+__all__ = ["TrigramIndex", "is_literal"]
+
+_N = 3
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+# rough memory usage of a python string and a dict entry
+_BYTES_PER_UNIQUE = 64
+_BYTES_PER_GRAM = 128
+
+
+def is_literal(pattern: Any) -> bool:
+    """True if the pattern does not contain any regular expression syntax."""
+    return isinstance(pattern, str) and _REGEX_META.search(pattern) is None
+
+
+def _iter_grams(s: str) -> set[str]:
+    return {s[i : i + _N] for i in range(len(s) - _N + 1)}
+
+
+class TrigramIndex:
+    """
+    Trigram index of a string column for substring search.
+
+    Rows are factorized into unique values. Each trigram has the sorted array of the
+    unique values that contain it, so that only the candidate unique values have to
+    be verified for a query.
+    """
+
+    def __init__(self, name, codes: _IntArray, uniques: list):
+        self._name = name
+        self._codes = codes
+        self._uniques = uniques
+        self._lookup = {value: i for i, value in enumerate(uniques)}
+        self._postings: dict[str, _IntArray] | None = _build_postings(uniques)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        cname = type(self).__name__
+        return f"{cname}<name={self._name!r}, nunique={len(self._uniques)}>"
+
+    @classmethod
+    def from_series(cls, name, series: pd.Series) -> TrigramIndex:
+        """Build the index of a string column."""
+        import pandas as pd
+
+        codes, uniques = pd.factorize(series)
+        self = cls(name, np.asarray(codes, dtype=np.intp), list(uniques))
+        _REGISTRY.register(self)
+        return self
+
+    @classmethod
+    def build_async(cls, name, series: pd.Series) -> Future[TrigramIndex]:
+        """Build the index in the background thread."""
+        return _EXECUTOR.submit(cls.from_series, name, series)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory usage of the index."""
+        if self._postings is None:
+            return 0
+        out = self._codes.nbytes + len(self._uniques) * _BYTES_PER_UNIQUE
+        for arr in self._postings.values():
+            out += arr.nbytes + _BYTES_PER_GRAM
+        return out
+
+    def is_valid(self, name, nrows: int) -> bool:
+        """True if the index is not released and matches the column."""
+        return (
+            self._postings is not None
+            and self._name == name
+            and self._codes.size == nrows
+        )
+
+    def release(self) -> None:
+        """Release the memory. Released index has to be built again."""
+        with self._lock:
+            self._postings = None
+            self._lookup.clear()
+        return None
+
+    def update(self, rows, values: Any) -> None:
+        """Update the index after the values at the rows are edited."""
+        import pandas as pd
+
+        if isinstance(rows, (int, np.integer)):
+            values = [values]
+        with self._lock:
+            if self._postings is None:
+                return None
+            new_codes: list[int] = []
+            for value in values:
+                if pd.isna(value):
+                    new_codes.append(-1)
+                elif (code := self._lookup.get(value)) is not None:
+                    new_codes.append(code)
+                else:
+                    code = self._lookup[value] = len(self._uniques)
+                    self._uniques.append(value)
+                    if isinstance(value, str):
+                        for gram in _iter_grams(value):
+                            ids = self._postings.get(gram, np.zeros(0, np.intp))
+                            self._postings[gram] = np.append(ids, code)
+                    new_codes.append(code)
+            if isinstance(rows, (int, np.integer)):
+                self._codes[rows] = new_codes[0]
+            else:
+                self._codes[rows] = np.asarray(new_codes, dtype=np.intp)
+        return None
+
+    def contains(self, pattern: str) -> np.ndarray | None:
+        """Boolean mask of the rows that contain the pattern (None if released)."""
+        with self._lock:
+            if self._postings is None:
+                return None
+            nunique = len(self._uniques)
+            if len(pattern) < _N:
+                candidates = np.arange(nunique)
+            else:
+                posting_lists: list[_IntArray] = []
+                for gram in _iter_grams(pattern):
+                    if (ids := self._postings.get(gram)) is None:
+                        posting_lists = [np.zeros(0, np.intp)]
+                        break
+                    posting_lists.append(ids)
+                posting_lists.sort(key=len)
+                candidates = posting_lists[0]
+                for ids in posting_lists[1:]:
+                    candidates = np.intersect1d(candidates, ids, assume_unique=True)
+            # verify the candidates. The last element is for the missing values.
+            table = np.zeros(nunique + 1, dtype=bool)
+            uniques = self._uniques
+            table[candidates] = [
+                isinstance(value, str) and pattern in value
+                for value in (uniques[i] for i in candidates)
+            ]
+            codes = self._codes
+        _REGISTRY.touch(self)
+        return table[codes]
+
+
+def _build_postings(uniques: list) -> dict[str, _IntArray]:
+    import pandas as pd
+
+    grams: list[str] = []
+    ids: list[int] = []
+    for i, value in enumerate(uniques):
+        if isinstance(value, str):
+            _grams = _iter_grams(value)
+            grams.extend(_grams)
+            ids.extend([i] * len(_grams))
+    if len(grams) == 0:
+        return {}
+    gram_codes, gram_uniques = pd.factorize(np.array(grams, dtype=object))
+    # stable sort keeps the unique value IDs sorted in each posting list
+    order = np.argsort(gram_codes, kind="stable")
+    ids_sorted = np.asarray(ids, dtype=np.intp)[order]
+    bounds = np.searchsorted(gram_codes[order], np.arange(len(gram_uniques) + 1))
+    return {
+        gram: ids_sorted[bounds[i] : bounds[i + 1]]
+        for i, gram in enumerate(gram_uniques)
+    }
+
+
+class _IndexRegistry:
+    """Release the least recently used indices if they use too much memory."""
+
+    def __init__(self):
+        self._refs: OrderedDict[int, weakref.ref[TrigramIndex]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, index: TrigramIndex) -> None:
+        with self._lock:
+            self._refs[id(index)] = weakref.ref(index)
+        return self.trim()
+
+    def touch(self, index: TrigramIndex) -> None:
+        with self._lock:
+            if id(index) in self._refs:
+                self._refs.move_to_end(id(index))
+        return None
+
+    def trim(self) -> None:
+        from tabulous._utils import get_config
+
+        max_bytes = get_config().table.ngram_index_mb * 2**20
+        with self._lock:
+            alive = [(key, ref()) for key, ref in self._refs.items()]
+            alive = [(key, index) for key, index in alive if index is not None]
+            self._refs = OrderedDict((key, weakref.ref(idx)) for key, idx in alive)
+            total = sum(index.nbytes for _, index in alive)
+            for key, index in alive[:-1]:  # the newest one is always kept
+                if total <= max_bytes:
+                    break
+                total -= index.nbytes
+                index.release()
+                self._refs.pop(key)
+        return None
+
+
+_REGISTRY = _IndexRegistry()
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tabulous-ngram")
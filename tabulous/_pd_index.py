@@ -9,6 +9,20 @@ CHARS_SET = set(CHARS)
 LONGEST = np.array(CHARS[:-1], dtype=object)
 
 
+def get_indexer(index: pd.Index, labels) -> np.ndarray:
+    """
+    Get the integer positions of the labels in the index.
+
+    Labels are resolved by a single vectorized call. All the positions are returned
+    for a duplicated label. KeyError is raised if any of the labels is missing.
+    """
+    indexer = index.get_indexer_for(labels)
+    if (indexer < 0).any():
+        labels = pd.Index(labels)
+        raise KeyError(list(labels[~labels.isin(index)]))
+    return indexer
+
+
 def str_to_num(s: str):
     """Converts an Excel-like column label to an integer."""
     result = -1
@@ -1,4 +1,4 @@
 from ._array import SignalArray
-from ._slots import InCellRangedSlot
+from ._slots import InCellRangedSlot, InCellArrayRangedSlot
 
-__all__ = ["SignalArray", "InCellRangedSlot"]
+__all__ = ["SignalArray", "InCellRangedSlot", "InCellArrayRangedSlot"]
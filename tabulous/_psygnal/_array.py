@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import (
     Callable,
+    Hashable,
     Iterator,
     Sequence,
     SupportsIndex,
@@ -12,6 +13,7 @@ from typing import (
     Union,
 )
 import weakref
+from functools import reduce
 from inspect import Signature
 import numpy as np
 
@@ -25,8 +27,12 @@ from ._psygnal_compat import (
     _build_signature,
     _parameter_types_match,
     signature,
+    _NULL,
 )
 from ._slots import RangedSlot, InCellRangedSlot
+from ._slot_index import SlotRangeIndex
+from ._graph import SlotDependencyGraph
+from ._profile import PROFILER
 
 __all__ = ["SignalArray"]
 
@@ -111,6 +117,9 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
             check_nargs_on_connect=check_nargs_on_connect,
             check_types_on_connect=check_types_on_connect,
         )
+        self._slot_range_index = SlotRangeIndex()
+        self._slots_version = 0
+        self._graph = SlotDependencyGraph(self._slot_range_index)
 
     def __getitem__(self, key: Slice1D | Slice2D) -> _SignalSubArrayRef:
         """Return a sub-array reference."""
@@ -183,7 +192,7 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
                         extra = f"- Slot types {slot_sig} do not match types in signal."
                         self._raise_connection_error(slot, extra)
 
-                self._slots.append((_normalize_slot(RangedSlot(slot, range)), max_args))
+                self._append_slot(_normalize_slot(RangedSlot(slot, range)), max_args)
             return slot
 
         return _wrapper if slot is None else _wrapper(slot)
@@ -194,9 +203,38 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
     ):
         with self._lock:
             _, max_args = self._check_nargs(slot, self.signature)
-            self._slots.append((_normalize_slot(slot), max_args))
+            self._append_slot(_normalize_slot(slot), max_args)
         return slot
 
+    def _append_slot(self, slot: Any, max_args: int | None) -> None:
+        entry = (slot, max_args)
+        self._slots.append(entry)
+        self._slot_range_index.add(entry, _get_range(slot))
+        self._slots_version += 1
+        return None
+
+    def _rebuild_slot_range_index(self) -> None:
+        """Rebuild the slot index. Must be called when slot ranges are updated."""
+        self._slot_range_index.rebuild(
+            (entry, _get_range(entry[0])) for entry in self._slots
+        )
+        self._slots_version += 1
+        return None
+
+    @property
+    def slots_version(self) -> int:
+        """Number that changes every time slots or their ranges are updated."""
+        return self._slots_version
+
+    def disconnect(self, slot: Any | None = None, missing_ok: bool = True) -> None:
+        with self._lock:
+            if slot is None:
+                self._slot_range_index.clear()
+            elif (idx := self._slot_index(slot)) != -1:
+                self._slot_range_index.discard(self._slots[idx])
+            self._slots_version += 1
+            return super().disconnect(slot, missing_ok)
+
     @overload
     def emit(
         self,
@@ -246,17 +284,54 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
             )
 
         if self._is_paused:
-            self._args_queue.append(args)
+            self._args_queue.append((args, range))
             return None
 
         self._run_emit_loop(args, range)
         return None
 
+    def resume(
+        self,
+        reducer=None,
+        initial: Any = _NULL,
+        key: Callable[[tuple[Any, ...], RectRange], Hashable | None] | None = None,
+    ) -> None:
+        """
+        Resume this signal and emit the queued arguments to their ranges.
+
+        In-cell slots triggered by any of the queued emissions are evaluated only
+        once, after all the other slots are called. If `reducer` is given, the
+        arguments are reduced and emitted once to all the queued ranges. If `key` is
+        also given, only the arguments of the same key are reduced and emitted once
+        to their merged range. Arguments with key None are emitted as they are.
+        """
+        self._is_paused = False
+        if not self._args_queue:
+            return None
+        queue: list[tuple[tuple[Any, ...], RectRange]] = self._args_queue
+        self._args_queue = []
+        if reducer is not None:
+            if key is None:
+                groups = [queue]
+            else:
+                groups = _group_queue(queue, key)
+            queue = []
+            for group in groups:
+                all_args = [args for args, _ in group]
+                if initial is _NULL:
+                    args = reduce(reducer, all_args)
+                else:
+                    args = reduce(reducer, all_args, initial)
+                queue.append((args, _merge_ranges([rng for _, rng in group])))
+        self._run_emit_queue(queue)
+        return None
+
     def insert_rows(self, row: int, count: int) -> None:
         """Insert rows and update slot ranges in-place."""
         for slot, _ in self._slots:
             if isinstance(slot, RangedSlot):
                 slot.insert_rows(row, count)
+        self._rebuild_slot_range_index()
         return None
 
     def insert_columns(self, col: int, count: int) -> None:
@@ -264,6 +339,7 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
         for slot, _ in self._slots:
             if isinstance(slot, RangedSlot):
                 slot.insert_columns(col, count)
+        self._rebuild_slot_range_index()
         return None
 
     def remove_rows(self, row: int, count: int):
@@ -277,6 +353,7 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
                     to_be_disconnected.append(slot)
         for slot in to_be_disconnected:
             self.disconnect(slot, missing_ok=False)
+        self._rebuild_slot_range_index()
         return None
 
     def remove_columns(self, col: int, count: int):
@@ -290,6 +367,7 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
                     to_be_disconnected.append(slot)
         for slot in to_be_disconnected:
             self.disconnect(slot, missing_ok=False)
+        self._rebuild_slot_range_index()
         return None
 
     def _slot_index(self, slot: Any) -> int:
@@ -304,35 +382,65 @@ class SignalArrayInstance(SignalInstance, TableAnchorBase):
         self,
         args: tuple[Any, ...],
         range: RectRange = AnyRange(),
+    ) -> None:
+        return self._run_emit_queue([(args, range)])
+
+    def _run_emit_queue(
+        self,
+        queue: list[tuple[tuple[Any, ...], RectRange]],
     ) -> None:
         rem = []
+        # in-cell slots are evaluated after all the other slots are called, in the
+        # topological order of the dependency graph.
+        cell_slots: dict[int, InCellRangedSlot] = {}
 
         with self._lock:
             with Signal._emitting(self):
-                for (slot, max_args) in self._slots:
-                    if isinstance(slot, tuple):
-                        _ref, name, method = slot
-                        obj = _ref()
-                        if obj is None:
-                            rem.append(slot)  # add dead weakref
-                            continue
-                        if method is not None:
-                            cb = method
-                        else:
-                            _cb = getattr(obj, name, None)
-                            if _cb is None:  # pragma: no cover
-                                rem.append(slot)  # object has changed?
-                                continue
-                            cb = _cb
+                index = self._slot_range_index
+                for args, range in queue:
+                    if (slots := index.query(range)) is None:
+                        slots = self._slots
                     else:
-                        cb = slot
+                        # slots may be disconnected during emission
+                        slots = (s for s in slots if s in index)
+                    for (slot, max_args) in slots:
+                        if isinstance(slot, tuple):
+                            _ref, name, method = slot
+                            obj = _ref()
+                            if obj is None:
+                                rem.append(slot)  # add dead weakref
+                                continue
+                            if method is not None:
+                                cb = method
+                            else:
+                                _cb = getattr(obj, name, None)
+                                if _cb is None:  # pragma: no cover
+                                    rem.append(slot)  # object has changed?
+                                    continue
+                                cb = _cb
+                        else:
+                            cb = slot
 
-                    if isinstance(cb, RangedSlot) and not range.overlaps_with(cb.range):
-                        continue
+                        if isinstance(cb, RangedSlot) and not range.overlaps_with(
+                            cb.range
+                        ):
+                            continue
+                        if isinstance(cb, InCellRangedSlot):
+                            cell_slots.setdefault(id(cb), cb)
+                            if PROFILER.enabled:
+                                PROFILER.set_trigger(cb, range)
+                            continue
+                        try:
+                            cb(*args[:max_args])
+                        except Exception as e:
+                            raise EmitLoopError(repr(slot), args[:max_args], e) from e
+
+                if cell_slots:
+                    _cell_slots = list(cell_slots.values())
                     try:
-                        cb(*args[:max_args])
+                        self._graph.evaluate(_cell_slots)
                     except Exception as e:
-                        raise EmitLoopError(repr(slot), args[:max_args], e) from e
+                        raise EmitLoopError(repr(_cell_slots), (), e) from e
 
             for slot in rem:
                 self.disconnect(slot)
@@ -401,6 +509,41 @@ class _SignalSubArrayRef:
         )
 
 
+def _get_range(slot: Any) -> RectRange | None:
+    """Get the range of a stored slot (None if always called)."""
+    if isinstance(slot, RangedSlot):
+        return slot.range
+    return None
+
+
+def _group_queue(
+    queue: list[tuple[tuple[Any, ...], RectRange]],
+    key: Callable[[tuple[Any, ...], RectRange], Hashable | None],
+) -> list[list[tuple[tuple[Any, ...], RectRange]]]:
+    """Group the queued emissions by the key, in the order of the first emission."""
+    groups: dict[Hashable, list[tuple[tuple[Any, ...], RectRange]]] = {}
+    out: list[list[tuple[tuple[Any, ...], RectRange]]] = []
+    for args, rng in queue:
+        if (k := key(args, rng)) is None:
+            out.append([(args, rng)])
+        elif (group := groups.get(k)) is not None:
+            group.append((args, rng))
+        else:
+            group = groups[k] = [(args, rng)]
+            out.append(group)
+    return out
+
+
+def _merge_ranges(ranges: list[RectRange]) -> RectRange:
+    """Merge ranges into one range."""
+    if any(isinstance(rng, AnyRange) for rng in ranges):
+        return AnyRange()
+    rects: list[RectRange] = []
+    for rng in ranges:
+        rects.extend(rng)
+    return MultiRectRange(rects)
+
+
 def _parse_a_key(k):
     if isinstance(k, slice):
         return k
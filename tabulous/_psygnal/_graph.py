@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, TYPE_CHECKING
+
+from tabulous._range import RectRange
+from tabulous._utils import get_config
+from ._slots import InCellRangedSlot, CircularReferenceError
+
+if TYPE_CHECKING:
+    from ._slot_index import SlotRangeIndex
+
+# Maximum number of times a slot is evaluated by one call of `evaluate`. A slot is
+# evaluated more than once only if the graph changed during the evaluation.
+_MAX_EVALUATION = 2
+
+
+class SlotDependencyGraph:
+    """
+    Dependency graph of in-cell slots.
+
+    A slot ``B`` depends on a slot ``A`` if the range of ``B`` overlaps with the last
+    destination of ``A``. Edges are looked up from the slot range index every time,
+    so that the graph is always consistent with the connected slots.
+
+    Parameters
+    ----------
+    index : SlotRangeIndex
+        The range index of the connected slots, which stores ``(slot, max_args)``.
+    """
+
+    def __init__(self, index: SlotRangeIndex):
+        self._index = index
+        self._running = False
+        self._waiting: set[int] = set()  # id of slots that will be evaluated
+        self._requested: list[InCellRangedSlot] = []
+
+    def dependents(self, slot: InCellRangedSlot) -> list[InCellRangedSlot]:
+        """Return the connected slots that depend on the given slot."""
+        if (dest := slot.last_destination) is None:
+            return []
+        rect = RectRange(*dest)
+        if (entries := self._index.query(rect)) is None:
+            entries = self._index.iter_entries()
+        out: list[InCellRangedSlot] = []
+        for other, _ in entries:
+            if (
+                isinstance(other, InCellRangedSlot)
+                and other is not slot
+                and other.range.overlaps_with(rect)
+            ):
+                out.append(other)
+        return out
+
+    def sort(
+        self, slots: Iterable[InCellRangedSlot]
+    ) -> tuple[list[InCellRangedSlot], list[InCellRangedSlot]]:
+        """
+        Sort the slots and their dependents topologically.
+
+        Returns
+        -------
+        list of InCellRangedSlot, list of InCellRangedSlot
+            Sorted slots and slots that are in or depend on circular references.
+        """
+        levels, circular = self.sort_levels(slots)
+        return [node for level in levels for node in level], circular
+
+    def sort_levels(
+        self, slots: Iterable[InCellRangedSlot]
+    ) -> tuple[list[list[InCellRangedSlot]], list[InCellRangedSlot]]:
+        """
+        Sort the slots and their dependents into levels of the dependency graph.
+
+        A slot of a level only depends on slots of the previous levels, so that slots
+        of the same level are independent of each other.
+
+        Returns
+        -------
+        list of list of InCellRangedSlot, list of InCellRangedSlot
+            Slots of each level and slots that are in or depend on circular
+            references.
+        """
+        nodes, edges = self._collect(slots)
+        in_degree = {id(node): 0 for node in nodes}
+        for deps in edges.values():
+            for dep in deps:
+                in_degree[id(dep)] += 1
+        depth = {id(node): 0 for node in nodes}
+        queue = deque(node for node in nodes if in_degree[id(node)] == 0)
+        levels: list[list[InCellRangedSlot]] = []
+        while queue:
+            node = queue.popleft()
+            _depth = depth[id(node)]
+            if _depth == len(levels):
+                levels.append([])
+            levels[_depth].append(node)
+            for dep in edges[id(node)]:
+                depth[id(dep)] = max(depth[id(dep)], _depth + 1)
+                in_degree[id(dep)] -= 1
+                if in_degree[id(dep)] == 0:
+                    queue.append(dep)
+        circular = [node for node in nodes if in_degree[id(node)] > 0]
+        return levels, circular
+
+    def find_circular(self, slot: InCellRangedSlot) -> list[InCellRangedSlot]:
+        """
+        Find slots that form circular references with the given slot.
+
+        The given slot does not have to be connected yet. An empty list is returned
+        if no circular reference is found.
+        """
+        nodes, edges = self._collect([slot])
+        rng = slot.range
+        parents: dict[int, list[InCellRangedSlot]] = {id(node): [] for node in nodes}
+        for node in nodes:
+            for dep in edges[id(node)]:
+                parents[id(dep)].append(node)
+        queue = deque(
+            node
+            for node in nodes
+            if node is not slot
+            and (dest := node.last_destination) is not None
+            and rng.overlaps_with(RectRange(*dest))
+        )
+        if not queue:
+            return []
+        found = {id(node): node for node in queue}
+        while queue:
+            node = queue.popleft()
+            for parent in parents[id(node)]:
+                if parent is not slot and id(parent) not in found:
+                    found[id(parent)] = parent
+                    queue.append(parent)
+        return [slot] + list(found.values())
+
+    def evaluate(self, slots: Iterable[InCellRangedSlot]) -> None:
+        """
+        Evaluate the slots and all their dependents in topological order.
+
+        Each slot is evaluated only once. Slots that are in or depend on circular
+        references are not evaluated and set to errors. If this method is called
+        during evaluation (by data changes caused by the evaluation), slots are just
+        requested to the running evaluation.
+        """
+        if self._running:
+            waiting = self._waiting
+            self._requested.extend(s for s in slots if id(s) not in waiting)
+            return None
+
+        self._running = True
+        counts: dict[int, int] = {}
+        try:
+            pending = list(slots)
+            while pending:
+                levels, circular = self.sort_levels(pending)
+                self._requested = []
+                self.set_circular_error(circular)
+                self._waiting = {id(slot) for level in levels for slot in level}
+                for level in levels:
+                    to_call: list[InCellRangedSlot] = []
+                    for slot in level:
+                        self._waiting.discard(id(slot))
+                        count = counts.get(id(slot), 0)
+                        if count >= _MAX_EVALUATION:
+                            self.set_circular_error([slot])
+                            continue
+                        counts[id(slot)] = count + 1
+                        to_call.append(slot)
+                    self._call_level(to_call)
+                pending = self._requested
+        finally:
+            self._running = False
+            self._waiting = set()
+            self._requested = []
+        return None
+
+    def _call_level(self, slots: list[InCellRangedSlot]) -> None:
+        """Call slots of the same level."""
+        max_workers = get_config().cell.eval_workers
+        if max_workers <= 1 or len(slots) <= 1:
+            for slot in slots:
+                slot.call()
+            return None
+
+        # Evaluate expressions in worker threads against the same data frame. Slots
+        # of the same level do not depend on each other, and the results are applied
+        # to the table in the main thread. The data frame is not copied because the
+        # main thread is blocked until all the workers finish, so that nothing is
+        # written to it during evaluation.
+        qtable = slots[0].table.native
+        df = qtable.getDataFrame()
+        namespaces = [slot._get_namespace(slot._expr, slot.range, df) for slot in slots]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_eval_expr, slots, namespaces))
+        with qtable.batchEditing():
+            for slot, (out, err) in zip(slots, results):
+                slot.after_called(slot.set_output(out, err))
+        return None
+
+    def set_circular_error(self, slots: Iterable[InCellRangedSlot]) -> None:
+        """Set circular reference errors to the slots without evaluation."""
+        for slot in slots:
+            err = CircularReferenceError(
+                "Circular reference detected. The cell depends on its own output.",
+                slot.source_pos,
+            )
+            slot.set_error(err)
+        return None
+
+    def _collect(
+        self, slots: Iterable[InCellRangedSlot]
+    ) -> tuple[list[InCellRangedSlot], dict[int, list[InCellRangedSlot]]]:
+        """Collect the slots and their dependents, and the edges between them."""
+        nodes: dict[int, InCellRangedSlot] = {}
+        edges: dict[int, list[InCellRangedSlot]] = {}
+        queue: deque[InCellRangedSlot] = deque()
+        for slot in slots:
+            if id(slot) not in nodes:
+                nodes[id(slot)] = slot
+                queue.append(slot)
+        while queue:
+            slot = queue.popleft()
+            deps = edges[id(slot)] = self.dependents(slot)
+            for dep in deps:
+                if id(dep) not in nodes:
+                    nodes[id(dep)] = dep
+                    queue.append(dep)
+        return list(nodes.values()), edges
+
+
+def _eval_expr(slot: InCellRangedSlot, ns: dict[str, Any]):
+    return slot.eval_expr(ns)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import wraps
+import threading
+from time import perf_counter
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+import weakref
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from tabulous._range import RectRange
+    from ._slots import InCellRangedSlot
+
+__all__ = ["SlotProfiler", "SlotStats", "PROFILER"]
+
+
+@dataclass
+class SlotStats:
+    """Evaluation statistics of an in-cell slot."""
+
+    pos: tuple[int, int]
+    expr: str
+    ncalls: int = 0
+    eval_time: float = 0.0
+    apply_time: float = 0.0
+    output_size: int = 0
+    trigger: RectRange | None = None
+    error: str | None = None
+
+    @property
+    def total_time(self) -> float:
+        """Cumulative time spent for evaluation and updating cells."""
+        return self.eval_time + self.apply_time
+
+
+class SlotProfiler:
+    """
+    Profiler of in-cell slots.
+
+    While enabled, evaluation and cell updates of all the in-cell slots are timed.
+    The instrumentation is installed by replacing the methods of the slot class, so
+    that nothing is added to the evaluation when the profiler is disabled.
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._stats: dict[int, tuple[weakref.ref[InCellRangedSlot], SlotStats]] = {}
+        self._triggers: dict[int, RectRange] = {}
+        self._originals: dict[str, Callable] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """True if the profiler is enabled."""
+        return self._enabled
+
+    def enable(self) -> None:
+        """Start profiling in-cell slots."""
+        if self._enabled:
+            return None
+        from ._slots import InCellRangedSlot
+
+        for name, wrapper in [
+            ("eval_expr", self._wrap_eval_expr),
+            ("set_output", self._wrap_apply),
+            ("after_called", self._wrap_apply),
+        ]:
+            method = InCellRangedSlot.__dict__[name]
+            self._originals[name] = method
+            setattr(InCellRangedSlot, name, wrapper(method))
+        self._enabled = True
+        return None
+
+    def disable(self) -> None:
+        """Stop profiling in-cell slots. Collected statistics are kept."""
+        if not self._enabled:
+            return None
+        from ._slots import InCellRangedSlot
+
+        for name, method in self._originals.items():
+            setattr(InCellRangedSlot, name, method)
+        self._originals.clear()
+        self._triggers.clear()
+        self._enabled = False
+        return None
+
+    def clear(self) -> None:
+        """Clear all the collected statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._triggers.clear()
+        return None
+
+    def set_trigger(self, slot: InCellRangedSlot, range: RectRange) -> None:
+        """Record the range that triggered the evaluation of a slot."""
+        self._triggers[id(slot)] = range
+        return None
+
+    def get_stats(
+        self, slots: Iterable[InCellRangedSlot] | None = None
+    ) -> list[SlotStats]:
+        """Return the statistics sorted by the cumulative time."""
+        with self._lock:
+            items = list(self._stats.values())
+        if slots is not None:
+            ids = {id(slot) for slot in slots}
+            items = [(ref, stats) for ref, stats in items if id(ref()) in ids]
+        out = [stats for ref, stats in items if ref() is not None]
+        out.sort(key=lambda stats: stats.total_time, reverse=True)
+        return out
+
+    def to_dataframe(
+        self, slots: Iterable[InCellRangedSlot] | None = None
+    ) -> pd.DataFrame:
+        """Return the statistics as a data frame sorted by the cumulative time."""
+        import pandas as pd
+
+        columns = [
+            "pos", "expr", "ncalls", "total_time", "eval_time", "apply_time",
+            "output_size", "trigger", "error",
+        ]  # fmt: skip
+        records = [
+            {
+                "pos": stats.pos,
+                "expr": stats.expr,
+                "ncalls": stats.ncalls,
+                "total_time": stats.total_time,
+                "eval_time": stats.eval_time,
+                "apply_time": stats.apply_time,
+                "output_size": stats.output_size,
+                "trigger": repr(stats.trigger) if stats.trigger is not None else "",
+                "error": stats.error or "",
+            }
+            for stats in self.get_stats(slots)
+        ]
+        return pd.DataFrame(records, columns=columns)
+
+    def _get_or_create(self, slot: InCellRangedSlot) -> SlotStats:
+        key = id(slot)
+        if (item := self._stats.get(key)) is None or item[0]() is not slot:
+            stats = SlotStats(slot.source_pos, slot.as_literal())
+            self._stats[key] = (weakref.ref(slot), stats)
+        else:
+            stats = item[1]
+        return stats
+
+    def _wrap_eval_expr(self, method: Callable) -> Callable:
+        @wraps(method)
+        def _eval_expr(slot: InCellRangedSlot, ns: dict[str, Any]):
+            t0 = perf_counter()
+            out, err = method(slot, ns)
+            elapsed = perf_counter() - t0
+            # eval_expr may be called from worker threads
+            with self._lock:
+                stats = self._get_or_create(slot)
+                stats.ncalls += 1
+                stats.eval_time += elapsed
+                stats.trigger = self._triggers.pop(id(slot), None)
+                if err is None:
+                    stats.output_size = _output_size(out)
+                    stats.error = None
+                else:
+                    stats.output_size = 0
+                    stats.error = f"{type(err).__name__}: {err}"
+            return out, err
+
+        return _eval_expr
+
+    def _wrap_apply(self, method: Callable) -> Callable:
+        @wraps(method)
+        def _apply(slot: InCellRangedSlot, *args, **kwargs):
+            t0 = perf_counter()
+            out = method(slot, *args, **kwargs)
+            elapsed = perf_counter() - t0
+            with self._lock:
+                self._get_or_create(slot).apply_time += elapsed
+            return out
+
+        return _apply
+
+
+def _output_size(out: Any) -> int:
+    """Number of cells that the output will occupy."""
+    if (shape := getattr(out, "shape", None)) is not None:
+        return int(np.prod(shape))
+    if isinstance(out, (tuple, dict)):
+        return len(out)
+    return 1
+
+
+PROFILER = SlotProfiler()
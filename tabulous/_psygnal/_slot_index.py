@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Tuple
+
+from tabulous._range import RectRange
+
+# (row bucket, column bucket). None means that the range is not limited in the axis.
+_BucketKey = Tuple[Optional[int], Optional[int]]
+
+
+class SlotRangeIndex:
+    """
+    Grid-bucket index of the ranges of connected slots.
+
+    The table is divided into buckets of ``bucket_shape``. Each slot is registered to
+    the buckets that its range covers, so that emitting signals to a small range
+    only visits the slots registered to the buckets of the range.
+
+    - Ranges not limited in rows (columns) are registered to column (row) buckets.
+    - Ranges that cover more than ``max_buckets`` buckets or are not limited in both
+      axes are registered as "always visited".
+
+    Since ranges are registered to the covering buckets, visited slots may not
+    overlap with the emitted range. The exact check has to be done by the caller.
+
+    Parameters
+    ----------
+    bucket_shape : (int, int)
+        Number of rows and columns of a bucket.
+    max_buckets : int
+        Maximum number of buckets that a slot or an emitted range can be indexed by.
+    """
+
+    def __init__(
+        self,
+        bucket_shape: tuple[int, int] = (16, 4),
+        max_buckets: int = 64,
+    ):
+        self._bucket_shape = bucket_shape
+        self._max_buckets = max_buckets
+        self._count = 0
+        # id of the stored slot -> (order of connection, stored slot)
+        self._entries: dict[int, tuple[int, Any]] = {}
+        self._entry_keys: dict[int, set[_BucketKey]] = {}
+        self._buckets: dict[_BucketKey, set[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed slots."""
+        return len(self._entries)
+
+    def __contains__(self, entry: Any) -> bool:
+        """True if the stored slot is indexed."""
+        return id(entry) in self._entries
+
+    def add(
+        self,
+        entry: Any,
+        range: RectRange | None,
+        order: int | None = None,
+    ) -> None:
+        """
+        Add a stored slot to the index.
+
+        Parameters
+        ----------
+        entry : Any
+            The stored slot object that will be returned by ``query``.
+        range : RectRange, optional
+            Range of the slot. None means the slot is always visited.
+        order : int, optional
+            Order of the slot in the output of ``query``. Incremented number is used
+            by default.
+        """
+        key = id(entry)
+        if order is None:
+            order = self._count
+            self._count += 1
+        self._entries[key] = (order, entry)
+        if range is None:
+            bucket_keys = {(None, None)}
+        else:
+            bucket_keys: set[_BucketKey] = set()
+            for rect in range:
+                bucket_keys.update(self._iter_bucket_keys(rect))
+        self._entry_keys[key] = bucket_keys
+        for bucket_key in bucket_keys:
+            if bucket := self._buckets.get(bucket_key):
+                bucket.add(key)
+            else:
+                self._buckets[bucket_key] = {key}
+        return None
+
+    def discard(self, entry: Any) -> None:
+        """Remove a stored slot from the index if exists."""
+        key = id(entry)
+        if self._entries.pop(key, None) is None:
+            return None
+        for bucket_key in self._entry_keys.pop(key):
+            bucket = self._buckets[bucket_key]
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[bucket_key]
+        return None
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._entries.clear()
+        self._entry_keys.clear()
+        self._buckets.clear()
+        return None
+
+    def rebuild(self, items: Iterable[tuple[Any, RectRange | None]]) -> None:
+        """Rebuild the index from pairs of stored slot and its range."""
+        self.clear()
+        for entry, range in items:
+            self.add(entry, range)
+        return None
+
+    def query(self, range: RectRange) -> list[Any] | None:
+        """
+        Return stored slots that may overlap with the range in connection order.
+
+        None is returned if the range is too large to be looked up. In this case,
+        all the slots should be visited.
+        """
+        ids: set[int] = set(self._buckets.get((None, None), ()))
+        for rect in range:
+            rows = self._bucket_range(rect._rsl, self._bucket_shape[0])
+            cols = self._bucket_range(rect._csl, self._bucket_shape[1])
+            if rows is None or cols is None:
+                return None
+            if len(rows) * len(cols) > self._max_buckets:
+                return None
+            for br in rows:
+                ids.update(self._buckets.get((br, None), ()))
+                for bc in cols:
+                    ids.update(self._buckets.get((br, bc), ()))
+            for bc in cols:
+                ids.update(self._buckets.get((None, bc), ()))
+        entries = self._entries
+        return [entry for _, entry in sorted(entries[key] for key in ids)]
+
+    def iter_entries(self) -> Iterable[Any]:
+        """Iterate over all the stored slots in connection order."""
+        return [entry for _, entry in sorted(self._entries.values())]
+
+    def _iter_bucket_keys(self, rect: RectRange) -> Iterable[_BucketKey]:
+        rows = self._bucket_range(rect._rsl, self._bucket_shape[0])
+        cols = self._bucket_range(rect._csl, self._bucket_shape[1])
+        if rows is not None and len(rows) == 0 or cols is not None and len(cols) == 0:
+            return ()  # empty range never overlaps
+        max_buckets = self._max_buckets
+        if rows is not None and cols is not None:
+            if len(rows) * len(cols) <= max_buckets:
+                return [(br, bc) for br in rows for bc in cols]
+        if rows is not None and len(rows) <= max_buckets:
+            return [(br, None) for br in rows]
+        if cols is not None and len(cols) <= max_buckets:
+            return [(None, bc) for bc in cols]
+        return [(None, None)]
+
+    @staticmethod
+    def _bucket_range(sl: slice, size: int) -> range | None:
+        """Range of bucket indices that covers the slice, or None if not limited."""
+        if sl.stop is None:
+            return None
+        start = 0 if sl.start is None else sl.start
+        if start >= sl.stop:
+            return range(0)
+        return range(start // size, (sl.stop - 1) // size + 1)
@@ -4,10 +4,12 @@ import ast
 
 import builtins
 import logging
+from types import CodeType
 from typing import (
     Callable,
     Generic,
     Any,
+    Mapping,
     TYPE_CHECKING,
     TypeVar,
 )
@@ -20,7 +22,7 @@ import pandas as pd
 from tabulous._range import RectRange, AnyRange, MultiRectRange, TableAnchorBase
 from tabulous._selection_op import iter_extract_with_range
 from tabulous import _slice_op as _sl
-from ._special_objects import RowCountGetter
+from ._special_objects import RowCountGetter, LazyFrame
 
 
 logger = logging.getLogger(__name__)
@@ -44,6 +46,8 @@ _BUILTINS = {
 }
 # fmt: on
 
+_DEFAULT_NAMESPACE = {"np": np, "pd": pd}
+
 
 class RangedSlot(Generic[_P, _R], TableAnchorBase):
     """
@@ -107,18 +111,46 @@ class InCellExpr:
 
     def __init__(self, objs: list):
         self._objs = objs
+        self._compiled: tuple[CodeType, str] | None = None
+        self._iloc_only = False
 
     def eval(self, ns: dict[str, Any], ranges: MultiRectRange):
         """Evaluate this expression."""
         return self.eval_and_format(ns, ranges)[0]
 
     def eval_and_format(self, ns: dict[str, Any], ranges: MultiRectRange):
-        expr = self.as_literal(ranges)
+        code, expr = self.compile(ranges)
         logger.debug(f"About to run: {expr!r}")
         ns["__builtins__"] = _BUILTINS
-        out = eval(expr, ns, {})
+        out = eval(code, ns)
         return out, expr
 
+    def compile(self, ranges: MultiRectRange) -> tuple[CodeType, str]:
+        """
+        Compile this expression and return the code object and the literal.
+
+        The result is cached. ``invalidate`` must be called if ranges are updated.
+        """
+        if self._compiled is None:
+            expr = self.as_literal(ranges)
+            tree = ast.parse(expr, mode="eval")
+            self._compiled = (compile(tree, "<cell>", "eval"), expr)
+            self._iloc_only = _is_iloc_only(tree)
+        return self._compiled
+
+    def is_iloc_only(self, ranges: MultiRectRange) -> bool:
+        """True if the table data is only used by ``df.iloc[...]`` or ``DF[...]``."""
+        try:
+            self.compile(ranges)
+        except SyntaxError:
+            return False
+        return self._iloc_only
+
+    def invalidate(self) -> None:
+        """Invalidate the cached code object."""
+        self._compiled = None
+        return None
+
     def as_literal(self, ranges: MultiRectRange) -> str:
         out: list[str] = []
         _it = iter(ranges)
@@ -131,6 +163,47 @@ class InCellExpr:
         return "".join(out)
 
 
+def _is_iloc_only(tree: ast.AST) -> bool:
+    """True if `df` and `DF` in the tree are only used for iloc indexing."""
+    allowed: set[int] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Subscript):
+            continue
+        value = node.value
+        if isinstance(value, ast.Name) and value.id == "DF":
+            allowed.add(id(value))
+        elif (
+            isinstance(value, ast.Attribute)
+            and value.attr == "iloc"
+            and isinstance(value.value, ast.Name)
+            and value.value.id == "df"
+        ):
+            allowed.add(id(value.value))
+    return all(
+        id(node) in allowed
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and node.id in ("df", "DF")
+    )
+
+
+class _Namespace(dict):
+    """
+    Namespace of an evaluation that falls back to a shared namespace.
+
+    Only the names specific to the evaluation are stored in this dict, so that the
+    shared namespace does not have to be copied for every evaluation. A dict
+    subclass is used instead of ``ChainMap`` because globals of ``eval`` must be a
+    dict, and names in comprehensions and lambdas are looked up from the globals.
+    """
+
+    def __init__(self, base: Mapping[str, Any], **kwargs: Any):
+        super().__init__(**kwargs)
+        self._base = base
+
+    def __missing__(self, key: str) -> Any:
+        return self._base[key]
+
+
 BIG = 99999999
 
 
@@ -222,6 +295,8 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
         if isinstance(c, int):
             c = slice(c, c + 1)
         self._last_destination = r, c
+        if table := self._table():
+            table._qwidget._qtable_view._table_map.update_destination(self)
 
     @classmethod
     def from_table(
@@ -268,27 +343,69 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
         """Raise an evaluation error."""
         raise CellEvaluationError(msg, self.source_pos)
 
-    def evaluate(self) -> EvalResult:
-        """Evaluate expression, update cells and return the result."""
+    def as_literal_at(self, pos: tuple[int, int], dest: bool = False) -> str:
+        """As a literal string of the formula that outputs to the source `pos`."""
+        return self.as_literal(dest=dest)
+
+    def as_filled_literal(self, offset: int) -> str:
+        """As a literal string of this formula filled down by `offset` rows."""
+        rects: list[RectRange] = []
+        for rsl, csl in self.range.iter_ranges():
+            if rsl.start is not None and rsl.start != BIG:
+                stop = None if rsl.stop is None else rsl.stop + offset
+                rsl = slice(rsl.start + offset, stop)
+            rects.append(RectRange(rsl, csl))
+        return self._expr.as_literal(MultiRectRange(rects))
+
+    def _get_namespace(
+        self,
+        expr: InCellExpr,
+        ranges: MultiRectRange,
+        df: pd.DataFrame | None = None,
+    ) -> _Namespace:
+        """Create a namespace to evaluate `expr`, optionally with a given data frame."""
         table = self.table
         qtable = table._qwidget
-        qtable_view = qtable._qtable_view
-        qviewer = qtable.parentViewer()
-        self._current_error = None
-
-        df = qtable.getDataFrame()
-        if qviewer is not None:
-            ns = dict(qviewer._namespace)
+        if (qviewer := qtable.parentViewer()) is not None:
+            base = qviewer._namespace
         else:
-            ns = {"np": np, "pd": pd}
-        ns.update(df=df, N=RowCountGetter(qtable), DF=df.iloc)
+            base = _DEFAULT_NAMESPACE
+        if df is None:
+            if table.table_type == "SpreadSheet" and expr.is_iloc_only(ranges):
+                # only the referred columns will be parsed
+                df = LazyFrame(qtable)
+            else:
+                df = qtable.getDataFrame()
+        return _Namespace(base, df=df, N=RowCountGetter(qtable), DF=df.iloc)
+
+    def evaluate(self) -> EvalResult:
+        """Evaluate expression, update cells and return the result."""
+        ns = self._get_namespace(self._expr, self.range)
+        return self.set_output(*self.eval_expr(ns))
+
+    def eval_expr(self, ns: dict[str, Any]) -> tuple[Any, Exception | None]:
+        """
+        Evaluate the expression in the namespace without updating cells.
+
+        This method does not touch the table, so that it can be called from other
+        threads. Returns the output and the exception raised during evaluation.
+        """
         try:
             out, _expr = self._expr.eval_and_format(ns, self.range)
             logger.debug(f"Evaluated at {self.pos!r}")
         except Exception as e:
             logger.debug(f"Evaluation failed at {self.pos!r}: {e!r}")
-            self._current_error = e
-            return EvalResult(e, self.source_pos)
+            return None, e
+        return out, None
+
+    def set_output(self, out: Any, err: Exception | None = None) -> EvalResult:
+        """Update cells with the output of the expression and return the result."""
+        table = self.table
+        qtable = table._qwidget
+        qtable_view = qtable._qtable_view
+        self._current_error = err
+        if err is not None:
+            return EvalResult(err, self.source_pos)
 
         _is_named_tuple = isinstance(out, tuple) and hasattr(out, "_fields")
         _is_dict = isinstance(out, dict)
@@ -395,6 +512,13 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
                 qtable.model()._background_color_anim.start(rsl, csl)
         return None
 
+    def set_error(self, err: Exception) -> EvalResult:
+        """Set an error without evaluation and update cells."""
+        self._current_error = err
+        out = EvalResult(err, self.source_pos)
+        self.after_called(out)
+        return out
+
     def call(self):
         """Function that will be called when cells changed."""
         out = self.evaluate()
@@ -414,6 +538,7 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
     def insert_columns(self, col: int, count: int) -> None:
         """Insert columns and update range."""
         self._range.insert_columns(col, count)
+        self._expr.invalidate()
         if dest := self.last_destination:
             rect = RectRange(*dest)
             rect.insert_columns(col, count)
@@ -425,6 +550,7 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
     def insert_rows(self, row: int, count: int) -> None:
         """Insert rows and update range."""
         self._range.insert_rows(row, count)
+        self._expr.invalidate()
         if dest := self.last_destination:
             rect = RectRange(*dest)
             rect.insert_rows(row, count)
@@ -436,6 +562,7 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
     def remove_columns(self, col: int, count: int) -> None:
         """Remove columns and update range."""
         self._range.remove_columns(col, count)
+        self._expr.invalidate()
         if dest := self.last_destination:
             rect = RectRange(*dest)
             rect.remove_columns(col, count)
@@ -447,6 +574,7 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
     def remove_rows(self, row: int, count: int) -> None:
         """Remove rows and update range."""
         self._range.remove_rows(row, count)
+        self._expr.invalidate()
         r, c = self.pos
         if dest := self.last_destination:
             rect = RectRange(*dest)
@@ -547,6 +675,115 @@ class InCellRangedSlot(RangedSlot[_P, _R]):
         return determined
 
 
+class InCellArrayRangedSlot(InCellRangedSlot[_P, _R]):
+    """
+    A slot of a formula filled down to a column, evaluated as an array formula.
+
+    A formula such as ``df.iloc[0, 0] * 2`` filled down to rows ``0:n`` is stored
+    as ``df.iloc[0:n, 0] * 2``, which is evaluated once and written to the rows in
+    one block. All the references must be single cells.
+    """
+
+    @classmethod
+    def from_slot(cls, slot: InCellRangedSlot, nrows: int) -> Self | None:
+        """
+        Vectorize a slot filled down to `nrows` rows.
+
+        None is returned if the filled formulas cannot be evaluated as an array.
+        """
+        r, c = slot.source_pos
+        dest = RectRange(slice(r, r + nrows), slice(c, c + 1))
+        rects: list[RectRange] = []
+        for rsl, csl in slot.range.iter_ranges():
+            if rsl.start == BIG:  # the `N` range
+                rects.append(RectRange(rsl, csl))
+                continue
+            if rsl.start is None or not (_sl.len_1(rsl) and _sl.len_1(csl)):
+                return None
+            rect = RectRange(slice(rsl.start, rsl.start + nrows), csl)
+            if rect.overlaps_with(dest):
+                # filled formulas depend on each other
+                return None
+            rects.append(rect)
+        if all(rect._rsl.start == BIG for rect in rects):
+            return None
+        expr = InCellExpr(slot._expr._objs)
+        return cls(expr, slot.pos, slot.table, MultiRectRange(rects), (False, False))
+
+    @property
+    def nrows(self) -> int:
+        """Number of rows of the filled range."""
+        for rsl, _ in self.range.iter_ranges():
+            if rsl.start != BIG:
+                return rsl.stop - rsl.start
+        return 1
+
+    def _ranges_at(self, offset: int) -> MultiRectRange:
+        """Ranges of the formula at the given row offset."""
+        rects: list[RectRange] = []
+        for rsl, csl in self.range.iter_ranges():
+            if rsl.start != BIG:
+                rsl = slice(rsl.start + offset, rsl.start + offset + 1)
+            rects.append(RectRange(rsl, csl))
+        return MultiRectRange(rects)
+
+    def as_literal_at(self, pos: tuple[int, int], dest: bool = False) -> str:
+        """As a literal string of the formula that outputs to the source `pos`."""
+        r, c = pos
+        _expr = self._expr.as_literal(self._ranges_at(r - self.source_pos[0]))
+        if dest:
+            _expr = f"df.iloc[{r}, {c}] = {_expr}"
+        return _expr
+
+    def is_consistent(self) -> bool:
+        """
+        True if the array formula gives the same results as the filled formulas.
+
+        Only the first and the last rows are compared with the formulas evaluated
+        for each cell.
+        """
+        nrows = self.nrows
+        try:
+            ns = self._get_namespace(self._expr, self.range)
+            out = np.squeeze(np.asarray(self._expr.eval(ns, self.range)))
+            if out.shape != (nrows,):
+                return False
+            for offset in {0, nrows - 1}:
+                expr = InCellExpr(self._expr._objs)
+                ranges = self._ranges_at(offset)
+                val = np.asarray(expr.eval(self._get_namespace(expr, ranges), ranges))
+                if val.size != 1 or not _scalar_equal(val.ravel()[0], out[offset]):
+                    return False
+        except Exception:
+            return False
+        return True
+
+    def _infer_indices(self) -> tuple[int, int]:
+        raise CellEvaluationError(
+            f"Array formula must return {self.nrows} values but returned a scalar.",
+            pos=self.pos,
+        )
+
+    def _infer_slices(self, out: pd.Series | np.ndarray) -> tuple[slice, slice]:
+        nrows = self.nrows
+        if len(out) != nrows:
+            raise CellEvaluationError(
+                f"Array formula must return {nrows} values but returned {len(out)}.",
+                pos=self.pos,
+            )
+        r, c = self.pos
+        return slice(r, r + nrows), slice(c, c + 1)
+
+
+def _scalar_equal(a, b) -> bool:
+    if pd.isna(a) and pd.isna(b):
+        return True
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
 class CellEvaluationError(Exception):
     """Raised when cell evaluation is conducted in a wrong way."""
 
@@ -555,6 +792,10 @@ class CellEvaluationError(Exception):
         self._pos = pos
 
 
+class CircularReferenceError(CellEvaluationError):
+    """Raised when cells depend on their own outputs."""
+
+
 _T = TypeVar("_T")
 
 
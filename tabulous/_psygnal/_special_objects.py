@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, TYPE_CHECKING
 import weakref
+import pandas as pd
 
 if TYPE_CHECKING:
     from tabulous._qt._table import QMutableTable
@@ -12,7 +13,7 @@ class RowCountGetter:
         self._qtable = weakref.ref(qtable)
 
     def __int__(self) -> int:
-        return len(self._qtable().getDataFrame())
+        return self._qtable().dataShapeRaw()[0]
 
     def __float__(self) -> float:
         return float(self.__int__())
@@ -64,3 +65,45 @@ class RowCountGetter:
 
     def __index__(self) -> int:
         return self.__int__()
+
+
+class LazyFrame:
+    """
+    DataFrame-like object that only supports ``iloc`` indexing.
+
+    Columns are obtained from the table only when they are indexed, so that the
+    other columns of a spreadsheet do not have to be parsed.
+    """
+
+    def __init__(self, qtable: QMutableTable):
+        self._qtable = weakref.ref(qtable)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self._qtable()!r}>"
+
+    @property
+    def iloc(self) -> _LazyILocIndexer:
+        """Integer location based indexer."""
+        return _LazyILocIndexer(self._qtable())
+
+
+class _LazyILocIndexer:
+    def __init__(self, qtable: QMutableTable):
+        self._qtable = qtable
+
+    def __getitem__(self, key):
+        qtable = self._qtable
+        if not isinstance(key, tuple) or len(key) != 2:
+            return qtable.getDataFrame().iloc[key]
+        rkey, ckey = key
+        ncols = qtable.dataShapeRaw()[1]
+        if isinstance(ckey, slice):
+            columns = [qtable._get_data_column(i) for i in range(ncols)[ckey]]
+            if len(columns) == 0:
+                return qtable.getDataFrame().iloc[key]
+            return pd.concat(columns, axis=1).iloc[rkey, :]
+        try:
+            index = range(ncols)[ckey]
+        except TypeError:
+            return qtable.getDataFrame().iloc[key]
+        return qtable._get_data_column(index).iloc[rkey]
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import logging
 import ast
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Any
+import numpy as np
 from qtpy import QtWidgets as QtW, QtCore, QtGui
 from qtpy.QtCore import Qt, Signal
+from superqt.utils import QSignalDebouncer, thread_worker
 
 from tabulous._qt._toolbar._toolbutton import QColoredToolButton
 from tabulous._sort_filter_proxy import (
@@ -13,6 +15,7 @@ from tabulous._sort_filter_proxy import (
     ComposableFilter,
     ComposableSorter,
     ColumnFilter,
+    Facets,
 )
 from superqt import QEnumComboBox
 
@@ -71,7 +74,15 @@ class _QTransparentToolButton(QColoredToolButton):
 
 
 class _QHeaderSectionButton(_QTransparentToolButton, HeaderAnchorMixin):
-    pass
+    def setBusy(self, busy: bool) -> None:
+        """Show the button as busy while sorting/filtering is running."""
+        if busy:
+            self.setCursor(Qt.CursorShape.BusyCursor)
+            self._effect.setOpacity(1.0)
+        else:
+            self.setCursor(Qt.CursorShape.PointingHandCursor)
+            self._effect.setOpacity(self._opacity)
+        return None
 
 
 class QHeaderSortButton(_QHeaderSectionButton):
@@ -110,12 +121,14 @@ class QHeaderSortButton(_QHeaderSectionButton):
     def on_installed(self, table: QBaseTable, index: int):
         logger.debug(f"Installing sort button at index {index}")
 
-        def _sort():
+        def _sort(ascending: bool):
             f = table._proxy._obj
             if isinstance(f, ComposableSorter):
-                table._set_proxy(f.switch())
+                table._set_proxy_in_thread(f.compose(index, ascending), self.setBusy)
             elif f is None:
-                table._set_proxy(ComposableSorter({index}, True))
+                table._set_proxy_in_thread(
+                    ComposableSorter([index], ascending), self.setBusy
+                )
             else:
                 raise RuntimeError("Sort function is not a ComposableSorter.")
 
@@ -131,8 +144,8 @@ class QHeaderSortButton(_QHeaderSectionButton):
 
         f = table._proxy._obj
         if not isinstance(f, ComposableSorter):
-            f = ComposableSorter({index}, self.ascending())
-        table._set_proxy(f.compose(index))
+            f = ComposableSorter()
+        table._set_proxy(f.compose(index, self.ascending()))
         self.sortSignal.connect(_sort)
         self.resetSignal.connect(_reset)
         if _viewer := table.parentViewer():
@@ -162,9 +175,11 @@ class QHeaderFilterButton(_QHeaderSectionButton):
         def _filter(info: FilterInfo):
             f = table._proxy._obj
             if isinstance(f, ComposableFilter):
-                table._set_proxy(f.compose(index, info))
+                table._set_proxy_in_thread(f.compose(index, info), self.setBusy)
             elif f is None:
-                table._set_proxy(ComposableFilter({index: info}))
+                table._set_proxy_in_thread(
+                    ComposableFilter({index: info}), self.setBusy
+                )
             else:
                 raise RuntimeError("Current proxy is not a ComposableFilter.")
             # TODO: this is incompatible with undo/redo
@@ -186,7 +201,7 @@ class QHeaderFilterButton(_QHeaderSectionButton):
         f = table._proxy._obj
         if not isinstance(f, ComposableFilter):
             table._set_proxy(ComposableFilter())
-        column = table.model().df.columns[index]
+        column = table.model().columns[index]
         menu = _QFilterMenu(table._get_sub_frame(column), parent=self)
         self.setMenu(menu)
         menu._filter_widget.called.connect(_filter)
@@ -237,7 +252,7 @@ class _QFilterWidget(QtW.QWidget):
         self._string_edit = QtW.QLineEdit()
         self._value_edit.setFixedWidth(84)
         self._string_edit.setFixedWidth(84)
-        self._unique_select = QMultiCheckBoxes()
+        self._unique_select = QFacetChecklist()
         self._call_button = QtW.QPushButton("Apply")
         self._call_button.setToolTip("Apply filter to the column")
         self._reset_button = QtW.QPushButton("Reset")
@@ -255,7 +270,7 @@ class _QFilterWidget(QtW.QWidget):
         self._unique_select.setVisible(False)
         if val.requires_list:
             self._unique_select.setVisible(True)
-            self._unique_select.setChoices(self.fetch_unique())
+            self._unique_select.fetchFacets(self._ds)
         elif val.requires_number:
             self._value_edit.setVisible(True)
             self._value_edit.setFocus()
@@ -281,12 +296,6 @@ class _QFilterWidget(QtW.QWidget):
             arg = None
         return FilterInfo(ftype, arg)
 
-    def fetch_unique(self):
-        unique = self._ds.unique()
-        if len(unique) > 108:
-            raise ValueError("Too many unique values")
-        return unique
-
     def _setup_ui(self):
         _layout = QtW.QVBoxLayout()
         _layout.setContentsMargins(2, 2, 2, 2)
@@ -318,41 +327,170 @@ class _QFilterWidget(QtW.QWidget):
         self.setLayout(_layout)
 
 
-class QMultiCheckBoxes(QtW.QListWidget):
+class QFacetListModel(QtCore.QAbstractListModel):
+    """
+    List model of the unique values of a column with checkboxes.
+
+    Check states are stored in an array so that the model can be used for columns
+    with millions of unique values.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._facets: Facets | None = None
+        self._checked = np.zeros(0, dtype=bool)
+        self._shown = np.zeros(0, dtype=np.intp)  # facets shown after searching
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return self._shown.size
+
+    def data(
+        self, index: QtCore.QModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if not index.isValid() or self._facets is None:
+            return QtCore.QVariant()
+        i = self._shown[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{self._facets.labels.iat[i]} ({self._facets.counts[i]})"
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if self._checked[i]:
+                return Qt.CheckState.Checked
+            return Qt.CheckState.Unchecked
+        return QtCore.QVariant()
+
+    def setData(
+        self,
+        index: QtCore.QModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        self._checked[self._shown[index.row()]] = (
+            Qt.CheckState(value) == Qt.CheckState.Checked
+        )
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QtCore.QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def facets(self) -> Facets | None:
+        return self._facets
+
+    def setFacets(self, facets: Facets) -> None:
+        """Set new facets. All the check states are reset."""
+        self.beginResetModel()
+        self._facets = facets
+        self._checked = np.zeros(facets.counts.size, dtype=bool)
+        self._shown = np.arange(facets.counts.size)
+        self.endResetModel()
+        return None
+
+    def setSearchText(self, text: str) -> None:
+        """Only show the facets that contain the text."""
+        if self._facets is None:
+            return None
+        self.beginResetModel()
+        if text:
+            matched = self._facets.labels.str.contains(text, case=False, regex=False)
+            self._shown = np.flatnonzero(matched.to_numpy(dtype=bool))
+        else:
+            self._shown = np.arange(self._facets.counts.size)
+        self.endResetModel()
+        return None
+
+    def setAllChecked(self, checked: bool) -> None:
+        """Check or uncheck all the facets shown in the list."""
+        self._checked[self._shown] = checked
+        if self._shown.size > 0:
+            self.dataChanged.emit(
+                self.index(0), self.index(self._shown.size - 1),
+                [Qt.ItemDataRole.CheckStateRole],
+            )  # fmt: skip
+        return None
+
+    def checkedValues(self) -> list:
+        """List of the checked values."""
+        if self._facets is None:
+            return []
+        return self._facets.values[self._checked].tolist()
+
+
+class QFacetChecklist(QtW.QWidget):
+    """A searchable checklist of the unique values of a column with the counts."""
+
     def __init__(self, parent: QtW.QWidget = None):
         super().__init__(parent)
-        self.setSelectionMode(QtW.QAbstractItemView.SelectionMode.NoSelection)
-        self.horizontalScrollBar().setVisible(False)
-        self.setFixedHeight(120)
-        self._choices = []
-
-    def setChoices(self, choices: Sequence):
-        self.clear()
-        self._choices = choices
-        for c in choices:
-            text = repr(c)
-            item = QtW.QListWidgetItem()
-            self.addItem(item)
-            checkbox = QtW.QCheckBox(text)
-            checkbox.setChecked(False)
-            self.setItemWidget(item, checkbox)
+        self._search_edit = QtW.QLineEdit()
+        self._search_edit.setPlaceholderText("Search ...")
+        self._select_all = QtW.QCheckBox("Select all")
+        self._select_all.setToolTip("Check all the values shown in the list")
+        self._status = QtW.QLabel()
+        self._model = QFacetListModel(self)
+        self._list_view = QtW.QListView()
+        self._list_view.setModel(self._model)
+        self._list_view.setUniformItemSizes(True)
+        self._list_view.setFixedHeight(120)
+        self._list_view.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        self._source: pd.Series | None = None
+
+        _layout = QtW.QVBoxLayout()
+        _layout.setContentsMargins(0, 0, 0, 0)
+        _layout.addWidget(self._search_edit)
+        _layout.addWidget(self._select_all)
+        _layout.addWidget(self._list_view)
+        _layout.addWidget(self._status)
+        self.setLayout(_layout)
+
+        self._debouncer = QSignalDebouncer(parent=self)
+        self._debouncer.setTimeout(200)
+        self._debouncer.triggered.connect(self._on_search)
+        self._search_edit.textChanged.connect(lambda: self._debouncer.throttle())
+        self._select_all.clicked.connect(self._model.setAllChecked)
+
+    def fetchFacets(self, ds: pd.Series) -> None:
+        """Count the unique values of the series in another thread."""
+        if ds is self._source:
+            return None
+        self._source = ds
+        self._status.setText("Counting values ...")
+        self.setEnabled(False)
+        worker = thread_worker(Facets.from_series)(ds)
+        worker.returned.connect(lambda facets: self._on_fetched(ds, facets))
+        worker.errored.connect(lambda exc: self._on_errored(ds, exc))
+        worker.start()
         return None
 
-    def iter_items(self):
-        for i in range(self.count()):
-            yield self.item(i)
+    def _on_fetched(self, ds: pd.Series, facets: Facets) -> None:
+        if ds is not self._source:
+            return None  # stale result
+        self._model.setFacets(facets)
+        self._status.setText(f"{facets.counts.size} unique values")
+        self._status.setToolTip("")
+        self.setEnabled(True)
+        self._on_search()
+        return None
 
-    def value(self) -> list:
-        return [
-            self._choices[i]
-            for i in range(self.count())
-            if self.itemWidget(self.item(i)).isChecked()
-        ]
+    def _on_errored(self, ds: pd.Series, exc: Exception) -> None:
+        if ds is not self._source:
+            return None  # stale result
+        self._source = None  # values will be counted again in the next call
+        self._status.setText(f"Failed to count values ({type(exc).__name__})")
+        self._status.setToolTip(f"{type(exc).__name__}: {exc}")
+        self.setEnabled(True)
+        return None
 
-    if TYPE_CHECKING:
+    def _on_search(self) -> None:
+        self._model.setSearchText(self._search_edit.text())
+        self._select_all.setChecked(False)
+        return None
 
-        def itemWidget(self, item: QtW.QListWidgetItem) -> QtW.QCheckBox:
-            ...
+    def value(self) -> list:
+        """List of the checked values."""
+        return self._model.checkedValues()
 
 
 class QColumnFilterButton(_QTransparentToolButton):
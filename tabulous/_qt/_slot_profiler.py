@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import Callable, Iterable, TYPE_CHECKING
+
+from qtpy import QtWidgets as QtW, QtGui
+
+from tabulous._psygnal._profile import PROFILER
+from ._qt_const import MonospaceFontFamily
+
+if TYPE_CHECKING:
+    from tabulous._psygnal import InCellRangedSlot
+
+_HEADERS = ["Position", "Expression", "Calls", "Total (ms)", "Size"]
+
+
+class QSlotProfiler(QtW.QWidget):
+    """A viewer of the in-cell slot statistics sorted by the cumulative time."""
+
+    def __init__(self, get_slots: Callable[[], Iterable[InCellRangedSlot]]):
+        super().__init__()
+        self._get_slots = get_slots
+        self._table = QtW.QTableWidget(0, len(_HEADERS))
+        self._table.setHorizontalHeaderLabels(_HEADERS)
+        self._table.setEditTriggers(QtW.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table.verticalHeader().setVisible(False)
+        self._table.setFont(QtGui.QFont(MonospaceFontFamily))
+
+        self._toggle = QtW.QCheckBox("Profile")
+        self._toggle.setToolTip("Measure evaluation time of in-cell formulas")
+        self._toggle.setChecked(PROFILER.enabled)
+        self._refresh_button = QtW.QPushButton("Refresh")
+        self._clear_button = QtW.QPushButton("Clear")
+        self._refresh_button.setToolTip("Update the statistics")
+        self._clear_button.setToolTip("Clear all the statistics")
+
+        _layout = QtW.QVBoxLayout()
+        _layout.addWidget(self._table)
+        self.setLayout(_layout)
+
+        _footer = QtW.QWidget()
+        _footer_layout = QtW.QHBoxLayout()
+        _footer_layout.setContentsMargins(0, 0, 0, 0)
+        _footer_layout.addWidget(self._toggle)
+        _footer_layout.addWidget(self._refresh_button)
+        _footer_layout.addWidget(self._clear_button)
+        _footer.setLayout(_footer_layout)
+
+        _layout.addWidget(_footer)
+
+        self._toggle.toggled.connect(self._on_toggled)
+        self._refresh_button.clicked.connect(self.refresh)
+        self._clear_button.clicked.connect(self._on_clear)
+        self.setMinimumHeight(160)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Update the table with the current statistics."""
+        stats_list = PROFILER.get_stats(self._get_slots())
+        self._table.setRowCount(len(stats_list))
+        for r, stats in enumerate(stats_list):
+            texts = [
+                str(stats.pos),
+                stats.expr,
+                str(stats.ncalls),
+                f"{stats.total_time * 1000:.3f}",
+                str(stats.output_size),
+            ]
+            for c, text in enumerate(texts):
+                item = QtW.QTableWidgetItem(text)
+                if c == 1 and stats.error:
+                    item.setToolTip(stats.error)
+                self._table.setItem(r, c, item)
+        return None
+
+    def _on_toggled(self, checked: bool) -> None:
+        if checked:
+            PROFILER.enable()
+        else:
+            PROFILER.disable()
+        return None
+
+    def _on_clear(self) -> None:
+        PROFILER.clear()
+        return self.refresh()
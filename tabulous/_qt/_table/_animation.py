@@ -91,6 +91,7 @@ class CellColorAnimation(_CellAnimation):
             new_rect = self._get_rect(self._ranges[-1])
             self._draw_region = self._draw_region.united(new_rect)
             self._is_running = True
+            self._parent._update_role_plan()
             self._anim.setStartValue(0.0)
             self._anim.setEndValue(1.0)
             self._anim.start()
@@ -112,6 +113,7 @@ class CellColorAnimation(_CellAnimation):
         self._is_running = False
         self._ranges = MultiRectRange([])
         self._draw_region = QtGui.QRegion()
+        self._parent._update_role_plan()
 
     def contains(self, index: QtCore.QModelIndex) -> bool:
         """True if the index is in the current animation range."""
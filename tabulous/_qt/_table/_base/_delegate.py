@@ -28,13 +28,13 @@ class TableItemDelegate(QtW.QStyledItemDelegate):
         qtable_view: _QTableViewEnhanced = parent.parent()
         if qtable_view.model()._editable:
             model = qtable_view.model()
-            df = model.df
             row = index.row()
             col = index.column()
             font = QtGui.QFont(
                 qtable_view._font, int(qtable_view._font_size * qtable_view.zoom())
             )
-            if row >= df.shape[0] or col >= df.shape[1]:
+            nr, nc = model.shape
+            if row >= nr or col >= nc:
                 # out-of-bounds
                 line = qtable_view._create_eval_editor(moveto=(row, col))
                 line.setFont(font)
@@ -42,8 +42,8 @@ class TableItemDelegate(QtW.QStyledItemDelegate):
                 # the cell is clicked!
                 return None
 
-            dtype: np.dtype = df.dtypes.values[col]
-            value = df.iat[row, col]
+            dtype: np.dtype = model._df.dtypes.values[col]
+            value = model._value_at(row, col)
             if dtype == "category":
                 # use combobox for categorical data
                 dtype: CategoricalDtype
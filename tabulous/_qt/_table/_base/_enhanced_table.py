@@ -146,6 +146,7 @@ class _QTableViewEnhanced(QtW.QTableView):
         self.setFont(qfont)
         self.horizontalHeader().setFont(qfont)
         self.verticalHeader().setFont(qfont)
+        self._invalidate_size_hints()
         self._update_all()
 
     @property
@@ -182,6 +183,12 @@ class _QTableViewEnhanced(QtW.QTableView):
         self.verticalHeader().viewport().update()
         return None
 
+    def _invalidate_size_hints(self) -> None:
+        """Let the model know that the size hints are changed."""
+        if isinstance(model := self.model(), AbstractDataFrameModel):
+            model._invalidate_size_hints()
+        return None
+
     def _update_rect(self, rect: QtCore.QRect) -> None:
         rect.adjust(-2, -2, 2, 2)
         return self.viewport().update(rect)
@@ -217,7 +224,8 @@ class _QTableViewEnhanced(QtW.QTableView):
             _c0 = qtable._column_proxy.get_source_index(_c0)
             if slot := self._table_map.get_by_dest((_r0, _c0), None):
                 self._current_drawing_slot_ranges = slot.range.as_keys()
-                new_status_tip = f"<b><code>{slot.as_literal(dest=True)}</code></b>"
+                _literal = slot.as_literal_at((_r0, _c0), dest=True)
+                new_status_tip = f"<b><code>{_literal}</code></b>"
                 _need_update_all = True
             else:
                 self._current_drawing_slot_ranges = []
@@ -299,7 +307,7 @@ class _QTableViewEnhanced(QtW.QTableView):
 
     def selectAll(self) -> None:
         """Override selectAll slot to update custom selections."""
-        nr, nc = self.model().df.shape
+        nr, nc = self.model().shape
         if nr * nc > 0:
             self.set_selections([(slice(0, nr), slice(0, nc))])
         return None
@@ -537,6 +545,7 @@ class _QTableViewEnhanced(QtW.QTableView):
 
         # Update stuff
         self._zoom = value
+        self._invalidate_size_hints()
         font = self.font()
         font.setPointSize(int(self._font_size * value))
         self.setFont(font)
@@ -7,6 +7,7 @@ import numpy as np
 
 from tabulous._qt._action_registry import QActionRegistry
 from tabulous._qt._proxy_button import HeaderAnchorMixin, QColumnFilterButton
+from ._item_model import AbstractDataFrameModel
 
 if TYPE_CHECKING:
     from ._enhanced_table import _QTableViewEnhanced
@@ -59,6 +60,7 @@ class QDataFrameHeaderView(QtW.QHeaderView, QActionRegistry[int]):
     ) -> None:
         if logicalIndex < len(self._section_sizes):
             self._section_sizes[logicalIndex] = newSize
+            self._invalidate_size_hints()
         for idx, widget in self._header_widgets.items():
             if idx < logicalIndex:
                 continue
@@ -94,8 +96,15 @@ class QDataFrameHeaderView(QtW.QHeaderView, QActionRegistry[int]):
         """Draw the current index if exists."""
         raise NotImplementedError()
 
+    def _invalidate_size_hints(self) -> None:
+        """Let the model know that section sizes are changed."""
+        if isinstance(model := self.model(), AbstractDataFrameModel):
+            model._invalidate_size_hints()
+        return None
+
     def setZoomRatio(self, ratio: float):
         self._section_sizes *= ratio
+        self._invalidate_size_hints()
         self.sectionResized.disconnect(self._on_section_resized)
         try:
             for idx, size in enumerate(self._section_sizes):
@@ -110,6 +119,7 @@ class QDataFrameHeaderView(QtW.QHeaderView, QActionRegistry[int]):
         self._section_sizes = np.concatenate(
             [sz[:index], np.full(count, span), sz[index:]]
         )
+        self._invalidate_size_hints()
         return None
 
     def removeSection(self, index: int, count: int) -> None:
@@ -117,6 +127,7 @@ class QDataFrameHeaderView(QtW.QHeaderView, QActionRegistry[int]):
         self._section_sizes = np.delete(
             self._section_sizes, slice(index, index + count)
         )
+        self._invalidate_size_hints()
         return None
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
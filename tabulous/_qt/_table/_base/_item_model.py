@@ -1,14 +1,18 @@
 from __future__ import annotations
-from typing import Any, Callable, Hashable, TYPE_CHECKING, Iterable, cast
+from typing import Any, Callable, Hashable, TYPE_CHECKING, Iterable, NamedTuple, cast
+from functools import partial
 import warnings
 from qtpy import QtCore, QtGui, QtWidgets as QtW
 from qtpy.QtCore import Qt, Signal
+import numpy as np
 import pandas as pd
 
-from tabulous._dtype import isna
-from tabulous.color import normalize_color, ColorType
-from tabulous._text_formatter import DefaultFormatter
+from tabulous._dtype import isna, isna_array
+from tabulous.color import ColorType
+from tabulous._text_formatter import DefaultFormatter, format_values
 from tabulous._map_model import TableMapping
+from tabulous._display_cache import DisplayTextCache, ColumnColorCache
+from tabulous._colormap import map_colors
 from tabulous._utils import get_config
 from tabulous._qt._table._animation import CellColorAnimation
 
@@ -20,6 +24,13 @@ if TYPE_CHECKING:
 _READ_ONLY = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
 
 
+class _SizeHints(NamedTuple):
+    widths: list[int]
+    heights: list[int]
+    default_width: int
+    default_height: int
+
+
 class AbstractDataFrameModel(QtCore.QAbstractTableModel):
     """Table model for data frame."""
 
@@ -29,6 +40,8 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._df = pd.DataFrame([])
+        self._row_indexer: np.ndarray | None = None
+        self._df_shown: pd.DataFrame | None = None
 
         self._editable = False
         self._foreground_colormap: dict[Hashable, Callable[[Any], ColorType]] = {}
@@ -48,58 +61,192 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
 
         self._decorations: TableMapping[tuple[QtGui.QPixmap, str]] = TableMapping()
         self._background_color_anim = CellColorAnimation(self)
+        self._role_plan = self._data_role_map
+        self._size_hints: _SizeHints | None = None
+        self._display_cache = DisplayTextCache(
+            self._format_block,
+            max_bytes=lambda: get_config().table.display_cache_mb * 2**20,
+        )
+        self._foreground_color_cache = ColumnColorCache(
+            partial(self._map_colors, self._foreground_colormap),
+            nrows=lambda: self.shape[0],
+        )
+        self._background_color_cache = ColumnColorCache(
+            partial(self._map_colors, self._background_colormap),
+            nrows=lambda: self.shape[0],
+        )
+        self._update_role_plan()
 
     @property
     def df(self) -> pd.DataFrame:
-        return self._df
+        """
+        The data frame shown in the table.
+
+        If rows are sorted or filtered, the shown data frame is created from the
+        source data frame only when this property is requested. The model itself
+        renders cells through the row indexer.
+        """
+        if self._row_indexer is None:
+            return self._df
+        if self._df_shown is None:
+            self._df_shown = self._df.iloc[self._row_indexer]
+        return self._df_shown
+
+    @df.setter
+    def df(self, data: pd.DataFrame):
+        self.setDataSource(data)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the shown data."""
+        if self._row_indexer is None:
+            return self._df.shape
+        return self._row_indexer.size, self._df.shape[1]
+
+    @property
+    def shownIndex(self) -> pd.Index:
+        """Index of the shown data."""
+        if self._row_indexer is None:
+            return self._df.index
+        return self._df.index[self._row_indexer]
+
+    @property
+    def columns(self) -> pd.Index:
+        """Columns of the shown data."""
+        return self._df.columns
+
+    def setDataSource(self, data: pd.DataFrame, indexer: np.ndarray | None = None):
+        """Set the source data frame and the positions of the rows to be shown."""
+        self._df = data
+        self._row_indexer = indexer
+        self._invalidate_cache()
+
+    def sourceRows(self, r):
+        """Convert shown row positions to the positions in the source data."""
+        if self._row_indexer is None:
+            return r
+        return self._row_indexer[r]
+
+    def _value_at(self, r: int, c: int) -> Any:
+        return self._df.iat[self.sourceRows(r), c]
+
+    def _column_at(self, c: int, rows: slice) -> pd.Series:
+        return self._df.iloc[self.sourceRows(rows), c]
 
     def updateValue(self, r, c, val):
         # pandas warns but no problem
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            self._df.iloc[r, c] = val
+            self._df.iloc[self.sourceRows(r), c] = val
+        self._invalidate_cache(c)
+
+    def _invalidate_cache(self, c: int | slice | Iterable[int] | None = None) -> None:
+        """Invalidate cached texts and colors of columns `c` (all if None)."""
+        caches = [
+            self._display_cache,
+            self._foreground_color_cache,
+            self._background_color_cache,
+        ]
+        self._df_shown = None
+        if c is None:
+            for cache in caches:
+                cache.clear()
+            return None
+        if isinstance(c, slice):
+            columns = range(self.shape[1])[c]
+        elif np.ndim(c) == 0:
+            columns = [int(c)]
+        else:
+            columns = np.asarray(c).ravel().tolist()
+        for cache in caches:
+            cache.invalidate_columns(columns)
+        return None
 
     def data(
         self,
         index: QtCore.QModelIndex,
         role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole,
     ):
-        if not index.isValid():
-            return QtCore.QVariant()
-        if map := self._data_role_map.get(role, None):
+        if (map := self._role_plan.get(role, None)) and index.isValid():
             return map(index)
         return QtCore.QVariant()
 
+    def _update_role_plan(self) -> None:
+        """Update the map of roles that may return data other than QVariant()."""
+        _role_map = self._data_role_map
+        _inactive = set()
+        if not self._foreground_colormap:
+            _inactive.add(Qt.ItemDataRole.ForegroundRole)
+        if not self._background_colormap and not self._background_color_anim.is_running:
+            _inactive.add(Qt.ItemDataRole.BackgroundRole)
+        if not self._decorations:
+            _inactive.add(Qt.ItemDataRole.DecorationRole)
+        self._role_plan = {k: v for k, v in _role_map.items() if k not in _inactive}
+        return None
+
     def _data_display(self, index: QtCore.QModelIndex):
         """Display role."""
         r, c = index.row(), index.column()
-        df = self.df
-        if r < df.shape[0] and c < df.shape[1]:
-            val = df.iat[r, c]
-            colname = df.columns[c]
-            if isna(val):
-                text = "NA"
-            elif mapper := self._text_formatter.get(colname, None):
+        nr, nc = self.shape
+        if r < nr and c < nc:
+            return self._display_cache.get(r, c)
+        return QtCore.QVariant()
+
+    def _format_block(self, rows: slice, columns: slice) -> list[list[str]]:
+        """Format cells in the block (rows, columns) column by column."""
+        ncols = self.shape[1]
+        return [self._format_column(c, rows) for c in range(*columns.indices(ncols))]
+
+    def _format_column(self, c: int, rows: slice) -> list[str]:
+        """Format the cells of the c-th column in the row range."""
+        df = self._df
+        colname = df.columns[c]
+        column = self._column_at(c, rows)
+        mapper = self._text_formatter.get(colname, None)
+        if mapper is None:
+            mapper = _fmt = DefaultFormatter(df.dtypes.iloc[c])
+        else:
+            convert_value = self.parent().convertValue
+
+            def _fmt(val):
                 try:
-                    text = str(mapper(self.parent().convertValue(c, val)))
+                    return str(mapper(convert_value(c, val)))
                 except Exception:
-                    text = self._FORMAT_ERROR
-            else:
-                fmt = DefaultFormatter(df.dtypes[colname])
-                text = fmt(val)
-            return text
-        return QtCore.QVariant()
+                    return self._FORMAT_ERROR
+
+        if len(column) > 1 and hasattr(mapper, "format_array"):
+            if (texts := self._format_batch(mapper, column)) is not None:
+                return texts
+
+        values = column.array
+        texts: list[str] = []
+        for i in range(len(values)):
+            val = values[i]
+            texts.append("NA" if isna(val) else _fmt(val))
+        return texts
+
+    def _format_batch(self, formatter, column: pd.Series) -> list[str] | None:
+        """Format the column at once. Return None if failed."""
+        na = isna_array(column)
+        try:
+            if not na.any():
+                return format_values(formatter, column)
+            texts = np.full(len(column), "NA", dtype=object)
+            texts[~na] = format_values(formatter, column[~na])
+        except Exception:
+            return None
+        return texts.tolist()
 
     def _data_edit(self, index: QtCore.QModelIndex):
         """Edit role."""
         r, c = index.row(), index.column()
-        df = self.df
-        if r < df.shape[0] and c < df.shape[1]:
+        nr, nc = self.shape
+        if r < nr and c < nc:
             base_table = self.parent()
             if ref_expr := base_table._get_ref_expr(r, c):
                 return get_config().cell.ref_prefix + ref_expr
 
-            val = df.iat[r, c]
+            val = self._value_at(r, c)
             if isna(val):
                 text = "NA"
             else:
@@ -111,34 +258,36 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
         if not self._foreground_colormap:
             return QtCore.QVariant()
         r, c = index.row(), index.column()
-        df = self.df
-        if r < df.shape[0] and c < df.shape[1]:
-            colname = df.columns[c]
-            val = df.iat[r, c]
-            if mapper := self._foreground_colormap.get(colname, None):
-                # If mapper is given for the column, call it.
-                try:
-                    col = mapper(val)
-                    if col is None:
-                        if isna(val):
-                            return QtGui.QColor(Qt.GlobalColor.gray)
-                        return QtCore.QVariant()
-                    rgba = normalize_color(col)
-                except Exception as e:
-                    # since this method is called many times, errorous function should
-                    # be deleted from the mapper.
-                    self._foreground_colormap.pop(colname)
-                    raise e
-                return QtGui.QColor(*rgba)
-            if isna(val):
+        nr, nc = self.shape
+        if r < nr and c < nc:
+            if self._df.columns[c] in self._foreground_colormap:
+                # If mapper is given for the column, use the mapped colors.
+                if rgba := self._foreground_color_cache.get(r, c):
+                    return QtGui.QColor(*rgba)
+            if isna(self._value_at(r, c)):
                 return QtGui.QColor(Qt.GlobalColor.gray)
         return QtCore.QVariant()
 
+    def _map_colors(
+        self, colormaps: dict[Hashable, Callable[[Any], ColorType]], c: int, rows: slice
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Map the cells of the c-th column in the row range to RGBA colors."""
+        colname = self._df.columns[c]
+        try:
+            return map_colors(colormaps[colname], self._column_at(c, rows))
+        except Exception as e:
+            # since this method is called many times, errorous function should
+            # be deleted from the mapper.
+            colormaps.pop(colname)
+            self._update_role_plan()
+            raise e
+
     def _data_tooltip(self, index: QtCore.QModelIndex):
         r, c = index.row(), index.column()
-        if r < self.df.shape[0] and c < self.df.shape[1]:
-            val = self.df.iat[r, c]
-            dtype = self.df.dtypes.values[c]
+        nr, nc = self.shape
+        if r < nr and c < nc:
+            val = self._value_at(r, c)
+            dtype = self._df.dtypes.values[c]
             if ref_expr := self.parent()._get_ref_expr_by_dest(r, c):
                 ref = f"\nExpr: {ref_expr}"
             else:
@@ -156,22 +305,11 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
         if not self._background_colormap:
             return QtCore.QVariant()
         r, c = index.row(), index.column()
-        df = self.df
-        if r < df.shape[0] and c < df.shape[1]:
-            colname = df.columns[c]
-            if mapper := self._background_colormap.get(colname, None):
-                val = df.iat[r, c]
-                try:
-                    col = mapper(val)
-                    if col is None:
-                        return QtCore.QVariant()
-                    rgba = normalize_color(col)
-                except Exception as e:
-                    # since this method is called many times, errorous function should
-                    # be deleted from the mapper.
-                    self._background_colormap.pop(colname)
-                    raise e
-                return QtGui.QColor(*rgba)
+        nr, nc = self.shape
+        if r < nr and c < nc:
+            if self._df.columns[c] in self._background_colormap:
+                if rgba := self._background_color_cache.get(r, c):
+                    return QtGui.QColor(*rgba)
         return QtCore.QVariant()
 
     def _data_background_color_rendered(self, index: QtCore.QModelIndex):
@@ -188,20 +326,36 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
         return QtCore.QVariant()
 
     def _data_size_hint(self, index: QtCore.QModelIndex):
+        if (hints := self._size_hints) is None:
+            hints = self._size_hints = self._get_size_hints()
         r, c = index.row(), index.column()
-        tv = self.parent()._qtable_view
-        vsize = tv.verticalHeader()._section_sizes
-        hsize = tv.horizontalHeader()._section_sizes
-        if r < len(vsize):
-            lr = tv.verticalHeader()._section_sizes[r]
+        if r < len(hints.heights):
+            h = hints.heights[r]
         else:
-            lr = get_config().table.row_size
-        if c < len(hsize):
-            lc = tv.horizontalHeader()._section_sizes[c]
+            h = hints.default_height
+        if c < len(hints.widths):
+            w = hints.widths[c]
         else:
-            lc = get_config().table.column_size
+            w = hints.default_width
+        return QtCore.QSize(w, h)
+
+    def _get_size_hints(self) -> _SizeHints:
+        tv = self.parent()._qtable_view
         zoom = self.parent().zoom()
-        return QtCore.QSize(int(lc * zoom), int(lr * zoom))
+        vsize = tv.verticalHeader()._section_sizes
+        hsize = tv.horizontalHeader()._section_sizes
+        table_config = get_config().table
+        return _SizeHints(
+            widths=(hsize.astype(np.float64) * zoom).astype(np.int64).tolist(),
+            heights=(vsize.astype(np.float64) * zoom).astype(np.int64).tolist(),
+            default_width=int(table_config.column_size * zoom),
+            default_height=int(table_config.row_size * zoom),
+        )
+
+    def _invalidate_size_hints(self) -> None:
+        """Invalidate size hints. Must be called when sections are resized."""
+        self._size_hints = None
+        return None
 
     def set_cell_label(self, index: QtCore.QModelIndex, text: str | None):
         if text is None or text == "":
@@ -218,6 +372,7 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
             pixmap = qlabel.grab()
             qlabel.deleteLater()
             self._decorations[(index.row(), index.column())] = pixmap, text
+        self._update_role_plan()
         qtable_view = self.parent()._qtable_view
         qtable_view.update(index)
         return None
@@ -235,33 +390,34 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
         role: int = Qt.ItemDataRole.DisplayRole,
     ):
         if orientation == Qt.Orientation.Horizontal:
+            columns = self._df.columns
             if role == Qt.ItemDataRole.DisplayRole:
-                if section >= self.df.columns.size:
+                if section >= columns.size:
                     return None
-                if self.df.columns.nlevels == 1:
-                    text = str(self.df.columns[section])
+                if columns.nlevels == 1:
+                    text = str(columns[section])
                 else:
-                    text = "\n".join(map(str, self.df.columns[section]))
+                    text = "\n".join(map(str, columns[section]))
                 return text
             elif role == Qt.ItemDataRole.ToolTipRole:
-                if section < self.df.columns.size:
+                if section < columns.size:
                     return self._column_tooltip(section)
                 return None
 
         if orientation == Qt.Orientation.Vertical:
             if role == Qt.ItemDataRole.DisplayRole:
-                if section >= self.df.index.size:
+                if section >= self.shape[0]:
                     return None
-                text = str(self.df.index[section]) + " "
+                text = str(self._df.index[self.sourceRows(section)]) + " "
                 return text
             elif role == Qt.ItemDataRole.ToolTipRole:
-                if section < self.df.index.size:
-                    return str(self.df.index[section])
+                if section < self.shape[0]:
+                    return str(self._df.index[self.sourceRows(section)])
                 return None
 
     def _column_tooltip(self, section: int):
-        name = self.df.columns[section]
-        dtype = self.df.dtypes.values[section]
+        name = self._df.columns[section]
+        dtype = self._df.dtypes.values[section]
         return f"{name} (dtype: {dtype})"
 
     def rename_column(self, old_name: str, new_name: str):
@@ -381,19 +537,17 @@ class AbstractDataFrameModel(QtCore.QAbstractTableModel):
 class DataFrameModel(AbstractDataFrameModel):
     """A concrete model for a pandas DataFrame."""
 
-    @property
-    def df(self) -> pd.DataFrame:
-        return self._df
-
-    @df.setter
-    def df(self, data: pd.DataFrame):
-        if data is self._df:
+    def setDataSource(self, data: pd.DataFrame, indexer: np.ndarray | None = None):
+        if data is self._df and indexer is None and self._row_indexer is None:
             return
-        self.setShape(*data.shape)
-        self._df = data
+        if indexer is None:
+            self.setShape(*data.shape)
+        else:
+            self.setShape(indexer.size, data.shape[1])
+        return super().setDataSource(data, indexer)
 
     def rowCount(self, parent=None):
-        return self.df.shape[0]
+        return self.shape[0]
 
     def columnCount(self, parent=None):
-        return self.df.shape[1]
+        return self.shape[1]
@@ -259,7 +259,7 @@ class QVerticalHeaderLineEdit(_QHeaderLineEdit):
         return QtCore.QRect(left, top, width, height)
 
     def _get_pandas_axis(self) -> pd.Index:
-        return self._table.model().df.index
+        return self._table.model().shownIndex
 
     def _get_signal(self):
         return self._table.rowChangedSignal
@@ -282,7 +282,7 @@ class QHorizontalHeaderLineEdit(_QHeaderLineEdit):
         return QtCore.QRect(left, top, width, height)
 
     def _get_pandas_axis(self) -> pd.Index:
-        return self._table.model().df.columns
+        return self._table.model().columns
 
     def _get_signal(self):
         return self._table.columnChangedSignal
@@ -541,7 +541,7 @@ class QCellLiteralEdit(_QTableLineEdit):
             return None
 
         qtable = cast("QMutableTable", qtable_view.parentTable())
-        _df_filt = qtable_view.model().df
+        _shape_filt = qtable_view.model().shape
         _df_ori = qtable._data_raw
         rsl, csl = qtable_view._selection_model.ranges[-1]
         col_selected = len(qtable_view._selection_model._col_selection_indices) > 0
@@ -551,10 +551,10 @@ class QCellLiteralEdit(_QTableLineEdit):
                 "references from table selection."
             )
             return None
-        if rsl.stop is not None and rsl.stop > _df_filt.shape[0]:
-            rsl = slice(rsl.start, _df_filt.shape[0])
+        if rsl.stop is not None and rsl.stop > _shape_filt[0]:
+            rsl = slice(rsl.start, _shape_filt[0])
         rsl = qtable._proxy.get_source_slice(rsl)
-        table_range = RectRange.from_shape(_df_filt.shape)
+        table_range = RectRange.from_shape(_shape_filt)
 
         # out of border
         if not table_range.overlaps_with(RectRange(rsl, csl)):
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import sys
+from contextlib import contextmanager
 from functools import partial
 from typing import Any, Callable, TYPE_CHECKING, Iterable, Tuple, TypeVar, overload
 import warnings
@@ -10,6 +12,7 @@ from qtpy.QtCore import Signal, Qt
 import numpy as np
 import pandas as pd
 from collections_undo import fmt, arguments
+from superqt.utils import thread_worker
 
 from ._item_model import AbstractDataFrameModel
 from ._line_edit import (
@@ -17,16 +20,17 @@ from ._line_edit import (
     QVerticalHeaderLineEdit,
     QCellLiteralEdit,
 )
-from tabulous._sort_filter_proxy import SortFilterProxy, ColumnFilter
-from tabulous._dtype import isna
+from tabulous._sort_filter_proxy import SortFilterProxy, ColumnFilter, Composable
+from tabulous._dtype import isna, convert_array
 from tabulous._qt._undo import QtUndoManager, fmt_slice
 from tabulous._qt._svg import QColoredSVGIcon
 from tabulous._keymap import QtKeys, QtKeyMap
-from tabulous._utils import TabulousConfig
+from tabulous._utils import TabulousConfig, get_config
 from tabulous import _slice_op as _sl
 from tabulous._qt._action_registry import QActionRegistry
-from tabulous.types import ProxyType, ItemInfo, HeaderInfo, EvalInfo
+from tabulous.types import ProxyType, ItemInfo, HeaderInfo, EvalInfo, _IntArray
 from tabulous.exceptions import (
+    CellValueError,
     SelectionRangeError,
     TableImmutableError,
     UnreachableError,
@@ -47,6 +51,7 @@ if TYPE_CHECKING:
     from tabulous._qt._mainwindow import _QtMainWidgetBase
     from tabulous.types import SelectionType, _Sliceable
     from tabulous._psygnal import InCellRangedSlot
+    from superqt.utils import FunctionWorker
 
 logger = logging.getLogger("tabulous")
 
@@ -107,6 +112,8 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
         QActionRegistry.__init__(self)
 
         self._proxy = SortFilterProxy()
+        self._proxy_job: _ProxyJob | None = None
+        self._prepared_indexer: tuple[ProxyType, Any] | None = None
         self._column_proxy = ColumnFilter.identity()
         self._filtered_index: pd.Index | None = None
         self._filtered_columns: pd.Index | None = None
@@ -245,6 +252,10 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
     def _get_sub_frame(self, columns):
         return self.getDataFrame()[columns]
 
+    def _get_data_column(self, index: int) -> pd.Series:
+        """Return the column of the data at the index."""
+        return self.getDataFrame().iloc[:, index]
+
     def setDataFrame(self, df: pd.DataFrame) -> None:
         raise NotImplementedError()
 
@@ -322,6 +333,47 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
         """Convert value before updating DataFrame."""
         return value
 
+    def convertArray(self, c: int, values: pd.Series) -> pd.Series:
+        """Convert all the values of a column before updating DataFrame."""
+        return values
+
+    def _convert_column(
+        self, c: int, values: pd.Series
+    ) -> tuple[pd.Series, dict[int, Exception]]:
+        """
+        Convert and validate values of a column.
+
+        Returns the converted values and the map from the positions of invalid values
+        to the raised exceptions.
+        """
+        out, errors = convert_array(
+            values, partial(self.convertArray, c), partial(self.convertValue, c)
+        )
+        if not (0 <= c < len(self._filtered_columns)):
+            return out, errors
+        colname = self._filtered_columns[c]
+        if (validator := self.model()._validator.get(colname, None)) is None:
+            return out, errors
+
+        mask = np.ones(len(out), dtype=np.bool_)
+        mask[list(errors.keys())] = False
+        positions = np.flatnonzero(mask)
+        valid = out.iloc[positions]
+        if hasattr(validator, "validate_array"):
+            # batch validation first, then find the invalid values one by one
+            try:
+                validator.validate_array(valid)
+            except Exception:
+                pass
+            else:
+                return out, errors
+        for i, val in zip(positions.tolist(), valid.tolist()):
+            try:
+                validator(val)
+            except Exception as e:
+                errors[i] = e
+        return out, errors
+
     def _get_converter(self, c: int) -> Callable[[Any, Any], Any]:
         if 0 <= c < len(self._filtered_columns):
             colname = self._filtered_columns[c]
@@ -493,21 +545,64 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
             self._set_proxy(proxy)
         return None
 
+    def _set_proxy_in_thread(
+        self,
+        proxy: ProxyType,
+        busy: Callable[[bool], Any] | None = None,
+    ) -> None:
+        """
+        Set sort/filter proxy, computing the indexer in another thread.
+
+        Only large tables are processed in another thread. If the proxy is updated
+        before the computation finishes, the stale job is cancelled. ``busy`` will
+        be called with True when the job started and False when it finished.
+        """
+        self._cancel_proxy_job()
+        nrows = self.tableSlice().shape[0]
+        if not callable(proxy) or nrows < get_config().table.async_proxy_rows:
+            return self._set_proxy(proxy)
+        self._proxy_job = _ProxyJob(self, proxy, busy)
+        return self._proxy_job.start()
+
+    def _cancel_proxy_job(self) -> None:
+        """Cancel the pending sort/filter job if exists."""
+        if self._proxy_job is not None:
+            self._proxy_job.cancel()
+            self._proxy_job = None
+        return None
+
+    def _invalidate_proxy(self, r=None, c=None) -> None:
+        """Invalidate the proxy cache after the data at (r, c) are edited."""
+        self._proxy.invalidate(r, c)
+        if self._proxy_job is not None:
+            # resumed after the table is refreshed with the edited data
+            self._proxy_job.invalidate(r, c)
+        return None
+
     @_mgr.interface
     def _set_proxy(self, proxy: ProxyType):
         # NOTE: This method is also called when table needs initialization.
+        if proxy is not self._proxy:
+            # re-applying the current proxy after data changes keeps the pending job
+            self._cancel_proxy_job()
+        old_proxy = self._proxy
         self._proxy = SortFilterProxy(proxy)
+        if old_proxy.obj is not self._proxy.obj:
+            # cache of the inactive proxy will not be updated on data changes
+            old_proxy.invalidate()
         try:
-            df_filt = self._apply_proxy()
+            df, positions = self._apply_proxy()
         except Exception as e:
             # To avoid continuous error, set proxy to None.
             self._set_proxy(None)
             raise e
 
-        # update data
-        self.model().df = df_filt
-        self._filtered_index = df_filt.index
-        self._filtered_columns = df_filt.columns
+        # update data. Sorted/filtered rows are rendered through the positions, so
+        # that the data frame is not copied.
+        model = self.model()
+        model.setDataSource(df, positions)
+        self._filtered_index = model.shownIndex
+        self._filtered_columns = model.columns
 
         # update filter icon
         proxy_type = self._proxy.proxy_type
@@ -533,9 +628,18 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
 
         return self.refreshTable()
 
-    def _apply_proxy(self):
-        data_sliced = self.tableSlice()
-        return self._proxy.apply(data_sliced)
+    def _apply_proxy(self) -> tuple[pd.DataFrame, _IntArray | None]:
+        """Return the data frame to be shown and the positions of the shown rows."""
+        df, ref = self._proxy_source()
+        prepared, self._prepared_indexer = self._prepared_indexer, None
+        if prepared is not None and prepared[0] is self._proxy.obj:
+            # indexer is already computed in another thread
+            return df, self._proxy.set_indexer(prepared[1])
+        return df, self._proxy.get_positions(df, ref)
+
+    def _proxy_source(self) -> tuple[pd.DataFrame, Callable[[], pd.DataFrame] | None]:
+        """Return the data frame to be shown and the reference of the proxy."""
+        return self.tableSlice(), None
 
     @_set_proxy.server
     def _set_proxy(self, proxy: ProxyType):
@@ -559,12 +663,13 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
     @_mgr.interface
     def _set_column_filter(self, cfil: ColumnFilter):
         self._column_proxy = cfil
-        df_filt = self._column_proxy.apply(self.model().df)
+        model = self.model()
+        df_filt = self._column_proxy.apply(model._df)
 
         # update data
-        self.model().df = df_filt
-        self._filtered_index = df_filt.index
-        self._filtered_columns = df_filt.columns
+        model.setDataSource(df_filt, model._row_indexer)
+        self._filtered_index = model.shownIndex
+        self._filtered_columns = model.columns
 
         # update header widgets based on the column filter
         if self._column_proxy.last_indexer is not None:
@@ -618,6 +723,7 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
             if not callable(colormap):
                 raise TypeError("Cannot use non-callable objects as colormaps.")
             self.model()._foreground_colormap[name] = colormap
+        self.model()._update_role_plan()
         self.refreshTable()
         return None
 
@@ -635,6 +741,7 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
             if not callable(colormap):
                 raise TypeError("Cannot use non-callable objects as colormaps.")
             self.model()._background_colormap[name] = colormap
+        self.model()._update_role_plan()
         self.refreshTable()
         return None
 
@@ -727,11 +834,29 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
 
     def refreshTable(self, process: bool = False) -> None:
         """Refresh table view."""
+        self.model()._invalidate_cache()
         self._qtable_view._update_all()
         if process:
             QtW.QApplication.processEvents()
         return None
 
+    def _refresh_columns(self, c: int | slice | list[int]) -> None:
+        """Refresh table view after the data of columns `c` are updated."""
+        cfil = self._column_proxy
+        mask = cfil.mask
+        if cfil.is_identity():
+            self.model()._invalidate_cache(c)
+        elif (
+            mask is not None
+            and mask.size == self.tableSlice().shape[1]
+            and not np.any(mask[c])
+        ):
+            return None  # all the updated columns are hidden
+        else:
+            self.model()._invalidate_cache()
+        self._qtable_view._update_all()
+        return None
+
     def undoStackView(self, show: bool = True):
         """Show undo stack viewer."""
         out = self._mgr.widget()
@@ -864,7 +989,7 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
     ) -> None:
         """Move current index."""
         selection_model = self._selection_model
-        df_shape = self.model().df.shape
+        df_shape = self.model().shape
         table_shape = self.tableShape()
 
         if row is None:
@@ -1017,7 +1142,7 @@ class QBaseTable(QtW.QSplitter, QActionRegistry[Tuple[int, int]]):
         r = self._proxy.get_source_index(r)
         c = self._column_proxy.get_source_index(c)
         if slot := self._qtable_view._table_map.get_by_dest((r, c), None):
-            return slot.as_literal()
+            return slot.as_literal_at((r, c))
         return None
 
     def _delete_selected_highlights(self) -> None:
@@ -1059,6 +1184,7 @@ class QMutableTable(QBaseTable):
     columnChangedSignal = Signal(HeaderInfo)
     evaluatedSignal = Signal(EvalInfo)
     selectionChangedSignal = Signal()
+    batchEditingSignal = Signal(bool)
 
     _data_raw: pd.DataFrame
     NaN = np.nan
@@ -1068,6 +1194,7 @@ class QMutableTable(QBaseTable):
     ):
         super().__init__(parent, data)
         self._data_cache = None  # only used in SpreadSheet for now
+        self._batch_state: _BatchEditState | None = None
         self.model().dataEdited.connect(self.setDataFrameValue)
 
         # header editing signals
@@ -1125,9 +1252,10 @@ class QMutableTable(QBaseTable):
                 _old_value: pd.DataFrame
                 _old_value = _old_value.copy()  # this is needed for undo
 
-            if self._proxy.proxy_type != "none" or not self._column_proxy.is_identity():
-                # If table is filtered, the dataframe to be displayed is a different
-                # object so we have to update it as well.
+            if not self._column_proxy.is_identity():
+                # If columns are filtered, the dataframe to be displayed is a
+                # different object so we have to update it as well. Sorted or
+                # filtered rows are shown through the positions of the same object.
                 self.model().updateValue(r, c, _value)
 
             # emit item changed signal if value changed
@@ -1169,9 +1297,10 @@ class QMutableTable(QBaseTable):
 
             _old_value = data.iloc[r0, c0].copy()  # this is needed for undo
 
-            if self._proxy is not None or not self._column_proxy.is_identity():
-                # If table is filtered, the dataframe to be displayed is a different
-                # object so we have to update it as well.
+            if not self._column_proxy.is_identity():
+                # If columns are filtered, the dataframe to be displayed is a
+                # different object so we have to update it as well. Sorted or
+                # filtered rows are shown through the positions of the same object.
                 self.model().updateValue(r, c, _value)
 
             # emit item changed signal if value changed
@@ -1194,35 +1323,55 @@ class QMutableTable(QBaseTable):
 
     def _pre_set_array(self, r: slice, c: slice, _value: pd.DataFrame):
         """Convert input dataframe for setting to data[r, c]."""
+        errors: dict[tuple[int, int], Exception] = {}
         if _value.size == 1:
             v = _value.values[0, 0]
             _value = self._data_raw.iloc[r, c].copy()
             for _ic, _c in enumerate(range(c.start, c.stop)):
-                _convert_value = self._get_converter(_c)
-                for _ir, _r in enumerate(range(r.start, r.stop)):
-                    _value.iloc[_ir, _ic] = _convert_value(_c, v)
+                out, _errors = self._convert_column(_c, pd.Series([v]))
+                if _errors:
+                    for _r in range(r.start, r.stop):
+                        errors[(_r, _c)] = _errors[0]
+                else:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+                        _value.iloc[:, _ic] = out.iloc[0]
         else:
+            columns: list[pd.Series] = []
             for _ic, _c in enumerate(range(c.start, c.stop)):
-                _convert_value = self._get_converter(_c)
-                for _ir, _r in enumerate(range(r.start, r.stop)):
-                    _value.iloc[_ir, _ic] = _convert_value(_c, _value.iloc[_ir, _ic])
+                out, _errors = self._convert_column(_c, _value.iloc[:, _ic])
+                for _ir, e in _errors.items():
+                    errors[(r.start + _ir, _c)] = e
+                columns.append(out.reset_index(drop=True))
+            if not errors:
+                _new_value = pd.concat(columns, axis=1)
+                _new_value.index = _value.index
+                _new_value.columns = _value.columns
+                _value = _new_value
+        if errors:
+            raise CellValueError(dict(sorted(errors.items())))
         return _value
 
     @QBaseTable._mgr.undoable
     def _set_value(self, r, c, r_ori, c_ori, value, old_value):
         """Undoable set-value function."""
+        self._invalidate_proxy(r, c)
         self.updateValue(r, c, value)
-        self._data_cache = None
+        self._invalidate_data_cache(c)
         self._edited = True
         # update selection using the non-filtered index.
-        self.setSelections([(r_ori, c_ori)])
+        if self._batch_state is None:
+            self.setSelections([(r_ori, c_ori)])
+        elif not self._qtable_view._selection_model._is_blocked:
+            self._batch_state.selection = (r_ori, c_ori)
         self.itemChangedSignal.emit(ItemInfo(r, c, value, old_value))
         return None
 
     @_set_value.undo_def
     def _set_value(self, r, c, r_ori, c_ori, value, old_value):
+        self._invalidate_proxy(r, c)
         self.updateValue(r, c, old_value)
-        self._data_cache = None
+        self._invalidate_data_cache(c)
         self.setSelections([(r_ori, c_ori)])
         self.itemChangedSignal.emit(ItemInfo(r, c, old_value, value))
         return None
@@ -1238,14 +1387,61 @@ class QMutableTable(QBaseTable):
         old_value = args_old["old_value"]
         return arguments(r, c, r_ori, c_ori, value, old_value)
 
+    def _invalidate_data_cache(self, c: _Sliceable | None = None) -> None:
+        """Invalidate the data cache of columns `c` (all the columns if None)."""
+        self._data_cache = None
+        return None
+
     def updateValue(self, r, c, value):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             self._data_raw.iloc[r, c] = value
+        return self._refresh_updated_columns(c)
 
+    def _refresh_updated_columns(self, c) -> None:
+        """Refresh table view after data of columns `c` are edited."""
+        if self._batch_state is not None:
+            # refreshed at the end of batch editing
+            self._batch_state.add_columns(c, self._data_raw.shape[1])
+            return None
         if self._proxy.proxy_type != "none":
             self._set_proxy(self._proxy)
-        return self.refreshTable()
+            self.refreshTable()
+        else:
+            self._refresh_columns(c)
+        if self._proxy_job is not None:
+            self._proxy_job.resume()
+        return None
+
+    @contextmanager
+    def batchEditing(self, formatter: Callable[[list], str] | None = None):
+        """
+        Context manager to edit the table in a batch.
+
+        Data-changed signals are deferred until the end of the context, so that
+        in-cell formulas depending on the edited cells are evaluated only once. All
+        the edits are merged into one undo command and the table is refreshed once.
+        """
+        if self._batch_state is not None:  # already in batch editing
+            yield
+            return None
+
+        with self._mgr.merging(formatter):
+            self._batch_state = state = _BatchEditState()
+            self.batchEditingSignal.emit(True)
+            try:
+                yield
+            finally:
+                try:
+                    # formulas are evaluated here, still in the batch
+                    self.batchEditingSignal.emit(False)
+                finally:
+                    self._batch_state = None
+                    if state.columns:
+                        self._refresh_updated_columns(sorted(state.columns))
+                    if state.selection is not None:
+                        self.setSelections([state.selection])
+        return None
 
     def isEditable(self) -> bool:
         """Return the editability of the table."""
@@ -1340,10 +1536,10 @@ class QMutableTable(QBaseTable):
         elif size > 1 and (rlen, clen) != (dr, dc):
             # If selection is column-wide or row-wide, resize them
             model = self.model()
-            if rlen == model.df.shape[0]:
+            if rlen == model.shape[0]:
                 rrange = slice(0, dr)
                 rlen = dr
-            if clen == model.df.shape[1]:
+            if clen == model.shape[1]:
                 crange = slice(0, dc)
                 clen = dc
 
@@ -1367,7 +1563,8 @@ class QMutableTable(QBaseTable):
             )
 
         # update table
-        self.setDataFrameValue(rsel, csel, df)
+        with self.batchEditing(lambda cmds: cmds[-1].format()):
+            self.setDataFrameValue(rsel, csel, df)
         self.setSelections([sel])
 
         return None
@@ -1411,27 +1608,28 @@ class QMutableTable(QBaseTable):
             return None
         selections = self.selections()
         rsize, csize = self._data_raw.shape
-        for sel in selections:
-            # normalize selection range to non-None slices
-            rsel, csel = sel
-            rstart = 0 if rsel.start is None else rsel.start
-            rstop = rsize if rsel.stop is None else rsel.stop
-            cstart = 0 if csel.start is None else csel.start
-            cstop = csize if csel.stop is None else csel.stop
-            rsel = slice(rstart, rstop)
-            csel = slice(cstart, cstop)
-
-            nr = rstop - rstart
-            nc = cstop - cstart
-            dtypes = list(self._data_raw.dtypes.values[csel])
-            if nc <= len(dtypes):
-                df = pd.DataFrame(
-                    {
-                        c: pd.Series(np.full(nr, self.NaN), dtype=dtypes[c])
-                        for c in range(nc)
-                    },
-                )
-                self.setDataFrameValue(rsel, csel, df)
+        with self.batchEditing():
+            for sel in selections:
+                # normalize selection range to non-None slices
+                rsel, csel = sel
+                rstart = 0 if rsel.start is None else rsel.start
+                rstop = rsize if rsel.stop is None else rsel.stop
+                cstart = 0 if csel.start is None else csel.start
+                cstop = csize if csel.stop is None else csel.stop
+                rsel = slice(rstart, rstop)
+                csel = slice(cstart, cstop)
+
+                nr = rstop - rstart
+                nc = cstop - cstart
+                dtypes = list(self._data_raw.dtypes.values[csel])
+                if nc <= len(dtypes):
+                    df = pd.DataFrame(
+                        {
+                            c: pd.Series(np.full(nr, self.NaN), dtype=dtypes[c])
+                            for c in range(nc)
+                        },
+                    )
+                    self.setDataFrameValue(rsel, csel, df)
         return None
 
     def editHorizontalHeader(self, index: int) -> QHorizontalHeaderLineEdit:
@@ -1466,13 +1664,13 @@ class QMutableTable(QBaseTable):
 
         model = self.model()
 
-        colname = model.df.columns[index]
+        colname = model.columns[index]
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             model.rename_column(colname, value)
 
-            _rename_column(model.df, index, value)
+            _rename_column(model._df, index, value)
             c0 = self._column_proxy.get_source_index(index)
             self._filtered_columns = _rename_index(self._filtered_columns, c0, value)
             if constructor is None:
@@ -1498,7 +1696,7 @@ class QMutableTable(QBaseTable):
     def _set_horizontal_header_value(self, index: int, value: Any, constructor) -> Any:
         return arguments(
             index,
-            self.model().df.columns[index],
+            self.model().columns[index],
             constructor=as_constructor(self._data_raw.columns),
         )
 
@@ -1516,7 +1714,8 @@ class QMutableTable(QBaseTable):
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            _rename_row(self.model().df, index, value)
+            model = self.model()
+            _rename_row(model._df, model.sourceRows(index), value)
             r0 = self._proxy.get_source_index(index)
             self._filtered_index = _rename_index(self._filtered_index, r0, value)
             if constructor is None:
@@ -1542,7 +1741,7 @@ class QMutableTable(QBaseTable):
     def _set_vertical_header_value(self, index: int, value: Any, constructor):
         return arguments(
             index,
-            self.model().df.index[index],
+            self.model().shownIndex[index],
             constructor=as_constructor(self._data_raw.index),
         )
 
@@ -1590,6 +1789,106 @@ class QMutableSimpleTable(QMutableTable):
         return None
 
 
+class _BatchEditState:
+    """Changes deferred during batch editing."""
+
+    def __init__(self):
+        self.columns: set[int] = set()
+        self.selection: tuple[_Sliceable, _Sliceable] | None = None
+
+    def add_columns(self, c, ncols: int) -> None:
+        """Add edited columns."""
+        if isinstance(c, slice):
+            self.columns.update(range(ncols)[c])
+        elif np.ndim(c) == 0:
+            self.columns.add(int(c))
+        else:
+            self.columns.update(np.asarray(c).ravel().tolist())
+        return None
+
+
+class _ProxyJob:
+    """A job to compute the indexer of a sort/filter proxy in another thread."""
+
+    def __init__(
+        self,
+        table: QBaseTable,
+        proxy: ProxyType,
+        busy: Callable[[bool], Any] | None = None,
+    ):
+        self._table = table
+        self._proxy = proxy
+        self._busy = busy
+        self._worker: FunctionWorker | None = None
+        self._nrows = 0
+
+    def start(self) -> None:
+        """Start computing the indexer."""
+        # caches of the proxy object are updated in the thread so use a copy
+        if isinstance(self._proxy, Composable):
+            obj = self._proxy.copy()
+        else:
+            obj = self._proxy
+        df, ref = self._table._proxy_source()
+        if callable(ref):
+            ref = ref()
+        self._nrows = df.shape[0]
+        worker = thread_worker(SortFilterProxy(obj).compute_indexer)(df, ref)
+        worker.returned.connect(partial(self._on_returned, worker, obj))
+        worker.errored.connect(partial(self._on_errored, worker))
+        self._worker = worker
+        if self._busy is not None:
+            self._busy(True)
+        worker.start()
+        return None
+
+    def cancel(self) -> None:
+        """Cancel the job. The thread keeps running but the result is discarded."""
+        if self._worker is not None:
+            self._worker.quit()
+            self._worker = None
+            if self._busy is not None:
+                self._busy(False)
+        return None
+
+    def invalidate(self, r=None, c=None) -> None:
+        """Discard the running computation after the data at (r, c) are edited."""
+        self.cancel()
+        if isinstance(self._proxy, Composable):
+            self._proxy.invalidate(r, c)
+        return None
+
+    def resume(self) -> None:
+        """Start the job again if it was invalidated."""
+        if self._worker is None:
+            self.start()
+        return None
+
+    def _finish(self, worker: FunctionWorker) -> bool:
+        if worker is not self._worker:
+            return False  # stale job
+        self.cancel()
+        self._table._proxy_job = None
+        return True
+
+    def _on_returned(self, worker: FunctionWorker, obj: ProxyType, indexer) -> None:
+        if worker is self._worker and self._table.tableSlice().shape[0] != self._nrows:
+            # rows were inserted or removed during the computation
+            self.invalidate()
+            return self.start()
+        if self._finish(worker):
+            # swap the indexer in the main thread
+            self._table._prepared_indexer = (obj, indexer)
+            self._table._set_proxy(obj)
+        return None
+
+    def _on_errored(self, worker: FunctionWorker, exc: Exception) -> None:
+        if self._finish(worker):
+            # exceptions raised in a slot cannot be caught so send it to the handler
+            sys.excepthook(type(exc), exc, exc.__traceback__)
+        return None
+
+
 def _was_changed(val: Any, old_val: Any) -> bool:
     # NOTE pd.NA == x returns pd.NA, not False
     out = False
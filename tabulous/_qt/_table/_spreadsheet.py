@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Hashable
 import re
-from io import StringIO
 import warnings
 
 import numpy as np
@@ -14,11 +13,16 @@ from collections_undo import arguments
 
 from ._base import AbstractDataFrameModel, QMutableSimpleTable
 from ._animation import RowAnimation, ColumnAnimation
-from tabulous._dtype import get_converter, get_dtype, DTypeMap, DefaultValidator
+from tabulous._dtype import (
+    get_converter,
+    get_dtype,
+    parse_string_column,
+    DTypeMap,
+    DefaultValidator,
+)
 from tabulous._utils import TabulousConfig, get_config
-from tabulous.color import normalize_color
 from tabulous.types import ItemInfo
-from tabulous._text_formatter import DefaultFormatter
+from tabulous._text_formatter import DefaultFormatter, format_values
 from tabulous import _pd_index
 
 
@@ -41,6 +45,13 @@ class SpreadSheetModel(AbstractDataFrameModel):
         self._out_of_bound_color_cache: QtGui.QColor | None = None
         self._nrows, self._ncols = _FETCH_SIZE * 10, _FETCH_SIZE * 3
 
+    def _update_role_plan(self) -> None:
+        super()._update_role_plan()
+        # out-of-range cells are always shaded
+        _bg_role = Qt.ItemDataRole.BackgroundRole
+        self._role_plan[_bg_role] = self._data_role_map[_bg_role]
+        return None
+
     @property
     def _out_of_bound_color(self) -> QtGui.QColor:
         if self._out_of_bound_color_cache is not None:
@@ -58,14 +69,6 @@ class SpreadSheetModel(AbstractDataFrameModel):
         self._out_of_bound_color_cache = qcolor
         return qcolor
 
-    @property
-    def df(self) -> pd.DataFrame:  # NOTE: this returns a string data frame
-        return self._df
-
-    @df.setter
-    def df(self, data: pd.DataFrame):
-        self._df = data
-
     def rowCount(self, parent=None):
         return self._nrows
 
@@ -82,68 +85,79 @@ class SpreadSheetModel(AbstractDataFrameModel):
         self.setShape(self._nrows, _ncols)
         self._ncols = _ncols
 
-    def _data_display(self, index: QtCore.QModelIndex):
-        """Display role."""
-        r, c = index.row(), index.column()
-        df = self.df
-        if r < df.shape[0] and c < df.shape[1]:
-            val = df.iat[r, c]
-            colname = df.columns[c]
-            if mapper := self._text_formatter.get(colname, None):
-                _converter = get_converter(
-                    self._columns_dtype.get(colname, _STRING_DTYPE)
-                )
-                try:
-                    text = str(mapper(_converter(val)))
-                except Exception:
-                    text = self._FORMAT_ERROR
-            else:
-                text = str(val)
-            # Exponentially formatted float numbers are not displayed correctly.
-            if _EXP_FLOAT.match(text):
-                text = format(float(text), ".5e")
-            return text
-        return QtCore.QVariant()
+    def _format_column(self, c: int, rows: slice) -> list[str]:
+        """Format the cells of the c-th column in the row range."""
+        colname = self._df.columns[c]
+        values = self._column_at(c, rows).array
+        if mapper := self._text_formatter.get(colname, None):
+            _converter = get_converter(self._columns_dtype.get(colname, _STRING_DTYPE))
+            texts = None
+            if len(values) > 1 and hasattr(mapper, "format_array"):
+                texts = self._format_converted(mapper, values, _converter)
+            if texts is None:
+                texts = []
+                for i in range(len(values)):
+                    try:
+                        text = str(mapper(_converter(values[i])))
+                    except Exception:
+                        text = self._FORMAT_ERROR
+                    texts.append(text)
+        else:
+            texts = [str(values[i]) for i in range(len(values))]
+        # Exponentially formatted float numbers are not displayed correctly.
+        return [
+            format(float(text), ".5e") if _EXP_FLOAT.match(text) else text
+            for text in texts
+        ]
+
+    def _format_converted(self, formatter, values, converter) -> list[str] | None:
+        """Convert values cell by cell and format them at once."""
+        texts = [self._FORMAT_ERROR] * len(values)
+        indices: list[int] = []
+        converted: list[Any] = []
+        for i in range(len(values)):
+            try:
+                converted.append(converter(values[i]))
+            except Exception:
+                continue
+            indices.append(i)
+        if indices:
+            try:
+                formatted = format_values(formatter, pd.Series(converted))
+            except Exception:
+                return None
+            for i, text in zip(indices, formatted):
+                texts[i] = text
+        return texts
 
     def _data_background_color(self, index: QtCore.QModelIndex):
         r, c = index.row(), index.column()
-        df = self.df
-        if r < df.shape[0] and c < df.shape[1]:
-            colname = df.columns[c]
-            if mapper := self._background_colormap.get(colname, None):
-                val = df.iat[r, c]
-                try:
-                    col = mapper(val)
-                    if col is None:
-                        return QtCore.QVariant()
-                    rgba = normalize_color(col)
-                except Exception as e:
-                    # since this method is called many times, errorous function should
-                    # be deleted from the mapper.
-                    self._background_colormap.pop(colname)
-                    raise e
-                return QtGui.QColor(*rgba)
+        nr, nc = self.shape
+        if r < nr and c < nc:
+            if self._df.columns[c] in self._background_colormap:
+                if rgba := self._background_color_cache.get(r, c):
+                    return QtGui.QColor(*rgba)
         else:
             return self._out_of_bound_color  # add shade to the out-of-range cells
 
     def _column_tooltip(self, section: int):
-        name = self.df.columns[section]
+        name = self._df.columns[section]
         if dtype := self._columns_dtype.get(name, None):
             return f"{name} (dtype: {dtype})"
         else:
-            dtype = self.df.dtypes.values[section]
             return f"{name} (dtype: infer)"
 
     def _data_tooltip(self, index: QtCore.QModelIndex):
         r, c = index.row(), index.column()
-        if r < self.df.shape[0] and c < self.df.shape[1]:
-            val = self.df.iat[r, c]
-            name = self.df.columns[c]
+        nr, nc = self.shape
+        if r < nr and c < nc:
+            val = self._value_at(r, c)
+            name = self._df.columns[c]
             qtable = self.parent()
             r = qtable._proxy.get_source_index(r)
             c = qtable._proxy.get_source_index(c)
             if slot := qtable._qtable_view._table_map.get_by_dest((r, c), None):
-                ref = f"\nExpr: {slot.as_literal(dest=True)}"
+                ref = f"\nExpr: {slot.as_literal_at((r, c), dest=True)}"
                 if slot._current_error is not None:
                     ref += "\n" + slot.format_error()
             else:
@@ -199,6 +213,7 @@ class QSpreadSheet(QMutableSimpleTable):
                 )
 
         self._columns_dtype = DTypeMap()
+        self._column_cache: dict[int, pd.Series] = {}  # parsed columns
         super().__init__(parent, data)
         self._qtable_view.verticalHeader().setMinimumWidth(20)
         animate = cfg.window.animate
@@ -220,64 +235,61 @@ class QSpreadSheet(QMutableSimpleTable):
             ...
 
     def getDataFrame(self) -> pd.DataFrame:
+        data_raw = self._data_raw
         if self._data_cache is not None:
-            return self._data_cache
+            if self._data_cache.shape == data_raw.shape:
+                return self._data_cache
+            self._invalidate_data_cache()
         # Convert table data into a DataFrame with the optimal dtypes
-        _sep = "\t"
-        data_raw = self._data_raw
         if data_raw.shape[1] > 0:
-            val = data_raw.to_csv(sep=_sep, index=False)
-            buf = StringIO(val)
-            out: pd.DataFrame = pd.read_csv(
-                buf,
-                sep=_sep,
-                header=0,
-                na_values=["#ERROR"],
-                names=data_raw.columns,
-                **self._columns_dtype.as_pandas_kwargs(),
-            )
-            out.index = data_raw.index
+            # parsed columns are reused if cached
+            serieses = [self._get_data_column(i) for i in range(data_raw.shape[1])]
+            out = pd.concat(serieses, axis=1, copy=False)
             out.columns = data_raw.columns
         else:
             out = pd.DataFrame(index=data_raw.index, columns=[])
         self._data_cache = out
         return out
 
+    def _get_data_column(self, index: int) -> pd.Series:
+        """Return the parsed column at the index, reusing the cached one if exists."""
+        data_raw = self._data_raw
+        sr = self._column_cache.get(index, None)
+        if sr is None or sr.size != data_raw.shape[0]:
+            colname = data_raw.columns[index]
+            sr = parse_string_column(
+                data_raw.iloc[:, index], self._columns_dtype.get(colname, None)
+            )
+            self._column_cache[index] = sr
+        return sr
+
+    def _invalidate_data_cache(self, c: int | slice | None = None) -> None:
+        self._data_cache = None
+        if c is None:
+            self._column_cache.clear()
+        elif isinstance(c, slice):
+            for i in range(self._data_raw.shape[1])[c]:
+                self._column_cache.pop(i, None)
+        elif np.ndim(c) == 0:
+            self._column_cache.pop(int(c), None)
+        else:
+            for i in np.asarray(c).ravel().tolist():
+                self._column_cache.pop(i, None)
+        return None
+
     def _get_sub_frame(self, columns: list[str]) -> pd.DataFrame:
         """Parse and return a sub-frame of the table."""
         if self._data_cache is not None:
-            return self._data_cache[columns]
-        is_series = not isinstance(columns, list)
-        if is_series:
-            columns = [columns]
-        _sep = "\t"
-        data_raw = self._data_raw[columns]
-        _dtype_map = self._columns_dtype.copy()
-        _to_be_deleted = []
-        for key in _dtype_map:
-            if key not in columns:
-                _to_be_deleted.append(key)
-        for key in _to_be_deleted:
-            del _dtype_map[key]
-
-        val = data_raw.to_csv(sep=_sep, index=False)
-        buf = StringIO(val)
-        out: pd.DataFrame = pd.read_csv(
-            buf,
-            sep=_sep,
-            header=0,
-            na_values=["#ERROR"],
-            names=data_raw.columns,
-            **_dtype_map.as_pandas_kwargs(),
-        )
-        out.index = data_raw.index
-        if is_series:
-            out = out.iloc[:, 0]
-        return out
+            return self.getDataFrame()[columns]
+        if not isinstance(columns, list):
+            return parse_string_column(
+                self._data_raw[columns], self._columns_dtype.get(columns, None)
+            )
+        return self._columns_dtype.parse_frame(self._data_raw[columns])
 
     def dataShape(self) -> tuple[int, int]:
         """Shape of data."""
-        return self.model().df.shape
+        return self.model().shape
 
     def dataShown(self, parse: bool = False) -> pd.DataFrame:
         """Return the shown dataframe (consider filter)."""
@@ -307,7 +319,7 @@ class QSpreadSheet(QMutableSimpleTable):
         elif self._data_raw.columns.dtype.kind in "iuf":
             self._data_raw.columns = self._data_raw.columns.astype(str)
 
-        self._data_cache = None
+        self._invalidate_data_cache()
         self.setProxy(None)
         self.refreshTable()
         return
@@ -360,9 +372,7 @@ class QSpreadSheet(QMutableSimpleTable):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             self._data_raw.loc[index, columns] = val
-        if self._proxy.proxy_type != "none":
-            self._set_proxy(self._proxy)
-        return self.refreshTable()
+        return self._refresh_updated_columns(c)
 
     @setDataFrame.server
     def setDataFrame(self, data):
@@ -372,12 +382,8 @@ class QSpreadSheet(QMutableSimpleTable):
     def _setDataFrame_fmt(self, data: pd.DataFrame):
         return f"set new data of shape {data.shape}"
 
-    def _apply_proxy(self):
-        if self._proxy.proxy_type == "none":
-            row_filtered = self.tableSlice()
-        else:
-            row_filtered = self._proxy.apply(self.tableSlice(), ref=self.getDataFrame)
-        return self._column_proxy.apply(row_filtered)
+    def _proxy_source(self):
+        return self._column_proxy.apply(self.tableSlice()), self.getDataFrame
 
     __delete = object()
 
@@ -407,7 +413,7 @@ class QSpreadSheet(QMutableSimpleTable):
                 old_value,
             )
         )
-        self._data_cache = None
+        self._invalidate_data_cache()
         self._edited = True
         return None
 
@@ -538,8 +544,7 @@ class QSpreadSheet(QMutableSimpleTable):
             return None
         nr, nc = self._data_raw.shape
         self._data_raw = _pad_dataframe(self._data_raw, nrows, ncols)
-        if self._proxy.proxy_type != "none":
-            self._set_proxy(self._proxy)  # need update!
+        self._set_proxy(self._proxy)  # model needs the expanded data frame
         cfg = get_config()
 
         rspan, cspan = cfg.table.row_size, cfg.table.column_size
@@ -555,7 +560,7 @@ class QSpreadSheet(QMutableSimpleTable):
 
         self._qtable_view.verticalHeader().removeSection(nr, nrows)
         self._qtable_view.horizontalHeader().insertSection(nc, ncols)
-        self._data_cache = None
+        self._invalidate_data_cache()
         return None
 
     @QMutableSimpleTable._mgr.undoable
@@ -602,7 +607,7 @@ class QSpreadSheet(QMutableSimpleTable):
         @self._anim_row.connect
         def _on_finish():
             self._set_proxy(self._proxy)
-            self._data_cache = None
+            self._invalidate_data_cache()
             self._edited = True
 
             # update indices
@@ -684,7 +689,7 @@ class QSpreadSheet(QMutableSimpleTable):
 
         @self._anim_col.connect
         def _on_finish():
-            self._data_cache = None
+            self._invalidate_data_cache()
             self._edited = True
 
             # update indices
@@ -741,7 +746,7 @@ class QSpreadSheet(QMutableSimpleTable):
             self.setSelections(
                 [(slice(row, row + 1), slice(0, self._data_raw.shape[1]))]
             )
-            self._data_cache = None
+            self._invalidate_data_cache()
             self._edited = True
 
             self._process_remove_rows(row, count)
@@ -774,7 +779,7 @@ class QSpreadSheet(QMutableSimpleTable):
             model = self.model()
             hheader = self._qtable_view.horizontalHeader()
             for index in range(column, column + count):
-                colname = model.df.columns[index]
+                colname = model.columns[index]
                 self.setForegroundColormap(colname, None)
                 self.setBackgroundColormap(colname, None)
                 self.setTextFormatter(colname, None)
@@ -818,7 +823,7 @@ class QSpreadSheet(QMutableSimpleTable):
             self.setSelections(
                 [(slice(0, self._data_raw.shape[0]), slice(col, col + 1))]
             )
-            self._data_cache = None
+            self._invalidate_data_cache()
             self._edited = True
 
             self._process_remove_columns(col, count)
@@ -856,7 +861,7 @@ class QSpreadSheet(QMutableSimpleTable):
                 self.expandDataFrame(index - nrows + 1, 0)
             self._set_proxy(self._proxy)
             super().setVerticalHeaderValue(index, value)
-            self._data_cache = None
+            self._invalidate_data_cache()
 
         return None
 
@@ -874,7 +879,7 @@ class QSpreadSheet(QMutableSimpleTable):
             super().setHorizontalHeaderValue(index, value)
             if old_name in self._columns_dtype.keys():
                 self.setColumnDtype(value, self._columns_dtype.pop(old_name))
-            self._data_cache = None
+            self._invalidate_data_cache()
 
         return None
 
@@ -884,7 +889,7 @@ class QSpreadSheet(QMutableSimpleTable):
         if dtype is None:
             # delete cache if dtype used to be set
             if self._columns_dtype.pop(label, None):
-                self._data_cache = None
+                self._invalidate_data_cache(_get_loc_or_none(self._data_raw, label))
         else:
             if label not in self._data_raw.columns:
                 raise ValueError(f"Column {label!r} not found.")
@@ -892,8 +897,9 @@ class QSpreadSheet(QMutableSimpleTable):
             dtype = get_dtype(dtype)
             if self._columns_dtype.get(label, None) is not dtype:
                 self._columns_dtype[label] = dtype
-                self._data_cache = None
+                self._invalidate_data_cache(_get_loc_or_none(self._data_raw, label))
 
+        self.model()._invalidate_cache()
         if validator := self.model()._validator.get(label, None):
             if isinstance(validator, DefaultValidator):
                 self.model()._validator.pop(label)
@@ -984,6 +990,13 @@ def _pad_dataframe(df: pd.DataFrame, nr: int, nc: int, value: Any = "") -> pd.Da
     return df
 
 
+def _get_loc_or_none(df: pd.DataFrame, label: Hashable) -> int | slice | None:
+    """Get the column location of the label, or None if not found."""
+    if label in df.columns:
+        return df.columns.get_loc(label)
+    return None
+
+
 def _get_limit(a) -> int:
     if isinstance(a, int):
         amax = a
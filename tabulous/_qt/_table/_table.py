@@ -6,7 +6,7 @@ from collections_undo import arguments
 from tabulous.types import ItemInfo
 
 from ._base import QMutableSimpleTable, DataFrameModel
-from tabulous._dtype import get_converter
+from tabulous._dtype import get_converter, get_array_converter
 
 
 class QTableLayer(QMutableSimpleTable):
@@ -84,3 +84,8 @@ class QTableLayer(QMutableSimpleTable):
         """Convert value to the type of the table."""
         dtype = self._data_raw.dtypes.iloc[c]
         return get_converter(dtype)(value)
+
+    def convertArray(self, c: int, values: pd.Series) -> pd.Series:
+        """Convert all the values of a column to the type of the table."""
+        dtype = self._data_raw.dtypes.iloc[c]
+        return get_array_converter(dtype)(values)
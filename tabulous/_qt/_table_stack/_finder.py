@@ -214,7 +214,7 @@ class QFinderWidget(QtW.QWidget):
         pf = partial(self._match_method, qtable, text)
         self._current_iterator.shape = qtable.dataShape()
 
-        with qtable._mgr.merging(lambda cmd: f"Replace {text!r} to {text_after!r}"):
+        with qtable.batchEditing(lambda cmd: f"Replace {text!r} to {text_after!r}"):
             while True:
                 try:
                     r, c = self._current_iterator.next_until(pf)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import ast
+import builtins
+from functools import lru_cache
+from typing import Any, Mapping, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["CompiledQuery"]
+
+_CHUNK_SIZE = 1 << 16
+
+# "safe" builtin functions
+# fmt: off
+_BUILTINS = {
+    k: getattr(builtins, k)
+    for k in [
+        "int", "str", "float", "bool", "list", "tuple", "set", "dict", "range",
+        "slice", "frozenset", "len", "abs", "min", "max", "sum", "any", "all",
+        "divmod", "id", "bin", "oct", "hex", "hash", "iter", "isinstance",
+        "issubclass", "ord"
+    ]
+}
+# fmt: on
+
+# expressions only composed of these nodes are evaluated element-wise
+_ELEMENTWISE_NODES = (
+    ast.Expression, ast.Name, ast.Load, ast.Constant, ast.BinOp, ast.UnaryOp,
+    ast.Compare, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+    ast.Pow, ast.BitAnd, ast.BitOr, ast.BitXor, ast.Invert, ast.USub, ast.UAdd,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)  # fmt: skip
+
+# the subset of the element-wise expressions supported by numexpr
+_NUMEXPR_NODES = (
+    ast.Expression, ast.Name, ast.Load, ast.Constant, ast.BinOp, ast.UnaryOp,
+    ast.Compare, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.BitAnd,
+    ast.BitOr, ast.Invert, ast.USub, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt,
+    ast.GtE,
+)  # fmt: skip
+_NUMEXPR_DTYPES = frozenset(
+    np.dtype(t) for t in ["bool", "int32", "int64", "float32", "float64", "complex128"]
+)
+
+
+@lru_cache(maxsize=1)
+def _get_numexpr():
+    try:
+        import numexpr
+    except ImportError:
+        return None
+    return numexpr
+
+
+class CompiledQuery:
+    """
+    An expression compiled for evaluation on data frames.
+
+    The expression is parsed only once and only the referenced columns are read.
+    Element-wise expressions such as ``a > 1`` or ``(a + b) % 2 == 0`` are evaluated
+    in chunks of rows to bound the memory usage, using ``numexpr`` if installed.
+    Other expressions such as ``a > a.mean()`` are evaluated on the whole columns.
+
+    >>> query = CompiledQuery("(a < 4) & (b > 0)")
+    >>> mask = query(df)  # boolean array
+    """
+
+    def __init__(
+        self,
+        expr: str | ast.expr,
+        namespace: Mapping[str, Any] = {},
+        chunksize: int = _CHUNK_SIZE,
+    ):
+        if isinstance(expr, str):
+            tree = ast.parse(expr.strip(), mode="eval")
+        else:
+            tree = ast.fix_missing_locations(ast.Expression(body=expr))
+        self._expr = ast.unparse(tree)
+        self._code = compile(tree, "<query>", "eval")
+        self._names = {
+            node.id
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+        }
+        self._namespace = dict(namespace)
+        self._chunksize = chunksize
+        self._elementwise = _is_composed_of(
+            tree, _ELEMENTWISE_NODES, (int, float, complex, str)
+        )
+        self._numexpr_compatible = _is_composed_of(
+            tree, _NUMEXPR_NODES, (int, float, complex)
+        )
+        self.__name__ = f"filter<{self._expr!r}>"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self._expr!r}>"
+
+    @property
+    def expr(self) -> str:
+        """The expression string."""
+        return self._expr
+
+    def __call__(self, df: pd.DataFrame) -> np.ndarray:
+        """Evaluate the expression as a boolean mask of the rows."""
+        out = np.asarray(self.evaluate(df))
+        if out.ndim != 1:
+            raise TypeError("The expression must return a 1D array.")
+        elif out.dtype.kind != "b":
+            raise TypeError("The expression must return a boolean array.")
+        return out
+
+    def is_chunkable(self, df: pd.DataFrame) -> bool:
+        """True if the expression can be evaluated by chunks on the data frame."""
+        if not self._elementwise:
+            return False
+        for name in self._names:
+            if name in self._namespace:
+                if np.ndim(self._namespace[name]) != 0:
+                    return False
+            elif name not in df.columns or not isinstance(
+                getattr(df[name], "dtype", None), np.dtype
+            ):
+                return False  # unknown name, duplicated name or extension array
+        return True
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray | pd.Series | Any:
+        """Evaluate the expression on the data frame."""
+        if self.is_chunkable(df):
+            return self._eval_chunked(df)
+        ns: dict[str, Any] = {
+            name: df[name] for name in self._names if name in df.columns
+        }
+        ns.update(self._namespace)
+        ns["__builtins__"] = _BUILTINS
+        return eval(self._code, ns, {})
+
+    def _eval_chunked(self, df: pd.DataFrame) -> np.ndarray:
+        arrays: dict[str, Any] = {}
+        for name in self._names:
+            if name in self._namespace:
+                arrays[name] = self._namespace[name]
+            else:
+                arrays[name] = df[name].to_numpy()
+        ne = None
+        if self._numexpr_compatible and all(
+            np.asarray(arr).dtype in _NUMEXPR_DTYPES for arr in arrays.values()
+        ):
+            ne = _get_numexpr()
+
+        nrows = len(df)
+        out: np.ndarray | None = None
+        for start in range(0, max(nrows, 1), self._chunksize):
+            stop = min(start + self._chunksize, nrows)
+            local = {
+                name: arr[start:stop] if np.ndim(arr) > 0 else arr
+                for name, arr in arrays.items()
+            }
+            result = None
+            if ne is not None:
+                try:
+                    result = ne.evaluate(self._expr, local_dict=local, global_dict={})
+                except NotImplementedError:
+                    # numexpr supports bitwise operations only on booleans
+                    ne = None
+            if ne is None:
+                result = eval(self._code, {"__builtins__": _BUILTINS}, local)
+            result = np.asarray(result)
+            if result.ndim == 0:
+                return result  # constant expression
+            if out is None:
+                out = np.empty(nrows, dtype=result.dtype)
+            out[start:stop] = result
+        return out
+
+
+def _is_composed_of(
+    tree: ast.AST,
+    node_types: tuple[type[ast.AST], ...],
+    constant_types: tuple[type, ...],
+) -> bool:
+    for node in ast.walk(tree):
+        if not isinstance(node, node_types):
+            return False
+        if isinstance(node, ast.Compare) and len(node.ops) != 1:
+            return False  # chained comparison is not element-wise
+        if isinstance(node, ast.Constant) and not isinstance(
+            node.value, constant_types
+        ):
+            return False
+    return True
@@ -2,12 +2,22 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import ast
-from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Sequence, overload
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    NamedTuple,
+    Sequence,
+    overload,
+)
 import numpy as np
 from enum import Enum
 from functools import reduce
 from tabulous.types import ProxyType, _IntArray, _IntOrBoolArray
 from tabulous.exceptions import TableNotOrderedError
+from tabulous._ngram import TrigramIndex, is_literal
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -42,11 +52,18 @@ class SortFilterProxy:
             self._proxy_type = ProxyTypes.unknown
             self._is_ordered = False
         self._last_indexer = None
+        self._positions: _IntArray | None = None
+        self._inverse: _IntArray | None = None
 
     def __repr__(self) -> str:
         cname = type(self).__name__
         return f"{cname}<proxy_type={self.proxy_type}, obj={self._obj!r}>"
 
+    @property
+    def obj(self) -> ProxyType | None:
+        """The proxy object."""
+        return self._obj
+
     @property
     def proxy_type(self) -> ProxyTypes:
         """The proxy type."""
@@ -77,26 +94,94 @@ class SortFilterProxy:
             callable. If not given, ``df`` will be used. If a callable is given,
             it will be called to supply the reference dataframe.
         """
+        if (positions := self.get_positions(df, ref)) is None:
+            return df
+        return df.iloc[positions]
+
+    def get_positions(
+        self,
+        df: pd.DataFrame,
+        ref: pd.DataFrame | Callable[[], pd.DataFrame] | None = None,
+    ) -> _IntArray | None:
+        """
+        Get the positions of the rows of the dataframe to be shown.
+
+        Unlike ``apply``, the dataframe is not sliced. None is returned if the
+        proxy does nothing. Parameters are the same as ``apply``.
+        """
+        return self.set_indexer(self.compute_indexer(df, ref))
+
+    def compute_indexer(
+        self,
+        df: pd.DataFrame,
+        ref: pd.DataFrame | Callable[[], pd.DataFrame] | None = None,
+    ) -> _IntOrBoolArray | None:
+        """
+        Compute the indexer of the rows without updating the state of the proxy.
+
+        This method can be called in another thread, as long as the proxy object is
+        not used in other threads at the same time.
+        """
         sl = self._obj
         if sl is None:
-            return df
-        # get indexer
+            return None
         if callable(sl):
             if ref is None:
                 ref_input = df
             elif callable(ref):
                 ref_input = ref()
-            sl_filt = sl(ref_input)
-        else:
-            sl_filt = sl
+            else:
+                ref_input = ref
+            return sl(ref_input)
+        return sl
 
-        self._last_indexer = sl_filt
+    def set_indexer(self, sl: _IntOrBoolArray | None) -> _IntArray | None:
+        """Update the state with the indexer and return the positions of the rows."""
+        if sl is None:
+            return None
+        self._last_indexer = sl
+        self._positions = None
+        self._inverse = None
+        return self._get_positions(sl)
+
+    def _get_positions(self, sl: _IntOrBoolArray) -> _IntArray:
+        """Convert the indexer into integer positions and cache it."""
+        if self._positions is None:
+            if self._array_is_bool(sl):
+                self._positions = np.flatnonzero(sl)
+            else:
+                self._positions = np.asarray(sl, dtype=np.intp)
+        return self._positions
 
-        if self._array_is_bool(sl_filt):
-            df_filt = df[sl_filt]
-        else:
-            df_filt = df.iloc[sl_filt]
-        return df_filt
+    def _get_inverse(self, sl: _IntOrBoolArray) -> _IntArray:
+        """
+        Get the inverse of the positions and cache it.
+
+        ``inverse[i]`` is the row in the proxy of the i-th source row, or -1 if the
+        source row is not shown.
+        """
+        if self._inverse is None:
+            positions = self._get_positions(sl)
+            if self._array_is_bool(sl):
+                nsource = sl.size
+            elif positions.size > 0:
+                nsource = int(positions.max()) + 1
+            else:
+                nsource = 0
+            inverse = np.full(nsource, -1, dtype=np.intp)
+            # if a row appears more than once, the first one is used
+            inverse[positions[::-1]] = np.arange(positions.size - 1, -1, -1)
+            self._inverse = inverse
+        return self._inverse
+
+    def _get_indexer(self) -> _IntOrBoolArray:
+        sl = self._obj
+        if callable(sl):
+            if self._last_indexer is not None:
+                sl = self._last_indexer
+            else:
+                raise RuntimeError("Call apply first!")
+        return sl
 
     # fmt: off
     @overload
@@ -109,25 +194,42 @@ class SortFilterProxy:
 
     def get_source_index(self, r):
         """Get the source index of the row in the dataframe."""
-        sl = self._obj
-        if sl is None:
+        if self._obj is None:
             if isinstance(r, list):
                 r = np.array(r)
             r0 = r
         else:
-            if callable(sl):
-                if self._last_indexer is not None:
-                    sl = self._last_indexer
-                else:
-                    raise RuntimeError("Call apply first!")
-
-            if self._array_is_bool(sl):
-                sl = np.where(sl)[0]
-            r0 = sl[r]
+            r0 = self._get_positions(self._get_indexer())[r]
             if isinstance(r0, np.integer):
                 r0 = int(r0)
         return r0
 
+    # fmt: off
+    @overload
+    def get_proxy_index(self, r: int) -> int: ...
+    @overload
+    def get_proxy_index(self, r: list[int] | _IntArray) -> _IntArray: ...
+    # fmt: on
+
+    def get_proxy_index(self, r):
+        """
+        Get the index in the proxy of the source row. -1 if the row is not shown.
+
+        This is the inverse of ``get_source_index``.
+        """
+        if self._obj is None:
+            if isinstance(r, list):
+                r = np.array(r)
+            return r
+        inverse = self._get_inverse(self._get_indexer())
+        if np.ndim(r) == 0:
+            return int(inverse[r]) if 0 <= r < inverse.size else -1
+        r = np.asarray(r)
+        out = np.full(r.shape, -1, dtype=np.intp)
+        valid = (0 <= r) & (r < inverse.size)
+        out[valid] = inverse[r[valid]]
+        return out
+
     def get_source_slice(self, r: slice, force_single_row: bool = False) -> slice:
         """Get the source row slice in the dataframe."""
         if self.proxy_type is ProxyTypes.none:
@@ -158,17 +260,24 @@ class SortFilterProxy:
         # [True, False, True] cannot map 1 because it does not exist in the
         # filtered data.
         if self._array_is_bool(self._last_indexer):
-            _cumsum = np.cumsum(self._last_indexer)
-            return slice(max(_cumsum[start] - 1, 0), max(_cumsum[stop - 1], 0))
+            # positions of a filter are sorted
+            positions = self._get_positions(self._last_indexer)
+            _start = int(np.searchsorted(positions, start, side="right")) - 1
+            _stop = int(np.searchsorted(positions, stop - 1, side="right"))
+            return slice(max(_start, 0), max(_stop, 0))
         elif start == stop - 1:
-            indices = np.where(self._last_indexer == start)[0]
-            if len(indices) > 0:
-                idx = indices[0]
+            if (idx := self.get_proxy_index(start)) >= 0:
                 return slice(idx, idx + 1)
             raise ValueError(f"Cannot map slice {r} to source")
         else:
             raise TableNotOrderedError("Cannot map slice if proxy is not ordered.")
 
+    def invalidate(self, r=None, c=None) -> None:
+        """Invalidate the cache of the proxy object after data are edited."""
+        if isinstance(self._obj, Composable):
+            self._obj.invalidate(r, c)
+        return None
+
     def as_indexer(self, df: pd.DataFrame | None) -> _IntOrBoolArray | slice:
         sl = self._obj
         if sl is None:
@@ -341,6 +450,21 @@ class Composable(ABC):
     def is_identity(self) -> bool:
         """True if this instance is the identity mapping."""
 
+    def invalidate(self, r=None, c=None) -> None:
+        """Invalidate the cache for the rows `r` of columns `c` (all if None)."""
+
+
+class _ColumnMask(NamedTuple):
+    info: FilterInfo
+    name: Any
+    mask: np.ndarray
+
+
+class _ColumnCodes(NamedTuple):
+    name: Any
+    codes: _IntArray  # factorized codes. -1 for missing values.
+    uniques: pd.Index
+
 
 class ComposableFilter(Composable):
     def __init__(self, d: dict[int, FilterInfo] | None = None):
@@ -351,6 +475,15 @@ class ComposableFilter(Composable):
             self._dict = {}
         self.__name__ = "filter"
         self.__annotations__ = {"df": "pd.DataFrame", "return": np.ndarray}
+        # cached mask of each column and the rows to be re-evaluated
+        self._masks: dict[int, _ColumnMask] = {}
+        self._pending: dict[int, list] = {}
+        self._combined: np.ndarray | None = None
+        # factorized columns used for "isin" filters
+        self._codes: dict[int, _ColumnCodes] = {}
+        # trigram indices used for "contains" filters and the rows to be updated
+        self._ngrams: dict[int, Future[TrigramIndex]] = {}
+        self._ngram_pending: dict[int, list] = {}
 
     @classmethod
     def from_ast(cls, obj: ast.Compare, columns: pd.Index) -> Self:
@@ -370,17 +503,127 @@ class ComposableFilter(Composable):
         return cls({index: _info})
 
     def __call__(self, df: pd.DataFrame) -> np.ndarray:
-        series: list[pd.Series] = []
         if len(self._dict) == 0:
             return np.ones(len(df), dtype=bool)
-        for index, (type, arg) in self._dict.items():
-            fn = _FUNCTION_MAP[type]
-            series.append(np.asarray(fn(df.iloc[:, index], arg)))
-        return reduce(lambda x, y: x & y, series)
+        nrows = len(df)
+        full_update = self._combined is None or self._combined.size != nrows
+        updated_rows: list = []
+        for index, info in self._dict.items():
+            name = df.columns[index]
+            cached = self._masks.get(index)
+            if (
+                cached is None
+                or cached.info != info
+                or cached.name != name
+                or cached.mask.size != nrows
+            ):
+                mask = self._eval_column(df, index, info)
+                self._masks[index] = _ColumnMask(info, name, mask)
+                full_update = True
+            else:
+                # only update the edited rows
+                for rows in self._pending.get(index, []):
+                    cached.mask[rows] = _eval_filter(df, index, info, rows)
+                    updated_rows.append(rows)
+        self._pending.clear()
+
+        masks = [self._masks[index].mask for index in self._dict.keys()]
+        if full_update:
+            self._combined = reduce(lambda x, y: x & y, masks)
+        else:
+            for rows in updated_rows:
+                self._combined[rows] = reduce(
+                    lambda x, y: x & y, [mask[rows] for mask in masks]
+                )
+        return self._combined.copy()
+
+    def _eval_column(self, df: pd.DataFrame, index: int, info: FilterInfo):
+        """Evaluate the filter of a column. Some filters use the cached data."""
+        if info.type is FilterType.contains:
+            if (mask := self._eval_contains(df, index, info.arg)) is not None:
+                return mask
+        if info.type is not FilterType.isin:
+            return _eval_filter(df, index, info, slice(None))
+        name = df.columns[index]
+        cached = self._codes.get(index)
+        if cached is None or cached.name != name or cached.codes.size != len(df):
+            cached = _factorize_codes(name, df.iloc[:, index])
+            self._codes[index] = cached
+        return _isin_codes(cached, info.arg)
+
+    def _eval_contains(
+        self, df: pd.DataFrame, index: int, pattern: Any
+    ) -> np.ndarray | None:
+        """
+        Evaluate the "contains" filter using the trigram index.
+
+        The index is built in the background on the first call. None is returned if
+        the index is not available yet.
+        """
+        from pandas.api.types import is_object_dtype, is_string_dtype
+
+        series = df.iloc[:, index]
+        if not is_literal(pattern) or not (
+            is_object_dtype(series.dtype) or is_string_dtype(series.dtype)
+        ):
+            return None
+        name = df.columns[index]
+        future = self._ngrams.get(index)
+        if future is not None and not future.done():
+            return None
+        ngram = _future_result(future)
+        if ngram is None or not ngram.is_valid(name, len(df)):
+            self._ngrams[index] = TrigramIndex.build_async(name, series)
+            self._ngram_pending.pop(index, None)
+            return None
+        for rows in self._ngram_pending.pop(index, []):
+            ngram.update(rows, df.iloc[rows, index])
+        return ngram.contains(pattern)
+
+    def invalidate(self, r=None, c=None) -> None:
+        """Invalidate the cached masks for the rows `r` of columns `c`."""
+        if c is None:
+            self._masks.clear()
+            self._pending.clear()
+            self._codes.clear()
+            self._ngrams.clear()
+            self._ngram_pending.clear()
+            self._combined = None
+            return None
+        if isinstance(c, slice):
+            columns = range(*c.indices(max(self._masks.keys(), default=-1) + 1))
+        elif np.ndim(c) == 0:
+            columns = [int(c)]
+        else:
+            columns = np.asarray(c).ravel().tolist()
+        for index in columns:
+            self._codes.pop(index, None)
+            if r is None:
+                self._ngrams.pop(index, None)
+                self._ngram_pending.pop(index, None)
+            elif index in self._ngrams:
+                # trigram index is updated incrementally
+                self._ngram_pending.setdefault(index, []).append(r)
+            if r is None or index not in self._dict:
+                self._masks.pop(index, None)
+                self._pending.pop(index, None)
+            else:
+                self._pending.setdefault(index, []).append(r)
+        return None
 
     def copy(self) -> ComposableFilter:
         """Copy the filter object."""
-        return self.__class__(self._dict.copy())
+        new = self.__class__(self._dict.copy())
+        # masks are updated in-place so they must be copied
+        new._masks = {
+            k: _ColumnMask(cm.info, cm.name, cm.mask.copy())
+            for k, cm in self._masks.items()
+        }
+        new._pending = {k: v.copy() for k, v in self._pending.items()}
+        new._codes = self._codes.copy()
+        new._ngrams = self._ngrams.copy()
+        new._ngram_pending = {k: v.copy() for k, v in self._ngram_pending.items()}
+        return new
 
     def indices(self) -> set[int]:
         return set(self._dict.keys())
@@ -404,58 +647,183 @@ class ComposableFilter(Composable):
         return len(self._dict) == 0
 
 
+def _eval_filter(df: pd.DataFrame, index: int, info: FilterInfo, rows) -> np.ndarray:
+    fn = _FUNCTION_MAP[info.type]
+    return np.asarray(fn(df.iloc[rows, index], info.arg))
+
+
+def _future_result(future: Future[TrigramIndex] | None) -> TrigramIndex | None:
+    if future is None or future.cancelled() or future.exception() is not None:
+        return None
+    return future.result()
+
+
+def _factorize_codes(name, series: pd.Series) -> _ColumnCodes:
+    """Factorize a column. Categorical columns are not factorized again."""
+    import pandas as pd
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = np.asarray(series.cat.codes, dtype=np.intp)
+        return _ColumnCodes(name, codes, series.cat.categories)
+    codes, uniques = pd.factorize(series)
+    return _ColumnCodes(name, np.asarray(codes, dtype=np.intp), pd.Index(uniques))
+
+
+def _isin_codes(cc: _ColumnCodes, values) -> np.ndarray:
+    """Equivalent to ``series.isin(values)`` but values are only compared once."""
+    import pandas as pd
+
+    values = pd.Index(values)
+    # the last element is looked up by the missing values (code -1)
+    table = np.append(np.asarray(cc.uniques.isin(values), dtype=bool), values.hasnans)
+    return table[cc.codes]
+
+
+class Facets(NamedTuple):
+    """Unique values of a column and their counts in the descending order."""
+
+    values: pd.Index
+    counts: _IntArray
+    labels: pd.Series  # string representation of the values
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> Facets:
+        """Count the unique values of the series, including missing values."""
+        import pandas as pd
+
+        vc = series.value_counts(dropna=False)
+        vc = vc[vc > 0]  # unused categories
+        values = vc.index
+        labels = pd.Series(np.asarray(values.astype(str), dtype=object))
+        return cls(values, np.asarray(vc, dtype=np.intp), labels)
+
+
+class _SortKey(NamedTuple):
+    name: Any
+    codes: _IntArray  # factorized codes in the sorted order. -1 for missing values.
+    nunique: int
+
+    def as_key(self, ascending: bool) -> _IntArray:
+        """Integer key for lexsort. Missing values are always placed last."""
+        if ascending:
+            key = self.codes.copy()
+        else:
+            key = self.nunique - 1 - self.codes
+        key[self.codes < 0] = self.nunique
+        return key
+
+
 class ComposableSorter(Composable):
-    def __init__(self, columns: set[int] | None = None, ascending: bool = True):
+    def __init__(
+        self,
+        columns: Iterable[int] | None = None,
+        ascending: bool | Iterable[bool] = True,
+    ):
         if columns is None:
-            self._columns: set[int] = set()
+            columns = []
+        columns = list(columns)
+        if isinstance(ascending, bool):
+            ascending = [ascending] * len(columns)
         else:
-            assert isinstance(columns, set)
-            self._columns = columns
-        self._ascending = ascending
+            ascending = list(ascending)
+            if len(ascending) != len(columns):
+                raise ValueError("Length of 'ascending' must match the columns.")
+        # column index -> ascending. Left columns have higher priority.
+        self._keys: dict[int, bool] = dict(zip(columns, ascending))
+        self._cache: dict[int, _SortKey] = {}
 
     def __repr__(self) -> str:
         cname = type(self).__name__
-        return f"{cname}<{self._columns!r}, ascending={self._ascending}>"
-
-    def __call__(self, df: pd.DataFrame) -> pd.Series:
-        by: list[str] = [df.columns[i] for i in self._columns]
-        if len(by) == 1:
-            out = np.asarray(df[by[0]]).argsort()
-            if not self._ascending:
-                out = out[::-1]
-        else:
-            df_sub = df[by]
-            nr = len(df_sub)
-            df_sub.index = range(nr)
-            df_sub = df_sub.sort_values(by=by, ascending=self._ascending)
-            out = np.asarray(df_sub.index)
-        return out
+        return f"{cname}<{self._keys!r}>"
+
+    def __call__(self, df: pd.DataFrame) -> _IntArray:
+        keys = [
+            self._get_key(df, index).as_key(asc)
+            for index, asc in sorted(self._keys.items())
+        ]
+        if len(keys) == 0:
+            return np.arange(len(df))
+        elif len(keys) == 1:
+            return np.argsort(keys[0], kind="stable")
+        # the last key is the primary key in np.lexsort
+        return np.lexsort(keys[::-1])
+
+    def _get_key(self, df: pd.DataFrame, index: int) -> _SortKey:
+        """Get the cached sort key of the column, or create a new one."""
+        name = df.columns[index]
+        cached = self._cache.get(index)
+        if cached is None or cached.name != name or cached.codes.size != len(df):
+            cached = self._cache[index] = _factorize(name, df.iloc[:, index])
+        return cached
+
+    @property
+    def ascending(self) -> bool:
+        """True if all the keys are sorted in the ascending order."""
+        return all(self._keys.values())
 
     def copy(self) -> ComposableSorter:
-        return self.__class__(self._columns.copy(), self._ascending)
+        new = self.__class__(self._keys.keys(), self._keys.values())
+        # sort keys are not updated in-place so they can be shared
+        new._cache = self._cache.copy()
+        return new
 
     def indices(self) -> set[int]:
-        return self._columns.copy()
+        return set(self._keys.keys())
 
-    def compose(self, column: int):
+    def compose(self, column: int, ascending: bool | None = None):
         """Compose the sorter object."""
         new = self.copy()
-        new._columns.add(column)
+        if ascending is None:
+            ascending = self._keys.get(column, self.ascending)
+        new._keys[column] = ascending
         return new
 
     def decompose(self, column: int):
         """Decompose the filter object."""
         new = self.copy()
-        new._columns.remove(column)
+        new._keys.pop(column)
+        new._cache.pop(column, None)
         return new
 
-    def switch(self) -> ComposableSorter:
-        """New sorter with the reverse order."""
-        return self.__class__(self._columns, not self._ascending)
+    def switch(self, column: int | None = None) -> ComposableSorter:
+        """New sorter with the reverse order (only at the column if given)."""
+        new = self.copy()
+        for index, asc in self._keys.items():
+            if column is None or index == column:
+                new._keys[index] = not asc
+        return new
+
+    def invalidate(self, r=None, c=None) -> None:
+        """Invalidate the cached sort keys of columns `c`."""
+        if c is None:
+            self._cache.clear()
+        elif isinstance(c, slice):
+            for index in range(*c.indices(max(self._cache.keys(), default=-1) + 1)):
+                self._cache.pop(index, None)
+        else:
+            for index in np.atleast_1d(c).tolist():
+                self._cache.pop(index, None)
+        return None
 
     def is_identity(self) -> bool:
         """True if the sorter is the identity sorter."""
-        return len(self._columns) == 0
+        return len(self._keys) == 0
+
+
+def _factorize(name, series: pd.Series) -> _SortKey:
+    """Convert a column into integer codes that keep the order of the values."""
+    import pandas as pd
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # categories are sorted in the order of definition
+        codes = np.asarray(series.cat.codes, dtype=np.intp)
+        return _SortKey(name, codes, len(series.cat.categories))
+    try:
+        codes, uniques = pd.factorize(series, sort=True)
+    except TypeError:
+        # values are not comparable with each other (such as str and int)
+        codes, uniques = pd.factorize(series.astype(str), sort=True)
+    return _SortKey(name, np.asarray(codes, dtype=np.intp), len(uniques))
 
 
 class ColumnFilter:
@@ -467,6 +835,7 @@ class ColumnFilter:
         self._fn = fn
         self._name = name
         self._last_indexer = None
+        self._mask = None
 
     def __repr__(self) -> str:
         return f"ColumnFilter<{self._name}>"
@@ -476,19 +845,42 @@ class ColumnFilter:
         """If not None, columns[last_indexer] gives the filtered columns."""
         return self._last_indexer
 
+    @property
+    def mask(self) -> np.ndarray | None:
+        """If not None, the boolean mask of the source columns that are shown."""
+        return self._mask
+
     def prep_indexer(self, df: pd.DataFrame) -> _IntArray:
         """Prepare the indexer for the dataframe."""
         if self._last_indexer is None:
-            cols = self._fn(df.columns, df.dtypes)
-            self._last_indexer = np.array([df.columns.get_loc(c) for c in cols])
+            self._update_indexer(df)
         return self._last_indexer
 
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         if self.is_identity():
             return df
-        cols = self._fn(df.columns, df.dtypes)
-        self._last_indexer = np.array([df.columns.get_loc(c) for c in cols])
-        return df[cols]
+        return df.iloc[:, self._update_indexer(df)]
+
+    def _update_indexer(self, df: pd.DataFrame) -> _IntArray:
+        """
+        Update the indexer and the column mask.
+
+        The filter function may return the column labels or a boolean mask of the
+        columns. Labels are resolved by a single ``get_indexer`` call.
+        """
+        from tabulous._pd_index import get_indexer
+
+        out = self._fn(df.columns, df.dtypes)
+        if isinstance(out, np.ndarray) and out.dtype.kind == "b":
+            mask = out
+            indexer = np.flatnonzero(mask)
+        else:
+            indexer = get_indexer(df.columns, out)
+            mask = np.zeros(len(df.columns), dtype=bool)
+            mask[indexer] = True
+        self._last_indexer = indexer
+        self._mask = mask
+        return indexer
 
     # fmt: off
     @overload
@@ -508,28 +900,28 @@ class ColumnFilter:
     @classmethod
     def startswith(cls, prefix: str) -> ColumnFilter:
         return cls(
-            lambda x, y: x[x.str.startswith(prefix)],
+            lambda x, y: np.asarray(x.str.startswith(prefix), dtype=bool),
             name=f"startswith {prefix!r}",
         )
 
     @classmethod
     def endswith(cls, suffix: str) -> ColumnFilter:
         return cls(
-            lambda x, y: x[x.str.endswith(suffix)],
+            lambda x, y: np.asarray(x.str.endswith(suffix), dtype=bool),
             name=f"endswith {suffix!r}",
         )
 
     @classmethod
     def contains(cls, substr: str) -> ColumnFilter:
         return cls(
-            lambda x, y: x[x.str.contains(substr)],
+            lambda x, y: np.asarray(x.str.contains(substr), dtype=bool),
             name=f"contains {substr!r}",
         )
 
     @classmethod
     def regex(cls, pattern: str) -> ColumnFilter:
         return cls(
-            lambda x, y: x[x.str.match(pattern)],
+            lambda x, y: np.asarray(x.str.match(pattern), dtype=bool),
             name=f"regex {pattern!r}",
         )
 
@@ -540,7 +932,7 @@ class ColumnFilter:
             if not isinstance(n, str):
                 raise TypeError(f"Invalid item type of {n!r}: {type(n)}")
         return cls(
-            lambda x, y: x[x.isin(items)],
+            lambda x, y: np.asarray(x.isin(items), dtype=bool),
             name=f"isin {items!r}",
         )
 
@@ -550,19 +942,19 @@ class ColumnFilter:
 
     @classmethod
     def is_numeric(cls) -> ColumnFilter:
-        return cls(lambda x, y: x[[[y0.kind in "uifc" for y0 in y]]])
+        return cls(lambda x, y: _dtype_mask(y, "uifc"))
 
     @classmethod
     def is_temporal(cls) -> ColumnFilter:
-        return cls(lambda x, y: x[[[y0.kind in "Mm" for y0 in y]]])
+        return cls(lambda x, y: _dtype_mask(y, "Mm"))
 
     @classmethod
     def is_bool(cls) -> ColumnFilter:
-        return cls(lambda x, y: x[[[y0.kind == "b" for y0 in y]]])
+        return cls(lambda x, y: _dtype_mask(y, "b"))
 
     @classmethod
     def is_categorical(cls) -> ColumnFilter:
-        return cls(lambda x, y: x[[[y0.kind == "O" for y0 in y]]])
+        return cls(lambda x, y: _dtype_mask(y, "O"))
 
     @classmethod
     def identity(cls) -> ColumnFilter:
@@ -574,3 +966,8 @@ class ColumnFilter:
 
 def _identity(x, y):
     return x
+
+
+def _dtype_mask(dtypes: pd.Series, kinds: str) -> np.ndarray:
+    kinds_iter = (dtype.kind in kinds for dtype in dtypes)
+    return np.fromiter(kinds_iter, dtype=bool, count=len(dtypes))
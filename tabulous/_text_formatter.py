@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Any, TYPE_CHECKING
+from typing import Callable, Any, Sequence, TYPE_CHECKING
 from enum import Enum, auto
 from qtpy import QtWidgets as QtW
 from qtpy.QtCore import Qt
@@ -55,6 +55,129 @@ _DEFAULT_FORMATTERS: dict[str, Callable[[Any], str]] = {
 }
 
 
+def _format_by_mask(
+    values: np.ndarray, mask: np.ndarray, fmt_true: str, fmt_false: str
+) -> np.ndarray:
+    """Format values with `fmt_true` where mask is true, otherwise `fmt_false`."""
+    out = np.empty(values.size, dtype=object)
+    out[mask] = [fmt_true % v for v in values[mask].tolist()]
+    out[~mask] = [fmt_false % v for v in values[~mask].tolist()]
+    return out
+
+
+def _is_decimal(values: np.ndarray, ndigits: int) -> np.ndarray:
+    absval = np.abs(values)
+    return (0.1 <= absval) & (absval < 10 ** (ndigits + 1)) | (values == 0)
+
+
+def _format_float_array(values: np.ndarray, ndigits: int = 4) -> np.ndarray:
+    """Vectorized version of ``_format_float``."""
+    mask = _is_decimal(values, ndigits)
+    return _format_by_mask(values, mask, f"%.{ndigits}f", f"%.{ndigits-1}e")
+
+
+def _format_int_array(values: np.ndarray, ndigits: int = 4) -> np.ndarray:
+    """Vectorized version of ``_format_int``."""
+    mask = _is_decimal(values, ndigits)
+    return _format_by_mask(values, mask, "%d", f"%.{ndigits-1}e")
+
+
+def _format_complex_array(values: np.ndarray, ndigits: int = 3) -> np.ndarray:
+    """Vectorized version of ``_format_complex``."""
+    mask = _is_decimal(values, ndigits)
+    fmt_dec = f"%.{ndigits}f%+.{ndigits}fj"
+    fmt_exp = f"%.{ndigits-1}e%+.{ndigits-1}ej"
+    out = np.empty(values.size, dtype=object)
+    out[mask] = [fmt_dec % (v.real, v.imag) for v in values[mask].tolist()]
+    out[~mask] = [fmt_exp % (v.real, v.imag) for v in values[~mask].tolist()]
+    return out
+
+
+def _format_datetime_array(values: np.ndarray) -> np.ndarray:
+    """Vectorized version of ``str(pd.Timestamp)``."""
+    values = values.astype("datetime64[ns]", copy=False)
+    subsec = values.view(np.int64) % 1_000_000_000
+    out = np.empty(values.size, dtype=object)
+    # sub-second part is shown only if it is not zero, in us or ns resolution.
+    for unit, mask in [
+        ("s", subsec == 0),
+        ("us", (subsec != 0) & (subsec % 1000 == 0)),
+        ("ns", subsec % 1000 != 0),
+    ]:
+        if mask.any():
+            strs = np.datetime_as_string(values[mask], unit=unit).tolist()
+            out[mask] = [s.replace("T", " ") for s in strs]
+    out[np.isnat(values)] = "NaT"
+    return out
+
+
+_DAY_NS = 86400 * 1_000_000_000
+
+
+def _format_timedelta_array(values: np.ndarray) -> np.ndarray:
+    """Vectorized version of ``str(pd.Timedelta)``."""
+    values = values.astype("timedelta64[ns]", copy=False)
+    ns = values.view(np.int64)
+    days, rem = np.divmod(ns, _DAY_NS)
+    sec, subsec = np.divmod(rem, 1_000_000_000)
+    hours, sec = np.divmod(sec, 3600)
+    minutes, sec = np.divmod(sec, 60)
+    out = np.array(
+        [
+            f"{d} days{' +' if n < 0 else ' '}{h:02}:{m:02}:{s:02}{_subsec_str(ss)}"
+            for n, d, h, m, s, ss in zip(
+                ns.tolist(),
+                days.tolist(),
+                hours.tolist(),
+                minutes.tolist(),
+                sec.tolist(),
+                subsec.tolist(),
+            )
+        ],
+        dtype=object,
+    )
+    out[np.isnat(values)] = "NaT"
+    return out
+
+
+def _subsec_str(subsec: int) -> str:
+    if subsec == 0:
+        return ""
+    elif subsec % 1000 == 0:
+        return f".{subsec // 1000:06}"
+    return f".{subsec:09}"
+
+
+_DEFAULT_ARRAY_FORMATTERS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "u": _format_int_array,
+    "i": _format_int_array,
+    "f": _format_float_array,
+    "c": _format_complex_array,
+    "M": _format_datetime_array,
+    "m": _format_timedelta_array,
+}
+
+
+def format_values(formatter: Callable[[Any], str], values: pd.Series) -> list[str]:
+    """
+    Format all the values using the formatter.
+
+    If the formatter has a ``format_array`` method, it is called with the values
+    at once and should return a sequence of strings of the same length. Otherwise
+    the formatter is called for each value.
+    """
+    if (_format_array := getattr(formatter, "format_array", None)) is None:
+        return [str(formatter(val)) for val in values.array]
+    texts = _format_array(values)
+    if len(texts) != len(values):
+        raise ValueError(
+            f"format_array returned {len(texts)} strings for {len(values)} values."
+        )
+    if isinstance(texts, np.ndarray):
+        return [str(text) for text in texts.tolist()]
+    return [str(text) for text in texts]
+
+
 class DefaultFormatter:
     """
     The default formatter function.
@@ -66,10 +189,21 @@ class DefaultFormatter:
     def __init__(self, dtype: Any):
         self._dtype = get_dtype(dtype)
         self._formatter = _DEFAULT_FORMATTERS.get(self._dtype.kind, str)
+        self._array_formatter = _DEFAULT_ARRAY_FORMATTERS.get(self._dtype.kind, None)
 
     def __call__(self, value: Any) -> None:
         return self._formatter(value)
 
+    def format_array(self, values: pd.Series) -> Sequence[str]:
+        """Format all the values at once."""
+        if (
+            self._array_formatter is not None
+            and isinstance(values.dtype, np.dtype)
+            and values.dtype.kind == self._dtype.kind
+        ):
+            return self._array_formatter(values.to_numpy())
+        return [self._formatter(val) for val in values.array]
+
     def __repr__(self) -> str:
         return f"DefaultFormatter[{self._dtype.name}]"
 
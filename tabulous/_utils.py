@@ -181,6 +181,9 @@ class Table:
     font_size: int = 10
     row_size: int = 28
     column_size: int = 100
+    display_cache_mb: int = 32
+    async_proxy_rows: int = 1000000
+    ngram_index_mb: int = 256
 
 
 @dataclass
@@ -189,6 +192,7 @@ class Cell:
 
     eval_prefix: str = "="
     ref_prefix: str = "&="
+    eval_workers: int = 1
 
 
 @dataclass
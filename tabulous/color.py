@@ -1,11 +1,15 @@
 from __future__ import annotations
-from typing import Any, NamedTuple
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple, TYPE_CHECKING
 from functools import lru_cache
 import colorsys
 from tabulous.types import ColorType, ColorMapping
 
 import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ColorTuple(NamedTuple):
     """8-bit color tuple."""
@@ -133,15 +137,55 @@ def rgba_to_str(rgba: tuple[int, int, int, int]) -> str:
     return color_name
 
 
-class ConvertedColormap:
+def map_rgba_array(cmap: ColorMapping, values: pd.Series) -> np.ndarray:
+    """
+    Map values to a (N, 4) float array of RGBA colors.
+
+    If the colormap has a ``map_array`` method, all the values are mapped at once.
+    Otherwise the colormap is called for each value. Rows of NaN mean that the
+    colormap returned None.
+    """
+    if (map_array := getattr(cmap, "map_array", None)) is not None:
+        rgba = np.asarray(map_array(values), dtype=np.float64)
+        if rgba.shape != (len(values), 4):
+            if rgba.shape != (len(values), 3):
+                raise ValueError(
+                    f"map_array must return an array of shape (N, 3) or (N, 4), "
+                    f"got {rgba.shape}."
+                )
+            rgba = np.concatenate([rgba, np.full((len(values), 1), 255.0)], axis=1)
+        return rgba
+
+    rgba = np.full((len(values), 4), np.nan, dtype=np.float64)
+    arr = values.array
+    for i in range(len(arr)):
+        color = cmap(arr[i])
+        if color is not None:
+            rgba[i] = normalize_color(color)
+    return rgba
+
+
+class ConvertedColormap(ABC):
     def __init__(self, func: ColorMapping):
         self.func = func
-        self.__name__ = f"{type(self).__name__}<{func.__name__}>"
-        self.__annotations__ = func.__annotations__
+        _name = getattr(func, "__name__", type(func).__name__)
+        self.__name__ = f"{type(self).__name__}<{_name}>"
+        self.__annotations__ = getattr(func, "__annotations__", {})
 
     def __repr__(self):
         return f"{type(self).__name__}<{self.func!r}>"
 
+    def map_array(self, values: pd.Series) -> np.ndarray:
+        """Map all the values to a (N, 4) array of RGBA colors."""
+        rgba = map_rgba_array(self.func, values)
+        valid = ~np.isnan(rgba[:, 0])
+        rgba[valid] = self._convert_array(np.trunc(rgba[valid]))
+        return rgba
+
+    @abstractmethod
+    def _convert_array(self, rgba: np.ndarray) -> np.ndarray:
+        """Convert a (N, 4) array of normalized colors."""
+
 
 class InvertedColormap(ConvertedColormap):
     @classmethod
@@ -159,6 +203,10 @@ class InvertedColormap(ConvertedColormap):
         color[:3] = 255 - color[:3]
         return color
 
+    def _convert_array(self, rgba: np.ndarray) -> np.ndarray:
+        rgba[:, :3] = 255 - rgba[:, :3]
+        return rgba
+
 
 class OpacityColormap(ConvertedColormap):
     def __init__(self, func: ColorMapping, opacity: float):
@@ -182,6 +230,10 @@ class OpacityColormap(ConvertedColormap):
         color[3] = self._alpha
         return color
 
+    def _convert_array(self, rgba: np.ndarray) -> np.ndarray:
+        rgba[:, 3] = self._alpha
+        return rgba
+
 
 class BrightenedColormap(ConvertedColormap):
     def __init__(self, func: ColorMapping, factor: float):
@@ -210,7 +262,15 @@ class BrightenedColormap(ConvertedColormap):
         else:
             extreme = np.array([0, 0, 0, 255], dtype=np.float64)
         color = color * (1 - factor) + extreme * factor
-        return np.round(color).astype(np.uint8)
+        return np.clip(np.round(color), 0, 255).astype(np.uint8)
+
+    def _convert_array(self, rgba: np.ndarray) -> np.ndarray:
+        factor = self._factor
+        if factor > 0:
+            extreme = np.array([255, 255, 255, 255], dtype=np.float64)
+        else:
+            extreme = np.array([0, 0, 0, 255], dtype=np.float64)
+        return np.round(rgba * (1 - factor) + extreme * factor)
 
 
 @lru_cache(maxsize=64)
@@ -26,6 +26,23 @@ class UnreachableError(RuntimeError):
     """Raised when an unreachable code is reached."""
 
 
+class CellValueError(ValueError):
+    """Raised when values could not be converted or validated for some cells."""
+
+    _MAX_SHOWN = 10
+
+    def __init__(self, errors: dict[tuple[int, int], Exception]):
+        self.errors = errors
+        lines = [
+            f"  ({r}, {c}): {type(e).__name__}: {e}"
+            for (r, c), e in list(errors.items())[: self._MAX_SHOWN]
+        ]
+        if len(errors) > self._MAX_SHOWN:
+            lines.append(f"  ... and {len(errors) - self._MAX_SHOWN} more")
+        msg = "\n".join([f"Invalid values in {len(errors)} cell(s):"] + lines)
+        super().__init__(msg)
+
+
 class ExceptionHandler:
     """Handle exceptions in the GUI thread."""
 
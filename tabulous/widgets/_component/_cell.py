@@ -16,6 +16,7 @@ from tabulous.exceptions import TableImmutableError
 from tabulous.types import EvalInfo
 from tabulous.color import ColorTuple
 from tabulous._psygnal import InCellRangedSlot
+from tabulous._psygnal._profile import PROFILER
 from ._base import TableComponent
 from tabulous.widgets._registry import SupportActionRegistration
 
@@ -54,7 +55,16 @@ class CellLabelInterface(_Sequence2D):
 class CellReferenceInterface(
     TableComponent, Mapping[Tuple[int, int], InCellRangedSlot]
 ):
-    """Interface to the cell references of a table."""
+    """
+    Interface to the cell references of a table.
+
+    Evaluation of in-cell slots can be profiled to find slow formulas.
+
+    >>> table.cell.ref.profile()  # start profiling
+    >>> table.cell.ref.profile_stats()  # statistics sorted by cumulative time
+    >>> table.cell.ref.profile(False)  # stop profiling
+    >>> table.cell.ref.show_profiler()  # show the statistics in the side area
+    """
 
     def _table_map(self):
         return self.parent._qwidget._qtable_view._table_map
@@ -76,6 +86,40 @@ class CellReferenceInterface(
         s = ",\n\t".join(f"{k}: {slot!r}" for k, slot in slots.items())
         return f"{cname}(\n\t{s}\n)"
 
+    @property
+    def is_profiling(self) -> bool:
+        """True if in-cell slots are being profiled."""
+        return PROFILER.enabled
+
+    def profile(self, enabled: bool = True) -> None:
+        """
+        Enable or disable profiling of in-cell slots.
+
+        Profiling is shared by all the tables. Nothing is measured while it is
+        disabled.
+        """
+        if enabled:
+            PROFILER.enable()
+        else:
+            PROFILER.disable()
+        return None
+
+    def profile_stats(self) -> pd.DataFrame:
+        """Return the profiling statistics of the slots in this table."""
+        return PROFILER.to_dataframe(self._table_map().values())
+
+    def clear_profile_stats(self) -> None:
+        """Clear all the profiling statistics."""
+        return PROFILER.clear()
+
+    def show_profiler(self):
+        """Show the profiling statistics in the side area of the table."""
+        from tabulous._qt._slot_profiler import QSlotProfiler
+
+        widget = QSlotProfiler(lambda: self._table_map().values())
+        self.parent.add_side_widget(widget, name="Formula profiler")
+        return widget
+
 
 class CellBackgroundColorInterface(_Sequence2D):
     def __getitem__(self, key: tuple[int, int]) -> ColorTuple | None:
@@ -148,8 +192,8 @@ class CellInterface(TableComponent, SupportActionRegistration["TableBase", int])
         row, col = self._normalize_key(key)
 
         if isinstance(value, str) and QCellLiteralEdit._is_eval_like(value):
+            expr, is_ref = QCellLiteralEdit._parse_ref(value)
             if row.stop - row.start == 1 and col.stop - col.start == 1:
-                expr, is_ref = QCellLiteralEdit._parse_ref(value)
                 _r0, _c0 = row.start, col.start
                 _r1 = table.proxy._get_proxy_object().get_source_index(_r0)
                 _c1 = table.native._column_proxy.get_source_index(_c0)
@@ -161,8 +205,12 @@ class CellInterface(TableComponent, SupportActionRegistration["TableBase", int])
                 )
                 table.events.evaluated.emit(info)
                 return None
+            elif col.stop - col.start == 1:
+                # fill the formula down to the rows
+                table._fill_formula(expr, is_ref, row, col.start)
+                return None
             else:
-                raise ValueError("Cannot evaluate a multi-cell selection.")
+                raise ValueError("Cannot evaluate a multi-column selection.")
 
         if isinstance(value, str) or not hasattr(value, "__iter__"):
             _value = [[value]]
@@ -200,12 +248,12 @@ class CellInterface(TableComponent, SupportActionRegistration["TableBase", int])
         row, col = key
 
         if isinstance(row, slice):
-            row = _normalize_slice(row, self.parent._qwidget.model().df.shape[0])
+            row = _normalize_slice(row, self.parent._qwidget.model().shape[0])
         else:
             row = slice(row, row + 1)
 
         if isinstance(col, slice):
-            col = _normalize_slice(col, self.parent._qwidget.model().df.shape[1])
+            col = _normalize_slice(col, self.parent._qwidget.model().shape[1])
         else:
             col = slice(col, col + 1)
         return row, col
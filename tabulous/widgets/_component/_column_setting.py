@@ -18,8 +18,8 @@ import numpy as np
 
 from tabulous.types import ColorMapping, ColorType
 from tabulous.color import InvertedColormap, OpacityColormap, BrightenedColormap
-from tabulous._dtype import get_converter, get_converter_from_type, isna
-from tabulous._colormap import segment_by_float, segment_by_time
+from tabulous._dtype import get_converter, get_converter_from_type
+from tabulous._colormap import segment_by_float, segment_by_time, ScaledColormap
 from ._base import Component, TableComponent
 
 if TYPE_CHECKING:
@@ -136,7 +136,8 @@ class _ColormapInterface(_DictPropertyInterface[ColorMapping]):
 
         def _wrapper(f: ColorMapping) -> ColorMapping:
             if callable(f):
-                if infer_parser:
+                # compiled colormaps convert the values by themselves
+                if infer_parser and not hasattr(f, "map_array"):
                     parser = self._get_converter(f, column_name)
                     _f = wraps(f)(lambda x: f(parser(x)))
                 else:
@@ -199,14 +200,9 @@ class _ColormapInterface(_DictPropertyInterface[ColorMapping]):
     def _get_mpl_colormap(self, column_name: str, colormap: str) -> ColorMapping:
         from matplotlib.cm import get_cmap
 
-        mpl_cmap = get_cmap(colormap)
+        return self._simple_cmap_for_column(column_name, get_cmap(colormap))
 
-        def _cmap(x):
-            return np.asarray(mpl_cmap(int(x * 255))) * 255
-
-        return self._simple_cmap_for_column(column_name, _cmap)
-
-    def _simple_cmap_for_column(self, column_name: str, cmap: ColorMapping):
+    def _simple_cmap_for_column(self, column_name: str, cmap) -> ColorMapping:
         """
         Create a colormap for a column, with min/max as the color limits.
 
@@ -214,38 +210,11 @@ class _ColormapInterface(_DictPropertyInterface[ColorMapping]):
         ----------
         column_name : str
             Name of the column.
-        cmap : [0, 1] -> ColorType
-            Colormap function
+        cmap : matplotlib colormap
+            Colormap that maps 8-bit integers to RGBA colors in [0, 1].
         """
         ds = self.parent.native._get_sub_frame(column_name)
-        vmin, vmax = ds.min(), ds.max()
-        if ds.dtype.kind in "uif":
-
-            def _cmap(x) -> ColorType:
-                x = float(x)
-                if isna(x):
-                    return None
-                ratio = (x - vmin) / (vmax - vmin)
-                ratio = max(0.0, min(1.0, ratio))
-                return cmap(ratio)
-
-        elif ds.dtype.kind in "mM":
-            vmin: _TimeType
-            vmax: _TimeType
-            vmin, vmax = vmin.value, vmax.value
-            converter = get_converter(ds.dtype)
-
-            def _cmap(x):
-                x = converter(x).value
-                ratio = (x - vmin) / (vmax - vmin)
-                ratio = max(0.0, min(1.0, ratio))
-                return cmap(ratio)
-
-        elif ds.dtype.kind == "b":
-            _cmap = cmap
-        else:
-            raise TypeError(f"Cannot infer colormap for dtype {ds.dtype}")
-        return _cmap
+        return ScaledColormap(cmap, ds.min(), ds.max(), ds.dtype)
 
     def _get_converter(self, f: ColorMapping, column_name: str):
         table = self.parent
@@ -215,7 +215,7 @@ class VerticalHeaderInterface(_HeaderInterface):
     _AXIS_NUMBER = 0
 
     def _get_axis(self) -> pd.Index:
-        return self.parent._qwidget.model().df.index
+        return self.parent._qwidget.model().shownIndex
 
     def _get_raw_axis(self) -> pd.Index:
         return self.parent._qwidget._data_raw.index
@@ -258,7 +258,7 @@ class HorizontalHeaderInterface(_HeaderInterface):
     _AXIS_NUMBER = 1
 
     def _get_axis(self) -> pd.Index:
-        return self.parent._qwidget.model().df.columns
+        return self.parent._qwidget.model().columns
 
     def _get_raw_axis(self) -> pd.Index:
         return self.parent._qwidget._data_raw.columns
@@ -299,7 +299,9 @@ class HorizontalHeaderInterface(_HeaderInterface):
         """Set the column filter."""
         if not callable(filter_func):
             raise TypeError("Cannot set non-callable object to column filter.")
-        cfil = ColumnFilter(lambda x, y: list(filter(filter_func, x)))
+        cfil = ColumnFilter(
+            lambda x, y: np.array([bool(filter_func(c)) for c in x], dtype=bool)
+        )
         self.parent._qwidget.setColumnFilter(cfil)
         return filter_func
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import builtins
 from functools import wraps
 import ast
 from contextlib import contextmanager
@@ -15,7 +14,12 @@ from typing import (
 import numpy as np
 from tabulous.types import ProxyType, _IntArray, _BoolArray, _IntOrBoolArray
 from ._base import TableComponent
-from tabulous._sort_filter_proxy import ComposableFilter, ComposableSorter
+from tabulous._sort_filter_proxy import (
+    Composable,
+    ComposableFilter,
+    ComposableSorter,
+)
+from tabulous._query import CompiledQuery
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -135,12 +139,8 @@ class ProxyInterface(TableComponent):
                 self.parent._qwidget._set_proxy(_cfil)
                 return None
 
-            def _filter(df: pd.DataFrame) -> np.ndarray:
-                ns = dict(**dict(df.items()), **namespace)
-                ns["__builtins__"] = _BUILTINS
-                return eval(expr, ns, {})
-
-            _filter.__name__ = f"filter<{expr!r}>"
+            # the expression is parsed only once
+            _filter = CompiledQuery(expr, namespace)
 
         self.parent._qwidget.setProxy(_filter)
         return None
@@ -186,7 +186,10 @@ class ProxyInterface(TableComponent):
         if isinstance(columns, str):
             indices = [self.parent.columns.get_loc(columns)]
         else:
-            indices = [self.parent.columns.get_loc(c) for c in columns]
+            from tabulous._pd_index import get_indexer
+
+            axis = self.parent.columns._get_axis()
+            indices = get_indexer(axis, list(columns)).tolist()
         wdts = self.parent.native._header_widgets().copy()
         popped = [wdts.pop(index, None) for index in indices]
 
@@ -208,7 +211,10 @@ class ProxyInterface(TableComponent):
         if isinstance(proxy, (list, tuple, set)):
             proxy = np.asarray(proxy)
         if check_duplicate:
-            if callable(proxy):
+            if isinstance(proxy, Composable):
+                # never returns duplicates. Not wrapped to receive edit notifications.
+                _proxy = proxy
+            elif callable(proxy):
 
                 @wraps(proxy)
                 def _wrapped(df: pd.DataFrame) -> ProxyType:
@@ -289,17 +295,3 @@ def _try_ast_parse(expr: str, columns: pd.Index) -> ComposableFilter | None:
     except Exception:
         return None
     return cfil
-
-
-# "safe" builtin functions
-# fmt: off
-_BUILTINS = {
-    k: getattr(builtins, k)
-    for k in [
-        "int", "str", "float", "bool", "list", "tuple", "set", "dict", "range",
-        "slice", "frozenset", "len", "abs", "min", "max", "sum", "any", "all",
-        "divmod", "id", "bin", "oct", "hex", "hash", "iter", "isinstance",
-        "issubclass", "ord"
-    ]
-}
-# fmt: on
@@ -61,7 +61,9 @@ class TableLocIndexer(TableComponent):
                 stop = table.index.get_loc(rkey.stop) + 1
             rsl = slice(start, stop)
         elif isinstance(rkey, Sequence):
-            rsl = [table.index.get_loc(lbl) for lbl in rkey]
+            from tabulous._pd_index import get_indexer
+
+            rsl = get_indexer(table.index._get_axis(), list(rkey)).tolist()
         else:
             raise TypeError(f"Cannot loc-slice by {type(ckey)}")
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from abc import abstractmethod
 import ast
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Hashable, TYPE_CHECKING, Mapping, NamedTuple, overload
@@ -13,7 +14,7 @@ from tabulous.widgets import _doc, _component as _comp
 from tabulous.widgets._keymap_abc import SupportKeyMap
 from tabulous.widgets._source import Source
 from tabulous.types import ItemInfo, EvalInfo
-from tabulous._psygnal import SignalArray, InCellRangedSlot
+from tabulous._psygnal import SignalArray, InCellRangedSlot, InCellArrayRangedSlot
 
 if TYPE_CHECKING:
     from typing_extensions import Self, Literal
@@ -163,6 +164,7 @@ class TableBase(SupportKeyMap):
                 self.columns.events.renamed.emit,
                 self.events.evaluated.emit,
             )
+            self.native.batchEditingSignal.connect(self._on_batch_editing)
 
             self.events.evaluated.connect(self._emit_evaluated)
 
@@ -231,6 +233,13 @@ class TableBase(SupportKeyMap):
         else:
             self.events.data[r, c].emit(info)
 
+    def _on_batch_editing(self, started: bool) -> None:
+        if started:
+            self.events.data.pause()
+        else:
+            # repeated edits of the same range are emitted once
+            self.events.data.resume(_merge_item_info, key=_item_info_key)
+
     @abstractmethod
     def _create_backend(self, data: pd.DataFrame) -> QBaseTable:
         """This function creates a backend widget."""
@@ -404,6 +413,28 @@ class TableBase(SupportKeyMap):
         """Return the undo manager."""
         return self._qwidget._mgr
 
+    @contextmanager
+    def batch_edit(self):
+        """
+        Context manager to edit the table in a batch.
+
+        Data-changed events are emitted at the end of the context, one for each
+        edited range. Repeated edits of the same range are merged into one event
+        with the last value and the first old value. In-cell formulas are evaluated
+        only once and all the edits are recorded as one undo command.
+
+        >>> with table.batch_edit():
+        ...     for i in range(100):
+        ...         table.cell[i, 0] = i
+        """
+        if not self.mutable:
+            from tabulous.exceptions import TableImmutableError
+
+            raise TableImmutableError(f"{self!r} is not a mutable table.")
+        with self._qwidget.batchEditing():
+            yield
+        return None
+
     def add_side_widget(self, widget: QtW.QWidget | Widget, *, name: str = ""):
         """
         Add a side widget to the table.
@@ -537,11 +568,48 @@ class TableBase(SupportKeyMap):
                 result = slot.evaluate()
                 if e := result.get_err():
                     _raise(e)
+                elif circular := self.events.data._graph.find_circular(slot):
+                    self.events.data._graph.set_circular_error(circular)
                 qtable.setInCellSlot(info.source_pos, slot)
 
         del qtable_view._focused_widget
         return None
 
+    def _fill_formula(self, expr: str, is_ref: bool, rows: slice, col: int) -> None:
+        """Fill a formula at the top cell down to the rows."""
+        qtable = self.native
+        nrows = rows.stop - rows.start
+        slot = InCellRangedSlot.from_table(self, expr, (rows.start, col))
+        if (
+            is_ref
+            and nrows > 1
+            and qtable._proxy.proxy_type == "none"
+            and qtable._column_proxy.is_identity()
+            and (array_slot := InCellArrayRangedSlot.from_slot(slot, nrows))
+            and array_slot.is_consistent()
+        ):
+            # filled formulas differ only by the row offset. Evaluate as an array.
+            with qtable._mgr.merging(formatter=lambda cmds: cmds[-1].format()):
+                array_slot.evaluate()
+                if circular := self.events.data._graph.find_circular(array_slot):
+                    self.events.data._graph.set_circular_error(circular)
+                qtable.setInCellSlot(array_slot.source_pos, array_slot)
+            return None
+
+        prx = self.proxy._get_proxy_object()
+        _col = qtable._column_proxy.get_source_index(col)
+        with self.batch_edit():
+            for i in range(nrows):
+                r = rows.start + i
+                info = EvalInfo(
+                    pos=(r, col),
+                    source_pos=(prx.get_source_index(r), _col),
+                    expr=slot.as_filled_literal(i),
+                    is_ref=is_ref,
+                )
+                self.events.evaluated.emit(info)
+        return None
+
     def _wrap_command(self, cmd: Callable):
         def _f(*_):
             logger.debug(f"Command: {cmd.__module__.split('.')[-1]}.{cmd.__name__}")
@@ -666,8 +734,25 @@ class _DataFrameTableLayer(TableBase):
         return self
 
     def query(self, text: str):
-        df = self.data.eval(text, inplace=False, global_dict={"df": self.data})
         parsed = ast.parse(text.replace("@", "")).body[0]
+        if "@" not in text and type(parsed) in (ast.Assign, ast.Expr):
+            # element-wise expressions are evaluated by chunks of referenced columns
+            from tabulous._query import CompiledQuery
+
+            data = self.data
+            query = CompiledQuery(parsed.value)
+            if query.is_chunkable(data):
+                import pandas as pd
+
+                out = pd.Series(query.evaluate(data), index=data.index)
+                if type(parsed) is ast.Expr:
+                    viewer = self._qwidget.parentViewer()._table_viewer
+                    viewer.add_table(out, name=self.name)
+                    return None
+                elif len(parsed.targets) == 1 and type(parsed.targets[0]) is ast.Name:
+                    self.assign({parsed.targets[0].id: out})
+                    return None
+        df = self.data.eval(text, inplace=False, global_dict={"df": self.data})
         if type(parsed) is not ast.Assign:
             self._qwidget.parentViewer()._table_viewer.add_table(df, name=self.name)
         else:
@@ -935,6 +1020,20 @@ def is_xarray_data_array(data):
     return False
 
 
+def _item_info_key(args: tuple[ItemInfo], range) -> str | None:
+    """Key of the data-changed events that can be merged in a batch."""
+    info = args[0]
+    if info.value is info.DELETED or info.old_value is info.INSERTED:
+        return None  # insertion/deletion is never merged
+    return repr(range)
+
+
+def _merge_item_info(args0: tuple[ItemInfo], args1: tuple[ItemInfo]):
+    """Merge two data-changed events of the same range."""
+    (info0,), (info1,) = args0, args1
+    return (info1._replace(old_value=info0.old_value),)
+
+
 def _get_module(data) -> str:
     try:
         mod = type(data).__module__.split(".", 1)[0]
@@ -359,3 +359,200 @@ def test_N(make_tabulous_viewer):
     assert sheet.data.iloc[1, 2] == 2.5
     sheet.cell[1, 3] = "&=np.zeros(N)"
     assert sheet.data.iloc[1, 3] == 0
+
+def test_get_ref_by_destination(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.zeros((5, 3)))
+    table_map = sheet.native._qtable_view._table_map
+    sheet.cell[0, 1] = "&=df.iloc[:, 0] + 1"  # column output
+    sheet.cell[0, 2] = "&=np.sum(df.iloc[:, 0])"  # scalar output
+    slot_col = table_map[0, 1]
+    slot_sum = table_map[0, 2]
+    assert table_map.get_by_dest((3, 1)) is slot_col
+    assert table_map.get_by_dest((0, 2)) is slot_sum
+    assert table_map.get_by_dest((3, 2)) is None
+    assert table_map.get_by_dest((0, 0)) is None
+
+    # destination is updated by re-evaluation
+    sheet.cell[0, 1] = "&=df.iloc[0:2, 0] + 1"
+    slot_col = table_map[0, 1]
+    assert table_map.get_by_dest((1, 1)) is slot_col
+    assert table_map.get_by_dest((3, 1)) is None
+
+    # source positions and destinations are updated by insertion
+    sheet.index.insert(0, 2)
+    assert (2, 1) in sheet.cell.ref
+    assert table_map.get_by_dest((3, 1)) is slot_col
+    assert table_map.get_by_dest((1, 1)) is None
+    assert table_map.get_by_dest((2, 2)) is slot_sum
+    assert len(table_map) == 2
+
+    del table_map[2, 1]
+    assert len(table_map) == 1
+    assert table_map.get_by_dest((3, 1)) is None
+    assert list(table_map.keys()) == [(2, 2)]
+
+def test_evaluated_once_in_topological_order(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.zeros((3, 4)))
+    called = []
+
+    @viewer.cell_namespace.add
+    def record(x, name):
+        called.append(name)
+        return x
+
+    sheet.cell[0, 1] = "&=record(df.iloc[0, 0], 'B') + 1"
+    sheet.cell[0, 2] = "&=record(df.iloc[0, 0], 'C') + 2"
+    sheet.cell[0, 3] = "&=record(df.iloc[0, 1] + df.iloc[0, 2], 'D')"
+    called.clear()
+    sheet.cell[0, 0] = 1
+    assert called == ["B", "C", "D"]
+    assert_equal(sheet.data.iloc[0].values, [1, 2, 3, 5])
+
+def test_circular_reference(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.zeros((3, 3)))
+    sheet.cell[0, 0] = "&=df.iloc[0, 1] + 1"
+    sheet.cell[0, 1] = "&=df.iloc[0, 0] + 1"
+    assert sheet.cell.ref[0, 0].format_error().startswith("CircularReferenceError")
+    assert sheet.cell.ref[0, 1].format_error().startswith("CircularReferenceError")
+    assert sheet.data.iloc[0, :2].isna().all()
+
+    # editing a cell in the cycle does not evaluate the others recursively
+    sheet.cell[0, 2] = "&=df.iloc[0, 0] + 1"
+    sheet.cell[0, 1] = 3
+    assert sheet.data.iloc[0, 0] == 4
+    assert sheet.data.iloc[0, 2] == 5
+
+def test_compiled_expression_cache(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.zeros((5, 3)))
+    viewer.cell_namespace["double"] = lambda x: x * 2
+    sheet.cell[1, 1] = "&=double(df.iloc[1, 0]) + sum(v for v in [1, 2])"
+    slot = sheet.cell.ref[1, 1]
+    code = slot._expr.compile(slot.range)
+    sheet.cell[1, 0] = 2
+    assert slot._expr.compile(slot.range) is code
+    assert sheet.data.iloc[1, 1] == 7
+
+    # inserting rows updates the expression
+    sheet.index.insert(0, 1)
+    assert slot._expr.compile(slot.range) is not code
+    assert slot._expr.compile(slot.range)[1] == slot.as_literal()
+    sheet.cell[2, 0] = 3
+    assert sheet.data.iloc[2, 1] == 9
+
+def test_lazy_column_access(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.arange(12).reshape(4, 3))
+    qtable = sheet.native
+    sheet.cell[0, 3] = "&=np.sum(df.iloc[0:2, 1]) + DF[1, 2]"
+    assert sheet.data.iloc[0, 3] == 1 + 4 + 5
+
+    # only the referred columns are parsed
+    qtable._invalidate_data_cache()
+    sheet.cell[1, 1] = "10"
+    assert qtable._data_cache is None
+    assert 0 not in qtable._column_cache
+    assert 1 in qtable._column_cache
+    assert sheet.data.iloc[0, 3] == 1 + 10 + 5
+
+def test_batch_edit(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.zeros((5, 2)))
+    called = []
+
+    @viewer.cell_namespace.add
+    def record(x):
+        called.append(x)
+        return x
+
+    sheet.cell[0, 1] = "&=record(np.sum(df.iloc[:, 0]))"
+    called.clear()
+    data_events = []
+    sheet.events.data.connect(data_events.append)
+    with sheet.batch_edit():
+        sheet.cell[0, 0] = 10
+        for i in range(5):
+            sheet.cell[i, 0] = i + 1
+        assert called == []
+        assert data_events == []
+    assert called == [15]
+    # one event for each edited cell (two edits of [0, 0] are merged) and one for
+    # the output of the formula
+    assert len(data_events) == 6
+    assert sheet.data.iloc[0, 1] == 15
+    sheet.undo_manager.undo()
+    assert_equal(sheet.data.iloc[:, 0].values, np.zeros(5))
+    assert sheet.data.iloc[0, 1] == 0
+
+
+def test_fill_formula_as_array(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet({"a": np.arange(6)})
+    qtable = sheet.native
+    table_map = qtable._qtable_view._table_map
+    sheet.cell[1:5, 1] = "&=df.iloc[1, 0] * 2"
+    assert len(table_map) == 1
+    assert_equal(sheet.data.iloc[1:5, 1].values, [2, 4, 6, 8])
+    assert qtable._get_ref_expr_by_dest(3, 1) == "df.iloc[3, 0] * 2"
+
+    sheet.cell[2, 0] = 10
+    assert sheet.data.iloc[2, 1] == 20
+    sheet.undo_manager.undo()
+    sheet.undo_manager.undo()
+    assert len(table_map) == 0
+
+def test_fill_formula_cell_by_cell(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet({"a": np.arange(6)})
+    table_map = sheet.native._qtable_view._table_map
+    # not vectorizable because the formula refers to multiple rows
+    sheet.cell[0:3, 1] = "&=np.sum(df.iloc[0:2, 0])"
+    assert len(table_map) == 3
+    assert_equal(sheet.data.iloc[0:3, 1].values, [1, 3, 5])
+
+    # filled formulas depend on each other
+    sheet.cell[0, 2] = 0
+    sheet.cell[1:4, 2] = "&=df.iloc[0, 2] + 1"
+    assert_equal(sheet.data.iloc[0:4, 2].values, [0, 1, 2, 3])
+
+def test_parallel_evaluation(make_tabulous_viewer):
+    from tabulous._utils import get_config
+
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.zeros((3, 5)))
+    cfg = get_config()
+    cfg.cell.eval_workers = 4
+    try:
+        sheet.cell[0, 1] = "&=df.iloc[0, 0] + 1"
+        sheet.cell[0, 2] = "&=df.iloc[0, 0] + 2"
+        sheet.cell[0, 3] = "&=df.iloc[0, 0] + 3"
+        sheet.cell[0, 4] = "&=df.iloc[0, 1] + df.iloc[0, 3]"
+        sheet.cell[0, 0] = 1
+        assert_equal(sheet.data.iloc[0].values, [1, 2, 3, 4, 6])
+    finally:
+        cfg.cell.eval_workers = 1
+
+def test_profile(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(np.zeros((3, 3)))
+    sheet.cell[0, 1] = "&=df.iloc[0, 0] + 1"
+    sheet.cell[0, 2] = "&=df.iloc[:, 0] * 2"
+    assert not sheet.cell.ref.is_profiling
+    sheet.cell.ref.profile()
+    try:
+        sheet.cell[0, 0] = 1
+        sheet.cell[1, 0] = 2
+        stats = sheet.cell.ref.profile_stats()
+        assert len(stats) == 2
+        assert stats["total_time"].is_monotonic_decreasing
+        assert sorted(stats["ncalls"]) == [1, 2]
+        assert sorted(stats["output_size"]) == [1, 3]
+        sheet.cell.ref.show_profiler()
+    finally:
+        sheet.cell.ref.profile(False)
+        sheet.cell.ref.clear_profile_stats()
+    sheet.cell[0, 0] = 3
+    assert len(sheet.cell.ref.profile_stats()) == 0
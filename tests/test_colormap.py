@@ -1,3 +1,15 @@
+import numpy as np
+import pandas as pd
+import pytest
+from tabulous import TableViewer
+from tabulous.color import normalize_color, InvertedColormap
+from tabulous._colormap import (
+    segment_by_float,
+    segment_by_time,
+    ScaledColormap,
+    map_colors,
+)
+
 # import pandas as pd
 # from tabulous.widgets import Table
 # from tabulous.color import normalize_color
@@ -131,3 +143,56 @@
 #     table.text_color.adjust_brightness("A", 0.5)
 #     assert table.cell.text_color[0, 0] == normalize_color("red")
 #     assert table.cell.text_color[9, 0] == normalize_color("blue")
+
+
+def _gray_cmap(x):
+    x = np.asarray(x)
+    return np.stack([x, x, x, np.full(x.shape, 255)], axis=-1) / 255
+
+
+_FLOATS = pd.Series([-3.0, -1.0, 0.0, 0.5, 2.0, np.nan])
+_TIMES = pd.Series(pd.date_range("2020-01-01", periods=5, freq="D"))
+
+
+@pytest.mark.parametrize(
+    "cmap, values",
+    [
+        (segment_by_float([(-1, "red"), (0, "gray"), (1, "blue")]), _FLOATS),
+        (segment_by_time([(_TIMES[0], "red"), (_TIMES[4], "blue")], "M"), _TIMES),
+        (ScaledColormap(_gray_cmap, -2.0, 1.0, np.float64), _FLOATS),
+        (ScaledColormap(_gray_cmap, _TIMES[1], _TIMES[3], _TIMES.dtype), _TIMES),
+        (
+            InvertedColormap.from_colormap(segment_by_float([(0, "red"), (1, "blue")])),
+            _FLOATS,
+        ),
+        (lambda x: "red" if x > 0 else None, _FLOATS),
+    ],
+)
+def test_map_colors(cmap, values: pd.Series):
+    rgba, colored = map_colors(cmap, values)
+    for i, val in enumerate(values.array):
+        color = cmap(val)
+        if color is None:
+            assert not colored[i]
+        else:
+            assert colored[i]
+            assert tuple(rgba[i]) == normalize_color(color)
+
+
+def test_color_cache_is_updated(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table(
+        {"a": [0.0, 1.0, 2.0], "b": [0.0, 1.0, 2.0]}, editable=True
+    )
+    table.background_color.set("a", interp_from=[(0, "red"), (2, "blue")])
+    table.background_color.set("b", interp_from=[(0, "red"), (2, "blue")])
+    assert table.cell.background_color[0, 0] == normalize_color("red")
+    assert table.cell.background_color[0, 1] == normalize_color("red")
+    model = table.native.model()
+    assert len(model._background_color_cache) == 2
+    table.cell[0, 0] = 2.0
+    assert len(model._background_color_cache) == 1
+    assert table.cell.background_color[0, 0] == normalize_color("blue")
+    assert table.cell.background_color[0, 1] == normalize_color("red")
+    table.background_color.set("a", interp_from=[(0, "blue"), (2, "red")])
+    assert table.cell.background_color[0, 0] == normalize_color("red")
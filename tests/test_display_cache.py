@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+from tabulous import TableViewer
+from tabulous._display_cache import DisplayTextCache
+
+def _formatter(rows: slice, columns: slice):
+    return [[f"{r},{c}" for r in range(rows.start, rows.stop)] for c in range(columns.start, columns.stop)]
+
+def test_tile_is_formatted_once():
+    fmt = MagicMock(side_effect=_formatter)
+    cache = DisplayTextCache(fmt, tile_shape=(4, 2))
+    assert cache.get(0, 0) == "0,0"
+    assert cache.get(3, 1) == "3,1"
+    assert fmt.call_count == 1
+    assert cache.get(5, 1) == "5,1"
+    assert fmt.call_count == 2
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+    assert cache.get(0, 0) == "0,0"
+    assert fmt.call_count == 3
+
+def test_lru_eviction():
+    fmt = MagicMock(side_effect=_formatter)
+    cache = DisplayTextCache(fmt, tile_shape=(2, 2), max_bytes=1000)
+    cache.get(0, 0)
+    nbytes = cache.nbytes
+    cache._max_bytes = nbytes * 2
+    cache.get(2, 0)
+    cache.get(0, 0)  # (0, 0) is now the most recently used
+    cache.get(4, 0)
+    assert len(cache) == 2
+    assert set(cache._tiles.keys()) == {(0, 0), (2, 0)}
+
+def test_cache_is_updated(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"a": [1, 2, 3]}, editable=True)
+    assert table.cell.text[0, 0] == "1"
+    table.cell[0, 0] = 10
+    assert table.cell.text[0, 0] == "10"
+    table.text_formatter("a", lambda x: f"<{x}>")
+    assert table.cell.text[0, 0] == "<10>"
+    table.proxy.sort("a", ascending=False)
+    assert table.cell.text[0, 0] == "<10>"
+    assert table.cell.text[1, 0] == "<3>"
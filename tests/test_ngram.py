@@ -0,0 +1,50 @@
+from numpy.testing import assert_equal
+import pandas as pd
+import pytest
+from tabulous._ngram import TrigramIndex, is_literal
+
+
+@pytest.mark.parametrize("pattern", ["a", "ab", "abc", "bcd", "xyz", "cdab", ""])
+def test_contains(pattern: str):
+    ds = pd.Series(["abcd", "bcd", None, "xabc", "abcd", "cdab", "ab"])
+    index = TrigramIndex.from_series("x", ds)
+    expected = ds.str.contains(pattern, regex=False).fillna(False).values
+    assert_equal(index.contains(pattern), expected)
+
+
+def test_update():
+    ds = pd.Series(["abcd", "bcd", "xyz"])
+    index = TrigramIndex.from_series("x", ds)
+    index.update(1, "wxyz")
+    index.update(slice(0, 1), [None])
+    assert_equal(index.contains("xyz"), [False, True, True])
+    assert_equal(index.contains("bcd"), [False, False, False])
+
+
+def test_release():
+    index = TrigramIndex.from_series("x", pd.Series(["abc"]))
+    assert index.is_valid("x", 1)
+    index.release()
+    assert not index.is_valid("x", 1)
+    assert index.contains("abc") is None
+
+
+def test_is_literal():
+    assert is_literal("abc def")
+    assert not is_literal("a.c")
+    assert not is_literal(1)
+
+
+def test_contains_filter():
+    from tabulous._sort_filter_proxy import ComposableFilter, FilterInfo, FilterType
+
+    df = pd.DataFrame({"x": ["abcd", "bcd", "xyz"], "y": [0, 1, 2]})
+    cfil = ComposableFilter({0: FilterInfo(FilterType.contains, "bcd")})
+    assert_equal(cfil(df), [True, True, False])  # index is built in background
+    cfil._ngrams[0].result()
+    cfil = cfil.compose(0, FilterInfo(FilterType.contains, "abc"))
+    assert_equal(cfil(df), [True, False, False])
+    df.iloc[2, 0] = "abcde"
+    cfil.invalidate(2, 0)
+    cfil = cfil.compose(0, FilterInfo(FilterType.contains, "bcde"))
+    assert_equal(cfil(df), [False, False, True])  # updated incrementally
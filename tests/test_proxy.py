@@ -245,3 +245,177 @@ def test_column_filter_with_sort(make_tabulous_viewer):
     assert_equal(table.data_shown["ba"].values, [3, 4])
     table.undo_manager.undo()
     assert_equal(table.data_shown["ba"].values, [4, 3])
+
+def test_proxy_does_not_copy_data(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"a": [3, 1, 2], "b": [0, 1, 2]}, editable=True)
+    model = table.native.model()
+    table.proxy.sort(by="a")
+    assert model._df is table.data
+    assert_equal(model._row_indexer, [1, 2, 0])
+    assert table.cell.text[0, 1] == "1"
+    table.cell[0, 1] = 10
+    assert table.data["b"][1] == 10
+    assert table.cell.text[0, 1] == "10"
+    table.proxy.filter("a > 1")
+    assert model._df is table.data
+    assert_equal(model._row_indexer, [0, 2])
+    assert_equal(table.data_shown["b"].values, [0, 2])
+
+def test_proxy_index_mapping():
+    from tabulous._sort_filter_proxy import SortFilterProxy
+
+    mask = np.array([True, False, True, True, False])
+    prx = SortFilterProxy(mask)
+    assert_equal(prx.get_positions(None), [0, 2, 3])
+    assert prx.get_source_index(1) == 2
+    assert prx.get_proxy_index(2) == 1
+    assert prx.get_proxy_index(1) == -1
+    assert_equal(prx.get_proxy_index([0, 1, 3, 9]), [0, -1, 2, -1])
+    assert prx.map_slice(slice(1, 4)) == slice(0, 3)
+    assert prx.map_slice(slice(2, 3)) == slice(1, 2)
+
+    prx = SortFilterProxy(np.array([2, 0, 1]))
+    prx.get_positions(None)
+    assert prx.map_slice(slice(0, 1)) == slice(1, 2)
+    assert_equal(prx.get_proxy_index(np.arange(3)), [1, 2, 0])
+    assert prx.get_source_slice(slice(1, 2)) == slice(0, 1)
+
+def test_filter_mask_cache(make_tabulous_viewer):
+    from tabulous._sort_filter_proxy import ComposableFilter, FilterInfo, FilterType
+
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"a": [3, 1, 2, 0], "b": [0, 1, 2, 3]}, editable=True)
+    cfil = ComposableFilter({0: FilterInfo(FilterType.gt, 0)})
+    table.proxy.set(cfil)
+    assert_equal(table.data_shown["b"].values, [0, 1, 2])
+    mask = cfil._masks[0].mask
+    table.cell[1, 0] = 0  # source row 1 is filtered out
+    assert cfil._masks[0].mask is mask  # updated in place
+    assert_equal(table.data_shown["b"].values, [0, 2])
+    table.undo_manager.undo()
+    assert_equal(table.data_shown["b"].values, [0, 1, 2])
+
+    # composing a new column filter reuses the cached mask
+    composed = cfil.compose(1, FilterInfo(FilterType.lt, 2))
+    table.proxy.set(composed)
+    assert_equal(composed._masks[0].mask, [True, True, True, False])
+    assert_equal(table.data_shown["b"].values, [0, 1])
+
+def test_sort_key_cache():
+    from tabulous._sort_filter_proxy import ComposableSorter
+
+    df = pd.DataFrame({"a": [2, 1, 2, np.nan, 1], "b": ["x", "y", "y", "x", "x"]})
+    sorter = ComposableSorter([0, 1], [True, False])
+    assert_equal(sorter(df), [1, 4, 2, 0, 3])  # missing values are placed last
+    key = sorter._cache[0]
+    switched = sorter.switch(1)
+    assert_equal(switched(df), [4, 1, 0, 2, 3])
+    assert switched._cache[0] is key  # factorized keys are reused
+    sorter.invalidate(c=[0])
+    assert 0 not in sorter._cache
+    assert_equal(ComposableSorter([0], False)(df), [0, 2, 1, 4, 3])
+
+def test_sort_in_thread(make_tabulous_viewer, qtbot):
+    from tabulous._sort_filter_proxy import ComposableSorter
+    from tabulous._utils import get_config
+
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"a": [2, 3, 1], "b": [0, 1, 2]})
+    qtable = table._qwidget
+    cfg = get_config()
+    cfg.table.async_proxy_rows = 0
+    try:
+        qtable._set_proxy_in_thread(ComposableSorter([0], False))
+        # the stale job is cancelled
+        qtable._set_proxy_in_thread(ComposableSorter([0], True))
+        qtbot.waitUntil(lambda: qtable._proxy_job is None)
+    finally:
+        cfg.table.async_proxy_rows = 1000000
+    assert_equal(table.data_shown["a"].values, [1, 2, 3])
+    table.undo_manager.undo()
+    assert_equal(table.data_shown["a"].values, [2, 3, 1])
+
+
+def test_edit_during_sort_in_thread(make_tabulous_viewer, qtbot):
+    from tabulous._sort_filter_proxy import ComposableSorter
+    from tabulous._utils import get_config
+
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"a": [2, 3, 1], "b": [0, 1, 2]}, editable=True)
+    table.proxy.set(ComposableSorter([1], False))
+    assert_equal(table.data_shown["a"].values, [1, 3, 2])
+    qtable = table._qwidget
+    cfg = get_config()
+    cfg.table.async_proxy_rows = 0
+    try:
+        qtable._set_proxy_in_thread(ComposableSorter([0], False))
+        table.cell[1, 0] = 0  # edit while the job is pending
+        assert qtable._proxy_job is not None
+        qtbot.waitUntil(lambda: qtable._proxy_job is None)
+    finally:
+        cfg.table.async_proxy_rows = 1000000
+    assert_equal(table.data["a"].values, [2, 0, 1])
+    assert_equal(table.data_shown["a"].values, [2, 1, 0])
+
+
+def test_column_filter_mask():
+    from tabulous._sort_filter_proxy import ColumnFilter
+
+    df = pd.DataFrame({"a": [0], "b": [1.0], "ab": ["x"], "c": [True]})
+    cfil = ColumnFilter.startswith("a")
+    assert list(cfil.apply(df).columns) == ["a", "ab"]
+    assert_equal(cfil.mask, [True, False, True, False])
+    assert_equal(cfil.last_indexer, [0, 2])
+
+    # labels are resolved to the positions
+    cfil = ColumnFilter(lambda x, y: ["c", "a"])
+    assert list(cfil.apply(df).columns) == ["c", "a"]
+    assert_equal(cfil.mask, [True, False, False, True])
+    with pytest.raises(KeyError):
+        ColumnFilter(lambda x, y: ["a", "x"]).apply(df)
+    assert list(ColumnFilter.is_numeric().apply(df).columns) == ["a", "b"]
+
+def test_isin_filter_with_facets(qtbot):
+    from tabulous._sort_filter_proxy import (
+        ComposableFilter,
+        Facets,
+        FilterInfo,
+        FilterType,
+    )
+    from tabulous._qt._proxy_button import QFacetListModel
+
+    ds = pd.Series(["ab", "b", "ab", None, "c", "ab"])
+    facets = Facets.from_series(ds)
+    assert facets.values[0] == "ab"
+    assert_equal(facets.counts, [3, 1, 1, 1])
+
+    model = QFacetListModel()
+    model.setFacets(facets)
+    model.setSearchText("B")
+    assert model.rowCount() == 2
+    model.setAllChecked(True)
+    model.setSearchText("")
+    assert model.rowCount() == 4
+    assert sorted(model.checkedValues()) == ["ab", "b"]
+
+    df = pd.DataFrame({"x": ds})
+    cfil = ComposableFilter({0: FilterInfo(FilterType.isin, ["b", None])})
+    assert_equal(cfil(df), [False, True, False, True, False, False])
+    assert 0 in cfil._codes
+
+
+def test_facet_checklist_error(qtbot, monkeypatch):
+    from tabulous._sort_filter_proxy import Facets
+    from tabulous._qt._proxy_button import QFacetChecklist
+
+    def _raise(series):
+        raise TypeError("cannot count values")
+
+    monkeypatch.setattr(Facets, "from_series", _raise)
+    checklist = QFacetChecklist()
+    qtbot.addWidget(checklist)
+    checklist.fetchFacets(pd.Series([0, 1]))
+    assert not checklist.isEnabled()
+    qtbot.waitUntil(checklist.isEnabled)
+    assert checklist._status.text().startswith("Failed to count values")
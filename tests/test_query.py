@@ -0,0 +1,53 @@
+from numpy.testing import assert_equal
+import numpy as np
+import pandas as pd
+import pytest
+from tabulous._query import CompiledQuery
+
+DF = pd.DataFrame(
+    {
+        "a": np.arange(10),
+        "b": np.linspace(-1, 1, 10),
+        "c": list("xyzxyzxyzx"),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["a > 4", "(a < 4) & (b > -0.5)", "(a + 1) % 3 == 0", "~(b < 0)", "c == 'x'"],
+)
+def test_chunked(expr: str):
+    query = CompiledQuery(expr, chunksize=3)
+    assert query.is_chunkable(DF)
+    assert_equal(query(DF), DF.eval(expr).values)
+
+
+def test_namespace():
+    query = CompiledQuery("a > th", {"th": 6}, chunksize=4)
+    assert query.is_chunkable(DF)
+    assert_equal(query(DF), DF["a"].values > 6)
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("(a & 1) == 1", DF["a"].values % 2 == 1),
+        ("(~a) > -5", DF["a"].values < 4),
+    ],
+)
+def test_bitwise_on_integers(expr: str, expected):
+    query = CompiledQuery(expr, chunksize=3)
+    assert query.is_chunkable(DF)
+    assert_equal(query(DF), expected)
+
+
+def test_not_elementwise():
+    query = CompiledQuery("a > a.mean()", chunksize=3)
+    assert not query.is_chunkable(DF)
+    assert_equal(query(DF), DF["a"].values > 4.5)
+
+
+def test_not_bool():
+    with pytest.raises(TypeError):
+        CompiledQuery("a + 1")(DF)
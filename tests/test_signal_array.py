@@ -80,3 +80,69 @@ def test_blocked():
         a.sig.emit(0)
 
     mock.assert_not_called()
+
+def test_emit_only_visits_overlapping_slots():
+    from tabulous._range import RectRange
+
+    a = A()
+    called = []
+    keys = [
+        (slice(0, 2), slice(0, 2)),
+        (slice(100, 200), slice(0, 1)),
+        (slice(None), slice(3, 4)),
+        (slice(5, 6), slice(None)),
+        (slice(None), slice(None)),
+    ]
+    for i, key in enumerate(keys):
+        a.sig[key].connect(lambda _, i=i: called.append(i))
+
+    a.sig[1, 1].emit(0)
+    assert called == [0, 4]
+    called.clear()
+    a.sig[150, 3].emit(0)
+    assert called == [2, 4]
+    called.clear()
+    a.sig[5, 0:10].emit(0)
+    assert called == [2, 3, 4]
+    called.clear()
+    a.sig[3:, :].emit(0)  # unlimited range
+    assert called == [1, 2, 3, 4]
+    called.clear()
+
+    visited = a.sig._slot_range_index.query(RectRange(slice(1, 2), slice(1, 2)))
+    assert len(visited) < len(keys)
+
+def test_slot_index_updated_by_insertion_and_removal():
+    a = A()
+    mock = MagicMock()
+    a.sig[100:101, 10:11].connect(mock)
+
+    a.sig.insert_rows(0, 200)
+    a.sig[100, 10].emit(0)
+    mock.assert_not_called()
+    a.sig[300, 10].emit(1)
+    mock.assert_called_once_with(1)
+    mock.reset_mock()
+
+    a.sig.remove_columns(0, 5)
+    a.sig[300, 10].emit(2)
+    mock.assert_not_called()
+    a.sig[300, 5].emit(3)
+    mock.assert_called_once_with(3)
+    mock.reset_mock()
+
+    a.sig.remove_rows(300, 1)  # range becomes empty
+    assert len(a.sig) == 0
+    assert len(a.sig._slot_range_index) == 0
+
+def test_disconnect_during_emission():
+    a = A()
+    mock = MagicMock()
+
+    def _disconnect(_):
+        a.sig.disconnect(mock)
+
+    a.sig[0, 0].connect(_disconnect)
+    a.sig[0, 0].connect(mock)
+    a.sig[0, 0].emit(0)
+    mock.assert_not_called()
@@ -75,6 +75,21 @@ def test_setting_cell_out_of_bound(make_tabulous_viewer):
     qtable.undo()
     assert sheet.data.shape == (0, 0)
 
+def test_setting_cell_past_the_edge(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet({"a": ["1", "2"]})
+    sheet.cell[3, 2] = "x"
+    assert sheet.data.shape == (4, 3)
+    assert sheet.native.model().shape == (4, 3)
+    assert sheet.data.iloc[3, 2] == "x"
+    sheet.cell[1, 3] = "y"
+    assert sheet.data.shape == (4, 4)
+    assert sheet.data.iloc[1, 3] == "y"
+    sheet.undo_manager.undo()
+    sheet.undo_manager.undo()
+    assert sheet.data.shape == (2, 1)
+    assert sheet.native.model().shape == (2, 1)
+
 def test_setting_header_out_of_bound(make_tabulous_viewer):
     viewer: TableViewer = make_tabulous_viewer()
     sheet = viewer.add_spreadsheet()
@@ -173,3 +188,45 @@ def test_assign(make_tabulous_viewer):
     assert sheet.native.model().df.dtypes.iloc[0] == "string"
     sheet.undo_manager.undo()
     assert sheet.native.model().df.dtypes.iloc[0] == "string"
+
+def test_dtype_inference(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet(
+        {
+            "int": ["1", "2", "3"],
+            "float": ["1", "", "2.5"],
+            "bool": ["True", "False", "true"],
+            "bool_na": ["True", "NA", "False"],
+            "str": ["a", "1", "#ERROR"],
+            "error": ["1", "#ERROR", "3"],
+        }
+    )
+    df = sheet.data
+    assert list(df.dtypes.astype(str)) == [
+        "int64", "float64", "bool", "object", "object", "float64"
+    ]
+    assert df["float"].isna().tolist() == [False, True, False]
+    assert df["bool_na"].tolist()[::2] == [True, False]
+    assert df["str"].tolist()[:2] == ["a", "1"]
+    assert df["str"].isna().tolist() == [False, False, True]
+    assert df["error"].isna().tolist() == [False, True, False]
+    assert sheet.native._get_sub_frame("float").dtype == "float64"
+    assert list(sheet.native._get_sub_frame(["int", "bool"]).dtypes) == ["int64", "bool"]
+
+def test_column_wise_cache_update(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5], "c": ["x", "y", "z"]})
+    df0 = sheet.data
+    sheet.cell[0, 0] = "1.5"
+    df1 = sheet.data
+    assert df1 is not df0
+    assert df1["a"].dtype == "float64"
+    assert df1["a"].tolist() == [1.5, 2.0, 3.0]
+    assert np.shares_memory(df0["b"].values, df1["b"].values)
+    assert df0["a"].tolist() == [1, 2, 3]  # old data frame is not updated
+    sheet.undo_manager.undo()
+    assert sheet.data["a"].dtype == "int64"
+    sheet.dtypes["b"] = "float32"
+    assert sheet.data["b"].dtype == "float32"
+    sheet.cell[3, 3] = "0"
+    assert sheet.data.shape == (4, 4)
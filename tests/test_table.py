@@ -281,3 +281,52 @@ def test_overlay_widget(make_tabulous_viewer):
 
     line = QtW.QLineEdit()
     table.add_overlay_widget(line)
+
+def test_role_plan(make_tabulous_viewer):
+    from qtpy.QtCore import Qt
+
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table(df0)
+    model = table.native.model()
+    optional_roles = [
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.BackgroundRole,
+        Qt.ItemDataRole.DecorationRole,
+    ]
+    assert all(role not in model._role_plan for role in optional_roles)
+    table.text_color["a"] = lambda x: "red"
+    assert Qt.ItemDataRole.ForegroundRole in model._role_plan
+    table.background_color["a"] = lambda x: "red"
+    assert Qt.ItemDataRole.BackgroundRole in model._role_plan
+    table.cell.label[0, 0] = "a ="
+    assert Qt.ItemDataRole.DecorationRole in model._role_plan
+    del table.text_color["a"]
+    del table.background_color["a"]
+    table.cell.label[0, 0] = None
+    assert all(role not in model._role_plan for role in optional_roles)
+
+    sheet = viewer.add_spreadsheet(df0)
+    assert Qt.ItemDataRole.BackgroundRole in sheet.native.model()._role_plan
+
+def test_size_hint_updated(make_tabulous_viewer):
+    from qtpy.QtCore import Qt
+
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table(df0)
+    model = table.native.model()
+
+    def _width(c: int) -> int:
+        index = model.index(0, c)
+        return model.data(index, Qt.ItemDataRole.SizeHintRole).width()
+
+    def _fresh_width(c: int) -> int:
+        model._invalidate_size_hints()
+        return _width(c)
+
+    width = _width(0)
+    table.native._qtable_view.horizontalHeader().resizeSection(0, width + 20)
+    assert _width(0) == width + 20
+    assert _width(0) == _fresh_width(0)
+    table.zoom = 2.0
+    assert _width(0) > width + 20
+    assert _width(0) == _fresh_width(0)
@@ -1,4 +1,8 @@
+import numpy as np
+import pandas as pd
+import pytest
 from tabulous import TableViewer
+from tabulous._text_formatter import DefaultFormatter
 
 def test_text_formatter(make_tabulous_viewer):
     viewer: TableViewer = make_tabulous_viewer()
@@ -25,3 +29,56 @@ def test_spreadsheet_default_formatter(make_tabulous_viewer):
     sheet.dtypes.set("number", "float", formatting=True)
     assert sheet.cell.text[0, 0] == "1.2000"
     assert sheet.cell.text[1, 0] == "1.2346"
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [0, 1, -12, 123456, -10**10],
+        [0.0, 1.2, -0.05, 123456.7, np.nan, np.inf],
+        [1 + 2j, 0j, 1e-3 - 1e6j],
+        pd.to_datetime(["2020-01-01 00:00:00.0", "2020-01-01 12:00:00.5", None]),
+        pd.to_timedelta(["1d", "-1.5s", "1ns", None]),
+    ],
+)
+def test_default_format_array(values):
+    sr = pd.Series(values)
+    fmt = DefaultFormatter(sr.dtype)
+    assert list(fmt.format_array(sr)) == [fmt(v) for v in sr.array]
+
+
+class BatchFormatter:
+    def __init__(self):
+        self.nbatch = 0
+
+    def __call__(self, x):
+        return f"<{x}>"
+
+    def format_array(self, values: pd.Series):
+        self.nbatch += 1
+        return "<" + values.astype(str) + ">"
+
+def test_batch_formatter(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"number": [1, 2, 3]})
+    fmt = BatchFormatter()
+    table.text_formatter("number", fmt)
+    assert table.cell.text[0, 0] == "<1>"
+    assert table.cell.text[2, 0] == "<3>"
+    assert fmt.nbatch == 1
+
+def test_batch_formatter_with_na(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"number": pd.array([1, None, 3], dtype="Int64")})
+    table.text_formatter("number", BatchFormatter())
+    assert table.cell.text[0, 0] == "<1>"
+    assert table.cell.text[1, 0] == "NA"
+    assert table.cell.text[2, 0] == "<3>"
+
+def test_spreadsheet_batch_formatter(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    sheet = viewer.add_spreadsheet({"number": ["1.2", "x", "3e8"]})
+    sheet.dtypes.set("number", "float", validation=False, formatting=True)
+    assert sheet.cell.text[0, 0] == "1.2000"
+    assert sheet.cell.text[1, 0] == "<Format Error>"
+    assert sheet.cell.text[2, 0] == "3.00000e+08"
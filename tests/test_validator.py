@@ -45,3 +45,80 @@ def test_validator_on_paste(make_tabulous_viewer):
     with pytest.raises(ValueError):
         viewer.paste_data([(slice(None), slice(None))])
     assert_frame_equal(table.data, df)  # don't change data
+
+def test_all_invalid_cells_are_reported(make_tabulous_viewer):
+    from tabulous.exceptions import CellValueError
+
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table(
+        {"a": [1, 2, 3], "b": [1.0, 2.0, 3.0]},
+        editable=True,
+    )
+
+    @table.validator("a")
+    def _validator(x):
+        if x < 0:
+            raise ValueError("Negative numbers are not allowed")
+
+    data = table.data.copy()
+    with pytest.raises(CellValueError) as exc_info:
+        table.cell[0:3, 0:2] = [["-1", "x"], ["2", "2.5"], ["y", "-3"]]
+    assert list(exc_info.value.errors.keys()) == [(0, 0), (0, 1), (2, 0)]
+    assert_frame_equal(table.data, data)  # don't change data
+
+def test_batch_validator(make_tabulous_viewer):
+    viewer: TableViewer = make_tabulous_viewer()
+    table = viewer.add_table({"a": [1, 2, 3]}, editable=True)
+
+    class Validator:
+        def __init__(self):
+            self.nbatch = 0
+
+        def __call__(self, x):
+            if x < 0:
+                raise ValueError("Negative numbers are not allowed")
+
+        def validate_array(self, values: pd.Series):
+            self.nbatch += 1
+            if (values < 0).any():
+                raise ValueError("Negative numbers are not allowed")
+
+    table.validator["a"] = validator = Validator()
+    table.cell[0:3, 0] = ["4", "5", "6"]
+    assert validator.nbatch == 1
+    assert table.data["a"].tolist() == [4, 5, 6]
+    with pytest.raises(ValueError):
+        table.cell[0:3, 0] = ["7", "-8", "9"]
+    assert validator.nbatch == 2
+    assert table.data["a"].tolist() == [4, 5, 6]
+
+@pytest.mark.parametrize(
+    "dtype, values",
+    [
+        ("int64", ["1", " 2", 3.0, True, "1.5", None, "nan"]),
+        ("int32", ["1", 2, 3]),
+        ("float64", ["1", " 2.5", 3, "nan", "NA", "", None, "1e3", "x"]),
+        ("complex128", ["1+2j", 3, "nan", "y"]),
+        ("bool", ["True", "0", 1, "x"]),
+        ("datetime64[ns]", ["2020-01-01", "2020/01/02 12:00", ""]),
+        ("timedelta64[ns]", ["1 day", "00:00:01"]),
+    ],
+)
+def test_array_converter(dtype, values):
+    from tabulous._dtype import get_converter, get_array_converter, convert_array
+
+    converter = get_converter(dtype)
+    out, errors = convert_array(
+        pd.Series(values, dtype=object), get_array_converter(dtype), converter
+    )
+    for i, val in enumerate(values):
+        try:
+            expected = converter(val)
+        except Exception:
+            assert i in errors
+        else:
+            assert i not in errors
+            if pd.isna(expected):
+                assert pd.isna(out[i])
+            else:
+                assert out[i] == expected